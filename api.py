@@ -0,0 +1,167 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Library API
+Update: October 17, 2026
+
+Preliminary design of a centrifugal compressor from objects alone: the
+inputs, solver settings and working fluid are passed in and the design is
+returned. Nothing here reads or writes files, exits the process or
+configures logging, the modules only log through their own loggers and
+the application embedding ccpd decides where those records go.
+
+Given a WorkingFluid the design does not touch the fluid database at all.
+Given a fluid name the database is read once per process on first use, see
+DefaultFluidRegistry.
+
+main is the command line front end, it reads the inputs and settings from
+their JSON files and reports the design status.
+"""
+
+from ccpd.data_types.inputs import DesignInputs, DesignParametersII, InputsII
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.solver_status import ConvergenceReport
+from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.centrifugal_calcs import CreateStageGraph, centrifugal_calcs
+from ccpd.utilities.fixed_point import CreateAccelerator
+from ccpd.utilities.time_budget import OutOfTime, RemainingTime, TimeBudget
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def CreateInputsII(design_inputs: DesignInputs) -> InputsII:
+    return InputsII(
+        mass_flow_rate=design_inputs.mass_flow_rate,
+        inlet_total_temperature=design_inputs.inlet_total_temperature,
+        inlet_total_pressure=design_inputs.inlet_total_pressure,
+        compression_ratio=design_inputs.compression_ratio,
+        surface_roughness=design_inputs.surface_roughness,
+        tip_clearance=design_inputs.tip_clearance,
+        hub_diameter=design_inputs.hub_diameter,
+        outlet_angle_guess=design_inputs.outlet_angle_guess,
+    )
+
+
+def preliminary_design(
+    design_parameters: DesignParametersII,
+    inputs: InputsII,
+    settings: SolverSettings,
+    budget: float = None,
+    working_fluid: WorkingFluid = None,
+) -> CentrifugalCompressor:
+    """
+    Runs the centrifugal_calcs function for a specified number of
+     iterations or until convergence is reached, taking the final end to
+     end efficiency as the new guess value to calculate the Eulerian work
+     for the centrifugal compressor. The design parameters may also be
+     given as DesignInputs. Given a working fluid it is used instead of
+     the fluid of the design parameters and no file is read.
+
+    With a budget, in seconds of wall clock time, the loops spend it as
+     follows: once the time left does not cover another pass at the pace
+     of the passes so far, the stage loops run at the loosest tolerance of
+     the tolerance schedule, and once it is spent every loop stops after
+     its current iteration. The design is then flagged as approximate, see
+     CentrifugalCompressor.approximate, and the convergence reports hold
+     the residual of each loop. The newton solver does not use the budget,
+     its iterations and tolerance are those of the main loop settings.
+    """
+    if budget is not None:
+        with TimeBudget(budget):
+            return preliminary_design(design_parameters, inputs, settings, working_fluid=working_fluid)
+
+    if settings.solver == "newton":
+        # The newton solver runs on the batch engine, which designs that use
+        #   the nested loops never import
+        from ccpd.utilities.newton_solver import newton_design
+
+        return newton_design(
+            design_parameters.specific_diameter,
+            design_parameters.specific_rotational_speed,
+            design_parameters.end_to_end_efficiency,
+            design_parameters.fluid,
+            design_parameters.material,
+            inputs,
+            max_iterations=settings.main.max_iterations,
+            tolerance=settings.main.tolerance,
+            working_fluid=working_fluid,
+            gas_model=settings.gas_model,
+            equation_of_state=settings.equation_of_state,
+            friction_method=settings.friction_method,
+        )
+
+    # [B] Set Loop Parameters
+    max_iterations = settings.main.max_iterations
+    tolerance = settings.main.tolerance
+    accelerator = CreateAccelerator(settings.acceleration)
+    stage_graph = CreateStageGraph()
+
+    # [C]:Run Analysis
+    design = CentrifugalCompressor()
+    end_to_end_efficiency = design_parameters.end_to_end_efficiency
+    residual = float("inf")
+    approximate = False
+    best_design, best_residual = design, residual
+    start_time = time.perf_counter()
+    for iteration in range(0, max_iterations):
+        iteration += 1
+        inner_tolerance = settings.InnerTolerance(residual)
+        if iteration > 1 and RemainingTime() < (time.perf_counter() - start_time) / (iteration - 1):
+            inner_tolerance = max(inner_tolerance, settings.tolerance_schedule.loosest_tolerance)
+            approximate = True
+        logger.info(f"Main Iteration: {iteration}, inner tolerance: {inner_tolerance:.3}")
+        CheckCancelled()
+
+        # [D]:Run Centrifugal Preliminary Design Calculations
+        design = centrifugal_calcs(
+            design_parameters.specific_diameter,
+            design_parameters.specific_rotational_speed,
+            end_to_end_efficiency,
+            design_parameters.fluid if working_fluid is None else working_fluid,
+            design_parameters.material,
+            inputs,
+            settings,
+            inner_tolerance,
+            stage_graph,
+        )
+
+        # [E]:Calculate Residual & Check Convergence
+        residual = abs(end_to_end_efficiency - design.total_efficiency) / design.total_efficiency
+        logger.info(f"Main Residual: {residual:.6}\n")
+        if residual <= best_residual:
+            best_design, best_residual = design, residual
+        if residual < tolerance and settings.IsExact(inner_tolerance):
+            logger.info(f"Main converged in {iteration} iterations")
+            break
+        elif OutOfTime():
+            # The last pass is not necessarily the closest one to convergence
+            logger.warning(f"Main loop stopped after {iteration} iterations, time budget exhausted")
+            design, residual = best_design, best_residual
+            approximate = True
+            break
+        elif iteration == max_iterations:
+            logger.warning("Max iterations reached")
+
+        # [F]:Reset Efficiency & Iterate
+        end_to_end_efficiency = accelerator(end_to_end_efficiency, design.total_efficiency)
+
+    design.convergence = ConvergenceReport.FromResidual(iteration, residual, tolerance, approximate=approximate)
+    return design
+
+
+def design(
+    design_inputs: DesignInputs,
+    working_fluid: WorkingFluid,
+    settings: SolverSettings = SolverSettings(),
+    budget: float = None,
+) -> CentrifugalCompressor:
+    """
+    Preliminary design of the inputs with the given working fluid, see
+    preliminary_design. The fluid name of the inputs is not looked up.
+    """
+    assert isinstance(working_fluid, WorkingFluid), f"[Error]: Expected a WorkingFluid, got {type(working_fluid)}"
+    return preliminary_design(design_inputs, CreateInputsII(design_inputs), settings, budget, working_fluid)
@@ -0,0 +1,94 @@
+"""
+Author: Alejandro Valencia
+Asynchronous Design API
+Update: October 17, 2026
+
+Coroutines that run the preliminary design of main without blocking the
+event loop. The design runs on an executor, the default executor of the
+event loop unless one is given; a ProcessPoolExecutor runs it in another
+process.
+
+Cancelling the coroutine, directly or through a timeout, cancels the
+design: every solver loop checks a cancellation token once per iteration,
+see cancellation, so a running design stops within one loop iteration and
+its executor is free again. A design that did not start yet is never run.
+
+design_many runs many designs as asyncio.gather does, with at most
+max_concurrency of them submitted to the executor at a time.
+"""
+
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.inputs import DesignInputs
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.utilities.cancellation import CancellationToken
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable
+import asyncio
+import multiprocessing
+import threading
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def _CreateEvent(executor: Executor):
+    """
+    Event the design can read from the executor
+    """
+    global _manager
+    if not isinstance(executor, ProcessPoolExecutor):
+        return threading.Event()
+    with _manager_lock:
+        if _manager is None:
+            _manager = multiprocessing.Manager()
+    return _manager.Event()
+
+
+def _RunDesign(design_inputs: DesignInputs, settings: SolverSettings, event) -> CentrifugalCompressor:
+    with CancellationToken(event):
+        return preliminary_design(design_inputs, CreateInputsII(design_inputs), settings)
+
+
+async def design(
+    design_inputs: DesignInputs,
+    settings: SolverSettings = SolverSettings(),
+    executor: Executor = None,
+    timeout: float = None,
+) -> CentrifugalCompressor:
+    """
+    Runs the preliminary design of the inputs on the executor. Raises
+    asyncio.TimeoutError when the design takes longer than the timeout, in
+    seconds, and cancels it.
+    """
+    loop = asyncio.get_running_loop()
+    event = _CreateEvent(executor)
+    future = loop.run_in_executor(executor, _RunDesign, design_inputs, settings, event)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        event.set()
+        raise
+
+
+async def design_many(
+    design_inputs: Iterable[DesignInputs],
+    settings: SolverSettings = SolverSettings(),
+    executor: Executor = None,
+    timeout: float = None,
+    max_concurrency: int = None,
+    return_exceptions: bool = False,
+) -> list:
+    """
+    Runs the design of every inputs, in order, with at most max_concurrency
+    designs running at a time. The timeout applies to each design.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def Limited(item: DesignInputs) -> CentrifugalCompressor:
+        if semaphore is None:
+            return await design(item, settings, executor, timeout)
+        async with semaphore:
+            return await design(item, settings, executor, timeout)
+
+    return await asyncio.gather(*(Limited(item) for item in design_inputs), return_exceptions=return_exceptions)
@@ -0,0 +1,241 @@
+"""
+Author: Alejandro Valencia
+Streaming Batch Designs
+Update: October 17, 2026
+
+Runs the preliminary design of every row of a design catalog, read as JSON
+lines or CSV from a file or stdin, and writes one result row per design to
+a file or stdout. A row holds the fields of DesignInputs, as the keys of a
+JSON object or the columns named by the CSV header:
+
+    {"mass_flow_rate": 1.5, ..., "fluid": "hydrogen", "material": "aluminum"}
+
+The catalog is read chunk_size rows at a time straight into one NumPy
+column per field, without building DesignInputs objects. Each chunk is
+designed through the batch engine, one batch per fluid and material, and
+its results are written before the next chunk is read, so the memory used
+does not grow with the size of the catalog.
+
+Every result row holds the position of its design row in the catalog,
+counting from zero, the status of the design and every field of the design
+by its dotted path, see COMPRESSOR_FIELDS. In JSON lines the result rows
+are laid out as the responses of the design server:
+
+    {"row": 7, "status": "CONVERGED", "design": {"total_efficiency": 0.83, ...}}
+
+Run as python -m ccpd.main batch [INPUT] [--output OUTPUT]
+[--input-format {jsonl,csv}] [--output-format {jsonl,csv}]
+[--chunk-size SIZE] [--settings SETTINGS]. The formats default to the one
+of the file extension, and to JSON lines for stdin and stdout. The solver
+settings default to ccpd/solver_settings.json, as for a single design.
+"""
+
+from ccpd.data_types.inputs import DesignInputs, InputsII
+from ccpd.data_types.solver_settings import LoadSolverSettings, SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.utilities.batch_centrifugal_calcs import COMPRESSOR_FIELDS, BatchResults, batch_preliminary_design
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from typing import Iterator, TextIO
+import argparse
+import attrs
+import csv
+import itertools
+import json
+import logging
+import numpy as np
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+DESIGN_COLUMNS = [item.name for item in attrs.fields(DesignInputs)]
+TEXT_COLUMNS = ["fluid", "material"]
+NUMERIC_COLUMNS = [name for name in DESIGN_COLUMNS if name not in TEXT_COLUMNS]
+FORMATS = ("jsonl", "csv")
+
+_STATUS_NAMES = np.array([status.name for status in SolverStatus])
+
+
+def _Columns(values: list, number_of_rows: int) -> dict:
+    """
+    Design columns of a chunk from the values of each column, in
+    DESIGN_COLUMNS order
+    """
+    columns = {}
+    for name, column in zip(DESIGN_COLUMNS, values):
+        if name in TEXT_COLUMNS:
+            columns[name] = np.array(column, dtype=object)
+        else:
+            columns[name] = np.fromiter(column, dtype=float, count=number_of_rows)
+    return columns
+
+
+def _JsonlChunks(stream: TextIO, chunk_size: int) -> Iterator[dict]:
+    lines = (line for line in stream if line.strip())
+    for number, chunk in enumerate(iter(lambda: list(itertools.islice(lines, chunk_size)), [])):
+        try:
+            rows = [json.loads(line) for line in chunk]
+            values = [[row[name] for row in rows] for name in DESIGN_COLUMNS]
+        except (ValueError, TypeError, KeyError) as error:
+            raise ValueError(f"[Error]: Invalid design row in chunk {number}: {error!r}") from error
+        yield _Columns(values, len(chunk))
+
+
+def _CsvChunks(stream: TextIO, chunk_size: int) -> Iterator[dict]:
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [name.strip() for name in header]
+    missing = [name for name in DESIGN_COLUMNS if name not in header]
+    assert not missing, f"[Error]: The CSV header is missing the columns {missing}"
+    positions = [header.index(name) for name in DESIGN_COLUMNS]
+
+    rows = (row for row in reader if row)
+    for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+        # Transposing the chunk turns each column into one tuple of strings
+        #   that NumPy parses in a single pass
+        transposed = list(zip(*chunk))
+        yield _Columns([transposed[position] for position in positions], len(chunk))
+
+
+def ReadChunks(stream: TextIO, input_format: str = "jsonl", chunk_size: int = 4096) -> Iterator[dict]:
+    """
+    Reads the design rows of a stream, chunk_size rows at a time, as one
+    array per column of DESIGN_COLUMNS
+    """
+    assert input_format in FORMATS, f"[Error]: Unknown input format {input_format}, expected one of {FORMATS}"
+    assert chunk_size > 0, f"[Error]: The chunk size must be positive"
+    if input_format == "csv":
+        return _CsvChunks(stream, chunk_size)
+    return _JsonlChunks(stream, chunk_size)
+
+
+def EvaluateChunk(columns: dict, settings: SolverSettings = SolverSettings()) -> BatchResults:
+    """
+    Designs every row of a chunk, one batch per fluid and material
+    """
+    number_of_rows = len(columns["fluid"])
+    result = BatchResults(
+        columns={path: np.zeros(number_of_rows) for path in COMPRESSOR_FIELDS},
+        status=np.zeros(number_of_rows, dtype=np.int8),
+    )
+    fluids, fluid_index = np.unique(columns["fluid"].astype(str), return_inverse=True)
+    materials, material_index = np.unique(columns["material"].astype(str), return_inverse=True)
+    group_index = fluid_index * len(materials) + material_index
+    for group in np.unique(group_index):
+        lanes = np.flatnonzero(group_index == group)
+        fluid, material = fluids[group // len(materials)], materials[group % len(materials)]
+        group_result = batch_preliminary_design(
+            columns["specific_diameter"][lanes],
+            columns["specific_rotational_speed"][lanes],
+            columns["end_to_end_efficiency"][lanes],
+            fluid,
+            material,
+            InputsII(**{item.name: columns[item.name][lanes] for item in attrs.fields(InputsII)}),
+            settings,
+            working_fluid=LoadWorkingFluid(fluid),
+        )
+        for path in COMPRESSOR_FIELDS:
+            result.columns[path][lanes] = group_result.columns[path]
+        result.status[lanes] = group_result.status
+    return result
+
+
+def _WriteJsonl(stream: TextIO, first_row: int, result: BatchResults, header: bool) -> None:
+    columns = [result.columns[path].tolist() for path in COMPRESSOR_FIELDS]
+    statuses = _STATUS_NAMES[result.status].tolist()
+    for index, values in enumerate(zip(*columns)):
+        response = {"row": first_row + index, "status": statuses[index], "design": dict(zip(COMPRESSOR_FIELDS, values))}
+        stream.write(json.dumps(response) + "\n")
+
+
+def _WriteCsv(stream: TextIO, first_row: int, result: BatchResults, header: bool) -> None:
+    writer = csv.writer(stream, lineterminator="\n")
+    if header:
+        writer.writerow(["row", "status"] + COMPRESSOR_FIELDS)
+    writer.writerows(
+        zip(
+            range(first_row, first_row + len(result)),
+            _STATUS_NAMES[result.status].tolist(),
+            *[result.columns[path].tolist() for path in COMPRESSOR_FIELDS],
+        )
+    )
+
+
+def run_batch(
+    input_stream: TextIO,
+    output_stream: TextIO,
+    input_format: str = "jsonl",
+    output_format: str = "jsonl",
+    chunk_size: int = 4096,
+    settings: SolverSettings = SolverSettings(),
+    progress=None,
+) -> int:
+    """
+    Designs every row of the input stream and writes the result rows to
+    the output stream, one chunk at a time. Returns the number of designs.
+
+        progress: Optional callable called as progress(completed,
+            designs_per_second) every time a chunk was written
+    """
+    assert output_format in FORMATS, f"[Error]: Unknown output format {output_format}, expected one of {FORMATS}"
+    write = _WriteCsv if output_format == "csv" else _WriteJsonl
+    start_time = time.perf_counter()
+    completed = 0
+    for columns in ReadChunks(input_stream, input_format, chunk_size):
+        result = EvaluateChunk(columns, settings)
+        write(output_stream, completed, result, header=completed == 0)
+        output_stream.flush()
+
+        completed += len(result)
+        rate = completed / max(time.perf_counter() - start_time, 1e-9)
+        logger.info(f"Batch progress: {completed} designs ({rate:0.1f} designs/s)")
+        if progress is not None:
+            progress(completed, rate)
+    return completed
+
+
+def _Format(path: str, given: str) -> str:
+    if given is not None:
+        return given
+    extension = os.path.splitext(path or "")[1].lstrip(".").lower()
+    return "csv" if extension == "csv" else "jsonl"
+
+
+def AddArguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("input", nargs="?", default=None, help="Design catalog, stdin by default")
+    parser.add_argument("--output", default=None, help="Result file, stdout by default")
+    parser.add_argument("--input-format", choices=FORMATS, default=None)
+    parser.add_argument("--output-format", choices=FORMATS, default=None)
+    parser.add_argument("--chunk-size", type=int, default=4096, help="Design rows read and designed at a time")
+    parser.add_argument(
+        "--settings", default=None, help="Solver settings JSON file, ccpd/solver_settings.json by default"
+    )
+
+
+def RunCommand(arguments: argparse.Namespace) -> int:
+    if arguments.settings is None:
+        settings = LoadSolverSettings()
+    else:
+        with open(arguments.settings, "r") as settings_file:
+            settings = SolverSettings(**json.load(settings_file))
+
+    input_stream = sys.stdin if arguments.input in (None, "-") else open(arguments.input, "r", newline="")
+    output_stream = sys.stdout if arguments.output in (None, "-") else open(arguments.output, "w", newline="")
+    try:
+        count = run_batch(
+            input_stream,
+            output_stream,
+            _Format(arguments.input, arguments.input_format),
+            _Format(arguments.output, arguments.output_format),
+            arguments.chunk_size,
+            settings,
+        )
+    finally:
+        for stream in (input_stream, output_stream):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+    print(f"[ccpd]: designed {count} rows", file=sys.stderr)
+    return count
@@ -4,21 +4,39 @@ Update: 30 April, 2023
 """
 
 
+from ccpd.data_types.solver_status import ConvergenceReport, SolverStatus
 from ccpd.data_types.thermo_point import ThermoPoint
 from ccpd.data_types.three_dimensional_blade import ThreeDimensionalBlade
 from ccpd.data_types.centrifugal_compressor_geometry import CompressorGeometry
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 
+# Field names of every data type met by _CopyTree, None for immutable values
+_FIELD_NAMES = {}
 
-@dataclass
+
+def _CopyTree(node):
+    kind = type(node)
+    if kind not in _FIELD_NAMES:
+        _FIELD_NAMES[kind] = [item.name for item in fields(kind)] if is_dataclass(kind) else None
+    names = _FIELD_NAMES[kind]
+    if names is None:
+        return node
+    copied = object.__new__(kind)
+    for name in names:
+        object.__setattr__(copied, name, _CopyTree(getattr(node, name)))
+    return copied
+
+
+@dataclass(slots=True)
 class CompressorStage:
     """
     Compressor stage class data type
     """
 
-    _thermodynamic_point: ThermoPoint = field(default_factory=lambda: ThermoPoint())
-    _blade: ThreeDimensionalBlade = field(default_factory=lambda: ThreeDimensionalBlade())
+    _thermodynamic_point: ThermoPoint = field(default_factory=ThermoPoint)
+    _blade: ThreeDimensionalBlade = field(default_factory=ThreeDimensionalBlade)
     _flow_area: float = 0.0
+    _convergence: ConvergenceReport = field(default_factory=ConvergenceReport)
 
     @property
     def thermodynamic_point(self) -> ThermoPoint:
@@ -32,6 +50,21 @@ class CompressorStage:
     def flow_area(self) -> float:
         return self._flow_area
 
+    @property
+    def convergence(self) -> ConvergenceReport:
+        return self._convergence
+
+    @convergence.setter
+    def convergence(self, value) -> None:
+        self._convergence = value
+
+    def Copy(self) -> "CompressorStage":
+        """
+        Copy of the stage and of every data type in it, as copy.deepcopy
+        but much faster
+        """
+        return _CopyTree(self)
+
 
 @dataclass
 class CentrifugalCompressor:
@@ -53,10 +86,31 @@ class CentrifugalCompressor:
     stage_loading: float = 0.0
     flow_coefficient: float = 0.0
     blade_orientation_ratio: float = 0.0
+    convergence: ConvergenceReport = field(default_factory=lambda: ConvergenceReport())
+
+    inlet: CompressorStage = field(default_factory=CompressorStage)
+    outlet: CompressorStage = field(default_factory=CompressorStage)
+    vaneless_diffuser: CompressorStage = field(default_factory=CompressorStage)
+    diffuser: CompressorStage = field(default_factory=CompressorStage)
 
-    inlet: CompressorStage = CompressorStage()
-    outlet: CompressorStage = CompressorStage()
-    vaneless_diffuser: CompressorStage = CompressorStage()
-    diffuser: CompressorStage = CompressorStage()
+    geometry: CompressorGeometry = field(default_factory=CompressorGeometry)
+
+    @property
+    def status(self) -> SolverStatus:
+        """
+        Most severe status of the efficiency loop and the stage loops
+        """
+        stages = [self.inlet, self.outlet, self.vaneless_diffuser, self.diffuser]
+        return max([self.convergence.status] + [stage.convergence.status for stage in stages])
 
-    geometry = CompressorGeometry()
+    @property
+    def converged(self) -> bool:
+        return self.status == SolverStatus.CONVERGED
+
+    @property
+    def approximate(self) -> bool:
+        """
+        Whether any loop cut its work short to stay within a time budget
+        """
+        stages = [self.inlet, self.outlet, self.vaneless_diffuser, self.diffuser]
+        return self.convergence.approximate or any(stage.convergence.approximate for stage in stages)
@@ -0,0 +1,184 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Compressor Batch
+Update: October 17, 2026
+
+Struct of arrays counterpart of CentrifugalCompressor for many designs.
+Every scalar leaf of the CentrifugalCompressor tree, see COMPRESSOR_FIELDS,
+is one contiguous row of a single (fields, designs) array, reached by the
+same attribute path as in the object tree:
+
+    batch.inlet.blade.tip.relative.magnitude    array, one entry per design
+    batch[3]                                    CentrifugalCompressor of design 3
+    batch[10:20]                                CompressorBatch of 10 designs
+
+Paths and slices are views of the batch, nothing is copied. A single design
+is built as a new object tree when asked for, changing it leaves the batch
+as it was. Iteration counts, statuses and flags are stored as floats and
+converted back when a design is built.
+"""
+
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.solver_status import SolverStatus
+from dataclasses import fields, is_dataclass
+import attrs
+import numpy as np
+import operator
+
+
+def _LeafPaths(node, prefix: str = "") -> list[str]:
+    """
+    Returns the dotted public path of every scalar leaf of a data type tree
+    """
+    if is_dataclass(node):
+        names = [item.name for item in fields(node)]
+    elif attrs.has(type(node)):
+        names = [item.name for item in attrs.fields(type(node))]
+    else:
+        return [prefix]
+
+    paths = []
+    for name in names:
+        public_name = name.lstrip("_")
+        paths += _LeafPaths(getattr(node, public_name), f"{prefix}{public_name}.")
+    return [path.rstrip(".") for path in paths]
+
+
+COMPRESSOR_FIELDS = _LeafPaths(CentrifugalCompressor())
+FIELD_INDEX = {path: row for row, path in enumerate(COMPRESSOR_FIELDS)}
+STATUS_FIELDS = [path for path in COMPRESSOR_FIELDS if path.endswith("convergence.status")]
+
+# Inner nodes of the tree, e.g. "inlet.blade"
+_BRANCHES = {path.rsplit(".", n)[0] for path in COMPRESSOR_FIELDS for n in range(1, path.count(".") + 1)}
+
+
+def _Setters() -> tuple[list[str], list[tuple]]:
+    # Parent of every leaf, the attribute that holds it and the type it is
+    #   converted to, None for floats
+    compressor = CentrifugalCompressor()
+    parents = sorted({path.rpartition(".")[0] for path in COMPRESSOR_FIELDS} - {""})
+    setters = []
+    for path in COMPRESSOR_FIELDS:
+        parent, _, name = path.rpartition(".")
+        node = operator.attrgetter(parent)(compressor) if parent else compressor
+        if hasattr(node, f"_{name}"):
+            name = f"_{name}"
+        kind = type(getattr(node, name))
+        setters.append((parent, name, None if kind is float else kind))
+    return parents, setters
+
+
+_PARENTS, _SETTERS = _Setters()
+_GET_LEAVES = operator.attrgetter(*COMPRESSOR_FIELDS)
+
+
+def BuildCompressor(values) -> CentrifugalCompressor:
+    """
+    CentrifugalCompressor with the given leaf values, in the order of
+    COMPRESSOR_FIELDS
+    """
+    compressor = CentrifugalCompressor()
+    nodes = {"": compressor}
+    for parent in _PARENTS:
+        nodes[parent] = operator.attrgetter(parent)(compressor)
+    for (parent, name, kind), value in zip(_SETTERS, values):
+        setattr(nodes[parent], name, value if kind is None else kind(value))
+    return compressor
+
+
+class _Branch:
+    """
+    Inner node of the CentrifugalCompressor tree in a batch
+    """
+
+    __slots__ = ("_batch", "_path")
+
+    def __init__(self, batch: "CompressorBatch", path: str) -> None:
+        self._batch = batch
+        self._path = path
+
+    def __getattr__(self, name: str):
+        return self._batch.Column(f"{self._path}.{name}")
+
+    def __dir__(self) -> list[str]:
+        prefix = f"{self._path}."
+        return sorted({path[len(prefix) :].split(".")[0] for path in COMPRESSOR_FIELDS if path.startswith(prefix)})
+
+
+class CompressorBatch:
+    """
+    Batch of centrifugal compressor designs, see the module description
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        assert values.shape[:1] == (
+            len(COMPRESSOR_FIELDS),
+        ), f"[Error]: A compressor batch needs one row per field, {len(COMPRESSOR_FIELDS)} rows"
+        self.values = values
+
+    @classmethod
+    def Zeros(cls, number_of_designs: int) -> "CompressorBatch":
+        return cls(np.zeros((len(COMPRESSOR_FIELDS), number_of_designs)))
+
+    @classmethod
+    def FromColumns(cls, columns: dict) -> "CompressorBatch":
+        """
+        Batch of the columns of every field keyed by its dotted path, as in
+        BatchResults
+        """
+        return cls(np.stack([columns[path] for path in COMPRESSOR_FIELDS]))
+
+    @classmethod
+    def FromCompressors(cls, compressors: list[CentrifugalCompressor]) -> "CompressorBatch":
+        values = np.array([_GET_LEAVES(compressor) for compressor in compressors], dtype=float)
+        return cls(np.ascontiguousarray(values.reshape(len(compressors), len(COMPRESSOR_FIELDS)).T))
+
+    def ToCompressors(self) -> list[CentrifugalCompressor]:
+        return [BuildCompressor(values) for values in self.values.T.tolist()]
+
+    def Column(self, path: str):
+        """
+        Array of the given leaf, or the batch node of the given branch
+        """
+        if path in FIELD_INDEX:
+            return self.values[FIELD_INDEX[path]]
+        if path in _BRANCHES:
+            return _Branch(self, path)
+        raise AttributeError(f"[Error]: Unknown compressor field {path}")
+
+    @property
+    def columns(self) -> dict:
+        return {path: self.values[row] for row, path in enumerate(COMPRESSOR_FIELDS)}
+
+    @property
+    def status(self) -> np.ndarray:
+        """
+        Most severe status of the loops of each design, as in
+        CentrifugalCompressor.status
+        """
+        return np.max(self.values[[FIELD_INDEX[path] for path in STATUS_FIELDS]], axis=0).astype(np.int8)
+
+    @property
+    def converged(self) -> np.ndarray:
+        return self.status == SolverStatus.CONVERGED
+
+    def __getattr__(self, name: str):
+        return self.Column(name)
+
+    def __dir__(self) -> list[str]:
+        return sorted(set(super().__dir__()) | {path.split(".")[0] for path in COMPRESSOR_FIELDS})
+
+    def __len__(self) -> int:
+        return self.values.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return BuildCompressor(self.values[:, index].tolist())
+        return CompressorBatch(self.values[:, index])
+
+    def __iter__(self):
+        return iter(self.ToCompressors())
@@ -0,0 +1,144 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+
+Solver settings of the preliminary design, loaded from
+ccpd/solver_settings.json by main, the batch command and the design server,
+see LoadSolverSettings.
+
+The end to end efficiency loop of main ("main") runs the inlet, outlet and
+vaneless diffuser loops on every iteration. With the tolerance schedule
+enabled the three inner loops are solved inexactly while the efficiency
+loop is still far from converging: the tolerance requested from them is
+
+    min(loosest_tolerance, forcing * outer residual)
+
+and each inner loop uses the larger of this and its own tolerance. The
+efficiency loop only converges on a pass solved with the inner loops at
+their own tolerances, so the final design is the one of the exact solve.
+In batch_preliminary_design the inexact passes also start the inner loops
+from the solution of the previous pass, exact passes start them cold.
+
+The gas model selects constant or temperature dependent fluid properties,
+see gas_properties, and the equation of state the ideal gas law or a real
+gas one, see real_gas.
+"""
+
+from ccpd.stages.outlet.friction_coefficient import DEFAULT_FRICTION_METHOD, FRICTION_METHODS
+from ccpd.utilities.fixed_point import ACCELERATION_METHODS, DEFAULT_ACCELERATION
+from ccpd.utilities.gas_properties import DEFAULT_GAS_MODEL, GAS_MODELS
+from ccpd.utilities.real_gas import DEFAULT_EQUATION_OF_STATE, EQUATIONS_OF_STATE
+from attrs import frozen, field
+import json
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SOLVERS = ("nested", "newton")
+
+# Settings file of the command line and the design server, relative to the
+#   directory holding ccpd
+SOLVER_SETTINGS_PATH = "ccpd/solver_settings.json"
+
+
+@frozen
+class LoopSettings:
+    max_iterations: int = field(converter=int)
+    tolerance: float = field(converter=float)
+
+    @max_iterations.validator
+    def _CheckMaxIterations(self, attribute, value) -> None:
+        assert value >= 1, f"[Error]: A loop needs at least one iteration, got {value}"
+
+    @tolerance.validator
+    def _CheckTolerance(self, attribute, value) -> None:
+        assert value > 0.0, f"[Error]: A loop needs a positive tolerance, got {value}"
+
+
+def _ToLoopSettings(value) -> LoopSettings:
+    return LoopSettings(**value) if isinstance(value, dict) else value
+
+
+@frozen
+class ToleranceSchedule:
+    enabled: bool = False
+    loosest_tolerance: float = field(default=1e-1, converter=float)
+    forcing: float = field(default=1e-1, converter=float)
+
+
+def _ToToleranceSchedule(value) -> ToleranceSchedule:
+    return ToleranceSchedule(**value) if isinstance(value, dict) else value
+
+
+@frozen
+class SolverSettings:
+    """
+    Solver settings, every entry has the default used when it is missing
+    from the configuration
+    """
+
+    main: LoopSettings = field(default=LoopSettings(50, 1e-5), converter=_ToLoopSettings)
+    inlet: LoopSettings = field(default=LoopSettings(1000, 1e-3), converter=_ToLoopSettings)
+    outlet: LoopSettings = field(default=LoopSettings(50, 1e-3), converter=_ToLoopSettings)
+    vaneless_diffuser: LoopSettings = field(default=LoopSettings(100, 1e-3), converter=_ToLoopSettings)
+    acceleration: str = field(default=DEFAULT_ACCELERATION)
+    friction_method: str = field(default=DEFAULT_FRICTION_METHOD)
+    solver: str = field(default="nested")
+    tolerance_schedule: ToleranceSchedule = field(default=ToleranceSchedule(), converter=_ToToleranceSchedule)
+    gas_model: str = field(default=DEFAULT_GAS_MODEL)
+    equation_of_state: str = field(default=DEFAULT_EQUATION_OF_STATE)
+
+    @acceleration.validator
+    def _CheckAcceleration(self, attribute, value) -> None:
+        assert value in ACCELERATION_METHODS, f"[Error]: Unknown acceleration method {value}"
+
+    @friction_method.validator
+    def _CheckFrictionMethod(self, attribute, value) -> None:
+        assert value in FRICTION_METHODS, f"[Error]: Unknown friction method {value}, use one of {FRICTION_METHODS}"
+
+    @solver.validator
+    def _CheckSolver(self, attribute, value) -> None:
+        assert value in SOLVERS, f"[Error]: Unknown solver {value}, use one of {SOLVERS}"
+
+    @gas_model.validator
+    def _CheckGasModel(self, attribute, value) -> None:
+        assert value in GAS_MODELS, f"[Error]: Unknown gas model {value}, use one of {GAS_MODELS}"
+
+    @equation_of_state.validator
+    def _CheckEquationOfState(self, attribute, value) -> None:
+        assert (
+            value in EQUATIONS_OF_STATE
+        ), f"[Error]: Unknown equation of state {value}, use one of {EQUATIONS_OF_STATE}"
+
+    def InnerTolerance(self, outer_residual):
+        """
+        Tolerance requested from the inner loops given the last residual of
+        the efficiency loop, zero when the schedule is disabled. Works on
+        scalars and on arrays of residuals.
+        """
+        if not self.tolerance_schedule.enabled:
+            return np.zeros_like(outer_residual, dtype=float) if np.ndim(outer_residual) else 0.0
+        return np.minimum(
+            self.tolerance_schedule.loosest_tolerance, self.tolerance_schedule.forcing * np.asarray(outer_residual)
+        )
+
+    def IsExact(self, inner_tolerance):
+        """
+        Whether inner loops run with the given tolerance are solved to their
+        own tolerances
+        """
+        return inner_tolerance <= min(self.inlet.tolerance, self.outlet.tolerance, self.vaneless_diffuser.tolerance)
+
+
+def LoadSolverSettings(path: str = SOLVER_SETTINGS_PATH) -> SolverSettings:
+    """
+    Solver settings of a settings file, the default settings when the file
+    can not be read
+    """
+    try:
+        with open(path, "r") as settings_file:
+            return SolverSettings(**json.load(settings_file))
+    except IOError as io_error:
+        logger.warning(f"{io_error}, using the default solver settings")
+        return SolverSettings()
@@ -0,0 +1,50 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class SolverStatus(IntEnum):
+    """
+    Exit status of an iterative solver loop. The values are ordered by
+    severity so the status of a whole design is the maximum of the status
+    of each of its loops.
+    """
+
+    CONVERGED = 0
+    MAX_ITERATIONS = 1
+    DIVERGED = 2
+
+
+@dataclass
+class ConvergenceReport:
+    """
+    Iteration count, final residual and exit status of a solver loop. A loop
+    is approximate when it stopped early or loosened its tolerance to stay
+    within a time budget, see time_budget.
+    """
+
+    iterations: int = 0
+    residual: float = 0.0
+    status: SolverStatus = SolverStatus.CONVERGED
+    approximate: bool = False
+
+    @classmethod
+    def FromResidual(
+        cls,
+        iterations: int,
+        residual: float,
+        tolerance: float,
+        divergence_threshold: float = 1e6,
+        approximate: bool = False,
+    ):
+        if residual < tolerance:
+            status = SolverStatus.CONVERGED
+        elif not residual <= divergence_threshold:
+            status = SolverStatus.DIVERGED
+        else:
+            status = SolverStatus.MAX_ITERATIONS
+        return cls(iterations, float(residual), status, approximate)
@@ -0,0 +1,80 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.compressor_batch import COMPRESSOR_FIELDS, CompressorBatch
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+
+
+def Leaves(compressor) -> list:
+    leaves = []
+    for path in COMPRESSOR_FIELDS:
+        node = compressor
+        for name in path.split("."):
+            node = getattr(node, name)
+        leaves.append(node)
+    return leaves
+
+
+class TestCompressorBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.designs = [
+            preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+            for design_inputs in [CreateDesignInputs(3.4, "air"), CreateDesignInputs(3.8, "air")]
+        ]
+
+    def test_given_compressors_expect_same_compressors_back(self):
+        # Call
+        batch = CompressorBatch.FromCompressors(self.designs)
+        compressors = batch.ToCompressors()
+
+        # Expect
+        self.assertEqual(len(batch), 2)
+        for compressor, design in zip(compressors, self.designs):
+            self.assertEqual(Leaves(compressor), Leaves(design))
+            self.assertEqual(compressor.status, design.status)
+            self.assertIsNot(compressor.inlet, design.inlet)
+
+    def test_given_leaf_path_expect_contiguous_column_view(self):
+        # Given
+        batch = CompressorBatch.FromCompressors(self.designs)
+
+        # Call
+        column = batch.inlet.blade.tip.relative.magnitude
+
+        # Expect
+        self.assertTrue(column.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.shares_memory(column, batch.values))
+        self.assertEqual(column.tolist(), [design.inlet.blade.tip.relative.magnitude for design in self.designs])
+        self.assertEqual(batch.total_efficiency[1], self.designs[1].total_efficiency)
+        self.assertEqual(batch.converged.tolist(), [True, True])
+        with self.assertRaises(AttributeError):
+            batch.inlet.blade.root
+
+    def test_given_batch_results_expect_same_designs_as_batch(self):
+        # Given
+        result = batch_preliminary_design(
+            [3.4, 3.8], 0.6, 0.85, "air", "aluminum", CreateInputsII(CreateDesignInputs(3.8, "air"))
+        )
+
+        # Call
+        batch = result.compressors
+
+        # Expect
+        np.testing.assert_array_equal(batch.status, result.status)
+        np.testing.assert_array_equal(
+            batch.outlet.thermodynamic_point.density.static, result["outlet.thermodynamic_point.density.static"]
+        )
+        self.assertEqual(Leaves(batch[1]), Leaves(result.design(1)))
+        self.assertEqual(Leaves(batch[1:][0]), Leaves(result.design(1)))
+        self.assertTrue(np.shares_memory(batch[1:].values, batch.values))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+
+Microbenchmark of the scalar data types: allocation, attribute access,
+memory per design and a whole scalar design. Run with
+
+    python -m ccpd.data_types.test.data_types_benchmark
+
+on two revisions to compare them, it only uses the public attributes.
+"""
+
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.compressor_batch import CompressorBatch
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.data_types.thermo_point import ThermoPoint
+from ccpd.data_types.three_dimensional_blade import ThreeDimensionalBlade, VelocityVector
+import timeit
+import tracemalloc
+
+REPEATS = 7
+DESIGNS = 1000
+
+
+def _Best(statement, number: int) -> float:
+    # Best time of a single call in microseconds
+    return min(timeit.repeat(statement, number=number, repeat=REPEATS)) / number * 1e6
+
+
+def _ReadWrite(vector: VelocityVector) -> None:
+    vector.magnitude = vector.axial + vector.tangential
+    vector.angle = vector.magnitude
+
+
+def _BytesPerDesign() -> float:
+    batch = CompressorBatch.Zeros(DESIGNS)
+    tracemalloc.start()
+    compressors = batch.ToCompressors()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del compressors
+    return size / DESIGNS
+
+
+def RunBenchmark() -> dict:
+    design_inputs = CreateDesignInputs(fluid="air")
+    inputs = CreateInputsII(design_inputs)
+    vector = VelocityVector(3.0, 4.0)
+    return {
+        "ThermoPoint() [us]": _Best(ThermoPoint, 20000),
+        "ThreeDimensionalBlade() [us]": _Best(ThreeDimensionalBlade, 5000),
+        "VelocityVector 3 reads 2 writes [us]": _Best(lambda: _ReadWrite(vector), 100000),
+        "memory per design [bytes]": _BytesPerDesign(),
+        "scalar preliminary_design [us]": _Best(
+            lambda: preliminary_design(design_inputs, inputs, SolverSettings()), 20
+        ),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in RunBenchmark().items():
+        print(f"{name:40s}{value:12.3f}")
@@ -0,0 +1,71 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings, ToleranceSchedule
+import numpy as np
+
+
+class TestSolverSettings(unittest.TestCase):
+    def test_given_configuration_dictionaries_expect_loop_settings(self):
+        # Given
+        configuration = {
+            "main": {"max_iterations": 20, "tolerance": 1e-6},
+            "acceleration": "none",
+            "tolerance_schedule": {"enabled": True},
+        }
+
+        # Call
+        settings = SolverSettings(**configuration)
+
+        # Expect
+        self.assertEqual(settings.main, LoopSettings(20, 1e-6))
+        self.assertEqual(settings.inlet, LoopSettings(1000, 1e-3))
+        self.assertEqual(settings.acceleration, "none")
+        self.assertTrue(settings.tolerance_schedule.enabled)
+
+    def test_given_unknown_solver_expect_error(self):
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            SolverSettings(solver="bisection")
+
+    def test_given_no_iterations_expect_error(self):
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            SolverSettings(main={"max_iterations": 0, "tolerance": 1e-5})
+
+    def test_given_non_positive_tolerance_expect_error(self):
+        # Call & Expect
+        for tolerance in (0.0, -1e-3):
+            with self.assertRaises(AssertionError):
+                LoopSettings(100, tolerance)
+
+
+class TestInnerTolerance(unittest.TestCase):
+    def test_given_disabled_schedule_expect_exact_inner_loops(self):
+        # Given
+        settings = SolverSettings()
+
+        # Call
+        inner_tolerance = settings.InnerTolerance(np.array([np.inf, 1e-2]))
+
+        # Expect
+        np.testing.assert_array_equal(inner_tolerance, [0.0, 0.0])
+        self.assertTrue(np.all(settings.IsExact(inner_tolerance)))
+
+    def test_given_enabled_schedule_expect_tolerance_tightening_with_residual(self):
+        # Given
+        settings = SolverSettings(tolerance_schedule=ToleranceSchedule(True, 1e-1, 1e-1))
+
+        # Call
+        inner_tolerance = settings.InnerTolerance(np.array([np.inf, 1e-1, 1e-3]))
+
+        # Expect
+        np.testing.assert_allclose(inner_tolerance, [1e-1, 1e-2, 1e-4])
+        np.testing.assert_array_equal(settings.IsExact(inner_tolerance), [False, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,11 +73,11 @@ class TestCalculateComponentsViaFreeVortexMethod(unittest.TestCase):
         basic_compressor_geometry = self.CreateBasicCompressorGeometry()
         rotational_speed = 29.0
 
-        absolute_velocity = tdb.VelocityVector(_magnitude=5.0, _angle=0.0)
+        absolute_velocity = tdb.VelocityVector(magnitude=5.0, angle=0.0)
         absolute_velocity.CalculateComponentsWithMagnitudeAndAngle()
         self.blade.__setattr__(
             "_mid",
-            self.CreateBasicVelocityTriangleAtGivenPosition("_absolute", absolute_velocity),
+            self.CreateBasicVelocityTriangleAtGivenPosition("absolute", absolute_velocity),
         )
 
         # Call
@@ -4,7 +4,7 @@ Update: October 15, 2023
 """
 
 from dataclasses import dataclass
-from ccpd.data_types.inputs import Inputs
+from ccpd.data_types.inputs import DesignInputs, Inputs
 from ccpd.data_types.working_fluid import WorkingFluid
 
 
@@ -33,3 +33,30 @@ class MockWorkingFluid(WorkingFluid):
     specific_ratio: float = 1.4
     specific_gas_constant: float = 287.0
     kinematic_viscosity: float = 18.13e-6
+
+
+def CreateDesignInputs(
+    specific_diameter: float = 3.8,
+    fluid: str = "hydrogen",
+    tip_clearance: float = 0.0005,
+    mass_flow_rate: float = 1.5,
+    inlet_total_pressure: float = 100000.0,
+) -> DesignInputs:
+    """
+    Design inputs of the example compressor, for tests that run a full design
+    """
+    return DesignInputs(
+        mass_flow_rate=mass_flow_rate,
+        inlet_total_pressure=inlet_total_pressure,
+        inlet_total_temperature=303.0,
+        compression_ratio=1.25,
+        surface_roughness=0.00025,
+        tip_clearance=tip_clearance,
+        hub_diameter=0.1,
+        outlet_angle_guess=65,
+        specific_diameter=specific_diameter,
+        specific_rotational_speed=0.6,
+        end_to_end_efficiency=0.85,
+        fluid=fluid,
+        material="aluminum",
+    )
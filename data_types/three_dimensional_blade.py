@@ -2,6 +2,9 @@
     Author: Alejandro Valencia
     Update: 30 April, 2023
     Blade related classes
+
+    Velocity vectors and velocity and Mach triangles are slotted with
+    public fields, like the thermo point types
 """
 
 from dataclasses import dataclass, field
@@ -9,7 +12,7 @@ import numpy as np
 from ccpd.data_types.centrifugal_compressor_geometry import CompressorGeometry
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityVector:
     """
     Velocity Triangle class is composed of an axial and tangential
@@ -17,42 +20,10 @@ class VelocityVector:
     reference coordinate frame
     """
 
-    _axial: float = 0.0
-    _tangential: float = 0.0
-    _magnitude: float = 0.0
-    _angle: float = 0.0
-
-    @property
-    def axial(self) -> float:
-        return self._axial
-
-    @property
-    def tangential(self) -> float:
-        return self._tangential
-
-    @property
-    def magnitude(self) -> float:
-        return self._magnitude
-
-    @property
-    def angle(self) -> float:
-        return self._angle
-
-    @axial.setter
-    def axial(self, value) -> None:
-        self._axial = value
-
-    @tangential.setter
-    def tangential(self, value) -> None:
-        self._tangential = value
-
-    @magnitude.setter
-    def magnitude(self, value) -> None:
-        self._magnitude = value
-
-    @angle.setter
-    def angle(self, value) -> None:
-        self._angle = value
+    axial: float = 0.0
+    tangential: float = 0.0
+    magnitude: float = 0.0
+    angle: float = 0.0
 
     def __add__(self, other):
         return VelocityVector(self.axial + other.axial, self.tangential + other.tangential)
@@ -74,39 +45,15 @@ class VelocityVector:
     #     )
 
 
-@dataclass
+@dataclass(slots=True)
 class VelocityTriangle:
     """
     3D blade geometry
     """
 
-    _absolute: VelocityVector = field(default_factory=lambda: VelocityVector())
-    _relative: VelocityVector = field(default_factory=lambda: VelocityVector())
-    _translational: VelocityVector = field(default_factory=lambda: VelocityVector())
-
-    @property
-    def absolute(self) -> VelocityVector:
-        return self._absolute
-
-    @property
-    def relative(self) -> VelocityVector:
-        return self._relative
-
-    @property
-    def translational(self) -> VelocityVector:
-        return self._translational
-
-    @absolute.setter
-    def absolute(self, value) -> None:
-        self._absolute = value
-
-    @relative.setter
-    def relative(self, value) -> None:
-        self._relative = value
-
-    @translational.setter
-    def translational(self, value) -> None:
-        self._translational = value
+    absolute: VelocityVector = field(default_factory=VelocityVector)
+    relative: VelocityVector = field(default_factory=VelocityVector)
+    translational: VelocityVector = field(default_factory=VelocityVector)
 
     # def __repr__(self):
     #     return (
@@ -116,35 +63,11 @@ class VelocityTriangle:
     #     )
 
 
-@dataclass
+@dataclass(slots=True)
 class MachTriangle:
-    _absolute: float = 0.0
-    _relative: float = 0.0
-    _translational: float = 0.0
-
-    @property
-    def absolute(self) -> float:
-        return self._absolute
-
-    @property
-    def relative(self) -> float:
-        return self._relative
-
-    @property
-    def translational(self) -> float:
-        return self._translational
-
-    @absolute.setter
-    def absolute(self, value) -> None:
-        self._absolute = value
-
-    @relative.setter
-    def relative(self, value) -> None:
-        self._relative = value
-
-    @translational.setter
-    def translational(self, value) -> None:
-        self._translational = value
+    absolute: float = 0.0
+    relative: float = 0.0
+    translational: float = 0.0
 
     # def __repr__(self):
     #     return (
@@ -154,14 +77,14 @@ class MachTriangle:
     #     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreeDimensionalBlade:
-    _hub: VelocityTriangle = field(default_factory=lambda: VelocityTriangle())
-    _mid: VelocityTriangle = field(default_factory=lambda: VelocityTriangle())
-    _tip: VelocityTriangle = field(default_factory=lambda: VelocityTriangle())
-    _hub_mach_number: MachTriangle = field(default_factory=lambda: MachTriangle())
-    _mid_mach_number: MachTriangle = field(default_factory=lambda: MachTriangle())
-    _tip_mach_number: MachTriangle = field(default_factory=lambda: MachTriangle())
+    _hub: VelocityTriangle = field(default_factory=VelocityTriangle)
+    _mid: VelocityTriangle = field(default_factory=VelocityTriangle)
+    _tip: VelocityTriangle = field(default_factory=VelocityTriangle)
+    _hub_mach_number: MachTriangle = field(default_factory=MachTriangle)
+    _mid_mach_number: MachTriangle = field(default_factory=MachTriangle)
+    _tip_mach_number: MachTriangle = field(default_factory=MachTriangle)
 
     @property
     def hub(self) -> VelocityTriangle:
@@ -200,33 +123,33 @@ class ThreeDimensionalBlade:
         assert not self._hub is None, "Hub velocity triangle is not set"
 
         # []:Translational Velocity
-        self._tip.translational._magnitude = rotational_speed * (
+        self._tip.translational.magnitude = rotational_speed * (
             compressor_geometry.inlet_tip_diameter / 2.0
         )
 
-        self._mid.translational._magnitude = rotational_speed * (
+        self._mid.translational.magnitude = rotational_speed * (
             compressor_geometry.inlet_mid_diameter / 2.0
         )
 
-        self._hub.translational._magnitude = rotational_speed * (
+        self._hub.translational.magnitude = rotational_speed * (
             compressor_geometry.inlet_hub_diameter / 2.0
         )
 
         # Relative Velocity Components & Magnitude
-        self._hub.relative._tangential = (
+        self._hub.relative.tangential = (
             self._mid.absolute.tangential - self._hub.translational.magnitude
         )
-        self._hub.relative._axial = self._mid.absolute.axial
+        self._hub.relative.axial = self._mid.absolute.axial
         self._hub.relative.CalculateMagnitudeWithComponents()
 
-        self._mid.relative._tangential = (
+        self._mid.relative.tangential = (
             self._mid.absolute.tangential - self._mid.translational.magnitude
         )
-        self._mid.relative._axial = self._mid.absolute.axial
+        self._mid.relative.axial = self._mid.absolute.axial
         self._mid.relative.CalculateMagnitudeWithComponents()
 
-        self._tip.relative._tangential = (
+        self._tip.relative.tangential = (
             self._mid.absolute.tangential - self._tip.translational.magnitude
         )
-        self._tip.relative._axial = self._mid.absolute.axial
+        self._tip.relative.axial = self._mid.absolute.axial
         self._tip.relative.CalculateMagnitudeWithComponents()
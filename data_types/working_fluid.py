@@ -3,12 +3,100 @@ Author: Alejandro Valencia
 Update: 9 December, 2022
 """
 
+from functools import cached_property
+from types import MappingProxyType
+import numpy as np
+
+# Properties of a fluid, as named in the fluid database
+PROPERTIES = (
+    "specific_heat",
+    "specific_ratio",
+    "specific_gas_constant",
+    "kinematic_viscosity",
+    "nasa_polynomials",
+    "viscosity_reference_temperature",
+    "sutherland_temperature",
+    "critical_temperature",
+    "critical_pressure",
+    "acentric_factor",
+)
+
+# Constants derived from the properties, see WorkingFluid
+DERIVED_CONSTANTS = (
+    "isentropic_exponent",
+    "inverse_isentropic_exponent",
+    "speed_of_sound_factor",
+)
+
+
+def _Frozen(value):
+    # Read only version of a property: tuples for lists, proxies for
+    #   dictionaries and read only copies of arrays
+    if isinstance(value, dict):
+        return MappingProxyType({key: _Frozen(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_Frozen(item) for item in value)
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.flags.writeable = False
+    return value
+
+
+def _Hashable(value):
+    if isinstance(value, (dict, MappingProxyType)):
+        return tuple((key, _Hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_Hashable(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    return value
+
+
+class FluidKey:
+    """
+    Key of a fluid in caches of values computed from it. Keys of fluids
+    with the same properties and real gas table are equal, whichever
+    objects the fluids are, and hold the fluid they were made from.
+    """
+
+    __slots__ = ("fluid", "_values", "_hash")
+
+    def __init__(self, fluid: "WorkingFluid") -> None:
+        self.fluid = fluid
+        # The key holds the fluid, and with it its real gas table, so no
+        #   other table can take the id while the key is in use
+        self._values = tuple(_Hashable(getattr(fluid, name)) for name in PROPERTIES) + (
+            id(fluid.real_gas),
+        )
+        self._hash = hash(self._values)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FluidKey) and self._values == other._values
+
 
 class WorkingFluid:
     """
-    Working fluid of the compressor class
+    Working fluid of the compressor class. The constants derived from the
+    specific ratio and gas constant are computed on first use and kept,
+    so the properties of a fluid must not change once it is in use.
+
+    The properties are scalars, or arrays with one entry per design for
+    the fluids of the tabulated gas model, see gas_properties, and of
+    arrays of mixture compositions, see gas_mixture. The density and speed
+    of sound follow the ideal gas law unless the fluid has a real gas
+    table, see real_gas.
+
+    A frozen fluid, see Freeze, can not be changed. copy.copy of any fluid
+    is a fluid that can, without the derived constants.
     """
 
+    # Real gas table of the fluid, see real_gas.WithEquationOfState
+    real_gas = None
+    _frozen = False
+
     def __init__(self, working_fluid_dictionary) -> None:
         self.specific_heat = working_fluid_dictionary.get("specific_heat")
         self.specific_ratio = working_fluid_dictionary.get("specific_ratio")
@@ -16,3 +104,123 @@ class WorkingFluid:
             "specific_gas_constant"
         )
         self.kinematic_viscosity = working_fluid_dictionary.get("kinematic_viscosity")
+        self.nasa_polynomials = working_fluid_dictionary.get("nasa_polynomials")
+        self.viscosity_reference_temperature = working_fluid_dictionary.get(
+            "viscosity_reference_temperature", 293.15
+        )
+        self.sutherland_temperature = working_fluid_dictionary.get(
+            "sutherland_temperature"
+        )
+        self.critical_temperature = working_fluid_dictionary.get("critical_temperature")
+        self.critical_pressure = working_fluid_dictionary.get("critical_pressure")
+        self.acentric_factor = working_fluid_dictionary.get("acentric_factor")
+
+    def __setattr__(self, name: str, value) -> None:
+        if self._frozen:
+            raise AttributeError(
+                f"[Error]: Can not set {name} of a frozen fluid, change a copy.copy of it"
+            )
+        super().__setattr__(name, value)
+
+    def Freeze(self) -> "WorkingFluid":
+        """
+        Makes the fluid and its properties read only and returns it
+        """
+        for name, value in self.__dict__.items():
+            self.__dict__[name] = _Frozen(value)
+        self.__dict__["_frozen"] = True
+        return self
+
+    def __copy__(self) -> "WorkingFluid":
+        fluid = object.__new__(type(self))
+        for name, value in self.__dict__.items():
+            if name not in DERIVED_CONSTANTS + ("cache_key", "_frozen"):
+                fluid.__dict__[name] = value
+        return fluid
+
+    def __getstate__(self) -> dict:
+        # Mapping proxies do not pickle, a frozen fluid is frozen again when
+        #   it is unpickled
+        state = dict(self.__dict__)
+        state.pop("cache_key", None)
+        if isinstance(state.get("nasa_polynomials"), MappingProxyType):
+            state["nasa_polynomials"] = {
+                key: list(value) for key, value in state["nasa_polynomials"].items()
+            }
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        frozen = state.pop("_frozen", False)
+        self.__dict__.update(state)
+        if frozen:
+            self.Freeze()
+
+    def __getitem__(self, lanes) -> "WorkingFluid":
+        """
+        Fluid of the given designs, a fluid with scalar properties is the
+        same for every design
+        """
+        properties = {name: getattr(self, name) for name in PROPERTIES}
+        if not any(np.ndim(value) for value in properties.values()):
+            return self
+        fluid = WorkingFluid(
+            {
+                name: value[lanes] if np.ndim(value) else value
+                for name, value in properties.items()
+            }
+        )
+        fluid.real_gas = self.real_gas
+        # Derived constants already computed are sliced as well
+        for name in DERIVED_CONSTANTS:
+            if name in self.__dict__:
+                fluid.__dict__[name] = self.__dict__[name][lanes]
+        return fluid
+
+    def Density(self, pressure, temperature):
+        """
+        Density from the equation of state of the fluid
+        """
+        density = pressure / (self.specific_gas_constant * temperature)
+        if self.real_gas is None:
+            return density
+        return density / self.real_gas.Compressibility(pressure, temperature)
+
+    def SpeedOfSound(self, temperature, pressure):
+        """
+        Speed of sound at the given temperature, the pressure only matters
+        for real gases
+        """
+        speed_of_sound = self.speed_of_sound_factor * np.sqrt(temperature)
+        if self.real_gas is None:
+            return speed_of_sound
+        return speed_of_sound * self.real_gas.SpeedOfSoundRatio(pressure, temperature)
+
+    @cached_property
+    def cache_key(self) -> FluidKey:
+        """
+        Key of the fluid in caches, see FluidKey
+        """
+        return FluidKey(self)
+
+    @cached_property
+    def isentropic_exponent(self) -> float:
+        """
+        (gamma - 1) / gamma
+        """
+        return (self.specific_ratio - 1.0) / self.specific_ratio
+
+    @cached_property
+    def inverse_isentropic_exponent(self) -> float:
+        """
+        gamma / (gamma - 1), the exponent between the total to static
+        pressure and temperature ratios
+        """
+        return self.specific_ratio / (self.specific_ratio - 1.0)
+
+    @cached_property
+    def speed_of_sound_factor(self) -> float:
+        """
+        sqrt(gamma R), the speed of sound is this factor times the square
+        root of the temperature
+        """
+        return np.sqrt(self.specific_ratio * self.specific_gas_constant)
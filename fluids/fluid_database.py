@@ -0,0 +1,93 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Compiled Fluid Database
+
+Generated from fluids.json by python -m ccpd.utilities.fluid_registry,
+do not edit
+"""
+
+SOURCE_CHECKSUM = 3851536893
+
+FLUIDS = {'air': {'specific_heat': 1006.0,
+         'specific_ratio': 1.4,
+         'specific_gas_constant': 287.0,
+         'kinematic_viscosity': 1.813e-05,
+         'nasa_polynomials': {'temperature_ranges': [200.0, 1000.0, 3500.0],
+                              'coefficients': [[3.39236148,
+                                                0.000471879122,
+                                                -1.03187029e-06,
+                                                2.37722774e-09,
+                                                -1.2296254e-12],
+                                               [2.99710485,
+                                                0.00147266792,
+                                                -6.02716926e-07,
+                                                1.22731851e-10,
+                                                -9.81392958e-15]]},
+         'viscosity_reference_temperature': 293.15,
+         'sutherland_temperature': 110.4,
+         'critical_temperature': 132.5,
+         'critical_pressure': 3786000.0,
+         'acentric_factor': 0.035},
+ 'hydrogen': {'specific_heat': 14310.0,
+              'specific_ratio': 1.41,
+              'specific_gas_constant': 4120.0,
+              'kinematic_viscosity': 8.8e-06,
+              'nasa_polynomials': {'temperature_ranges': [200.0, 1000.0, 3500.0],
+                                   'coefficients': [[2.34433112,
+                                                     0.00798052075,
+                                                     -1.9478151e-05,
+                                                     2.01572094e-08,
+                                                     -7.37611761e-12],
+                                                    [3.3372792,
+                                                     -4.94024731e-05,
+                                                     4.99456778e-07,
+                                                     -1.79566394e-10,
+                                                     2.00255376e-14]]},
+              'viscosity_reference_temperature': 293.15,
+              'sutherland_temperature': 72.0,
+              'critical_temperature': 33.19,
+              'critical_pressure': 1313000.0,
+              'acentric_factor': -0.216},
+ 'methane': {'specific_heat': 2226.0,
+             'specific_ratio': 1.304,
+             'specific_gas_constant': 518.3,
+             'kinematic_viscosity': 1.1e-05,
+             'nasa_polynomials': {'temperature_ranges': [200.0, 1000.0, 3500.0],
+                                  'coefficients': [[5.14987613,
+                                                    -0.0136709788,
+                                                    4.91800599e-05,
+                                                    -4.84743026e-08,
+                                                    1.66693956e-11],
+                                                   [0.074851495,
+                                                    0.0133909467,
+                                                    -5.73285809e-06,
+                                                    1.22292535e-09,
+                                                    -1.0181523e-13]]},
+             'viscosity_reference_temperature': 293.15,
+             'sutherland_temperature': 164.0,
+             'critical_temperature': 190.56,
+             'critical_pressure': 4599000.0,
+             'acentric_factor': 0.011},
+ 'water_vapor': {'specific_heat': 1864.0,
+                 'specific_ratio': 1.327,
+                 'specific_gas_constant': 461.5,
+                 'kinematic_viscosity': 9.7e-06,
+                 'nasa_polynomials': {'temperature_ranges': [200.0, 1000.0, 3500.0],
+                                      'coefficients': [[4.19864056,
+                                                        -0.0020364341,
+                                                        6.52040211e-06,
+                                                        -5.48797062e-09,
+                                                        1.77197817e-12],
+                                                       [3.03399249,
+                                                        0.00217691804,
+                                                        -1.64072518e-07,
+                                                        -9.7041987e-11,
+                                                        1.68200992e-14]]},
+                 'viscosity_reference_temperature': 293.15,
+                 'sutherland_temperature': 1064.0,
+                 'critical_temperature': 647.1,
+                 'critical_pressure': 22064000.0,
+                 'acentric_factor': 0.344},
+ 'wet_air': {'mole_fractions': {'air': 0.98, 'water_vapor': 0.02}},
+ 'hydrogen_methane_20': {'mole_fractions': {'hydrogen': 0.8, 'methane': 0.2}}}
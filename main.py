@@ -5,69 +5,100 @@
  Update: 20 January, 2024
 """
 
+from ccpd.api import CreateInputsII, preliminary_design
 from ccpd.data_types.inputs import DesignInputs, DesignParametersII, Inputs, InputsII
 from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
-from ccpd.utilities.centrifugal_calcs import centrifugal_calcs
+from ccpd.data_types.solver_settings import LoadSolverSettings, SolverSettings
+from typing import TYPE_CHECKING
+import functools
 import json
 import sys
-from colorama import Fore
 import logging
 
-logging.basicConfig(filename="log.log", encoding="utf-8", level=logging.INFO, filemode="w")
+if TYPE_CHECKING:
+    from ccpd.utilities.design_cache import DesignCache
+
 logger = logging.getLogger(__name__)
 
 
 def load_inputs() -> tuple[DesignInputs, InputsII]:
     try:
-        input_file = open("ccpd/neptune_inputs.json", "r")
+        with open("ccpd/neptune_inputs.json", "r") as input_file:
+            loaded_file = json.load(input_file)
     except IOError as io_error:
         print(f"Error:{io_error} input parameters import failed!")
         sys.exit()
-    loaded_file = json.load(input_file)
     design_inputs = DesignInputs(**(loaded_file))
     logger.info(f"Inputs from neptune created")
-    inputsII = InputsII(
-        mass_flow_rate=design_inputs.mass_flow_rate,
-        inlet_total_temperature=design_inputs.inlet_total_temperature,
-        inlet_total_pressure=design_inputs.inlet_total_pressure,
-        compression_ratio=design_inputs.compression_ratio,
-        surface_roughness=design_inputs.surface_roughness,
-        tip_clearance=design_inputs.tip_clearance,
-        hub_diameter=design_inputs.hub_diameter,
-        outlet_angle_guess=design_inputs.outlet_angle_guess,
-    )
-    return design_inputs, inputsII
+    return design_inputs, CreateInputsII(design_inputs)
 
 
 def load_base_inputs() -> tuple[DesignParametersII, InputsII]:
     try:
-        design_parameter_file = open("ccpd/design_parameters.json", "r")
+        with open("ccpd/design_parameters.json", "r") as design_parameter_file:
+            loaded_file = json.load(design_parameter_file)
     except IOError as io_error:
         print(f"Error:{io_error} Design parameters import failed!")
         sys.exit()
-    loaded_file = json.load(design_parameter_file)
     design_parameters = DesignParametersII(**loaded_file)
 
     try:
-        input_file = open("ccpd/inputs.json", "r")
+        with open("ccpd/inputs.json", "r") as input_file:
+            inputs = InputsII(**(json.load(input_file)))
     except IOError as io_error:
         print(f"Error:{io_error} input parameters import failed!")
         sys.exit()
-    inputs = InputsII(**(json.load(input_file)))
     return design_parameters, inputs
 
 
-def main(design_stage: str, caller: str = "cli"):
+def load_solver_settings() -> SolverSettings:
+    return LoadSolverSettings()
+
+
+def ReportDesignStatus(design: CentrifugalCompressor) -> None:
+    from colorama import Fore
+
+    if design.approximate:
+        print(f"{Fore.YELLOW}[ccpd]: time budget exhausted, approximate design ({design.status.name}){Fore.RESET}")
+    elif design.converged:
+        print(f"{Fore.GREEN}[ccpd]: exited successfully{Fore.RESET}")
+    else:
+        print(f"{Fore.YELLOW}[ccpd]: design did not converge ({design.status.name}){Fore.RESET}")
+
+
+def main(
+    design_stage: str,
+    caller: str = "cli",
+    settings: SolverSettings = None,
+    cache: "DesignCache" = None,
+    budget: float = None,
+):
     """
     This function runs either a preliminary design calculations
      for a centrifugal compressor. Note the inputs must be entered in the
      correct order.
 
-    For the prelimiary design this "main" function runs the
-     centrifugal_calcs function for a specified number of iterations or
-     until convergence is reached. "main" takes the final end to end
-     efficiency and uses it as the new guess value to calculate the
-     Eulerian work for the centrifugal compressor.
+    For the prelimiary design this "main" function runs
+     preliminary_design on the inputs. The iteration count, final
+     residual and status of each loop are stored in the convergence
+     report of the design and of its stages, check design.converged before
+     using a design. The working fluid and the inlet stage do not depend on
+     the efficiency guess, they are computed on the first iteration and
+     reused afterwards, see stage_graph.
+
+    The iteration limits, tolerances, acceleration method and tolerance
+     schedule of the loops are read from solver_settings.json unless
+     settings are given, see SolverSettings. With solver "newton" the
+     efficiency loop and the stage loops are solved together as one
+     nonlinear system instead, see newton_solver.
+
+    With a cache the design is looked up by its design parameters, inputs
+     and settings and only computed when it is not stored yet, see
+     DesignCache. Cached designs are shared and must not be modified.
+
+    With a budget, in seconds, the design is cut short when it runs out of
+     time and flagged as approximate, see preliminary_design. Approximate
+     designs are not stored in the cache.
 
     The following are inputs for the prelimiary design calculations:
         Ds    : Specific diameter
@@ -94,46 +125,40 @@ def main(design_stage: str, caller: str = "cli"):
         else:
             design_inputs, inputsII = load_inputs()
             logger.debug(f"Inputs from neptune: {inputsII}")
+        if settings is None:
+            settings = load_solver_settings()
 
-        # [B] Set Loop Parameters
-        max_iterations = 2
-        tolerance = 1e-5
-
-        # [C]:Run Analysis
-        design = CentrifugalCompressor()
-        end_to_end_efficiency = design_inputs.end_to_end_efficiency
-        for iteration in range(0, max_iterations):
-            iteration += 1
-            logger.info(f"Main Iteration: {iteration}")
-
-            # [D]:Run Centrifugal Preliminary Design Calculations
-            design = centrifugal_calcs(
-                design_inputs.specific_diameter,
-                design_inputs.specific_rotational_speed,
-                end_to_end_efficiency,
-                design_inputs.fluid,
-                design_inputs.material,
-                inputsII,
+        if cache is None:
+            design = preliminary_design(design_inputs, inputsII, settings, budget)
+        else:
+            design = cache.GetOrCompute(
+                (design_inputs, inputsII, settings),
+                functools.partial(preliminary_design, budget=budget),
+                keep=lambda design: not design.approximate,
             )
-
-            # [E]:Calculate Residual & Check Convergence
-            residual = abs(end_to_end_efficiency - design.total_efficiency) / design.total_efficiency
-            logger.info(f"Main Residual: {residual:.6}\n")
-            if residual < tolerance:
-                logger.info(f"Main converged in {iteration} iterations")
-                break
-            elif iteration == max_iterations:
-                logger.warning("Max iterations reached")
-
-            # [F]:Reset Efficiency & Iterate
-            end_to_end_efficiency = design.total_efficiency
-
-        print(f"{Fore.GREEN}[ccpd]: exited successfully{Fore.RESET}")
-
+        ReportDesignStatus(design)
         return design
     else:
         print("Alternative modes TBD")
 
 
 if __name__ == "__main__":
-    main("Preliminary")
+    import argparse
+
+    # Only the command line writes a log file, the library leaves logging to the application embedding it
+    logging.basicConfig(filename="log.log", encoding="utf-8", level=logging.INFO, filemode="w")
+    parser = argparse.ArgumentParser(description="Centrifugal compressor preliminary design")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("design", help="Design the compressor of ccpd/design_parameters.json, the default")
+    batch_parser = commands.add_parser("batch", help="Design every row of a JSON lines or CSV catalog")
+    # The batch engine is only imported by the batch command, a single design starts without it
+    if sys.argv[1:2] == ["batch"]:
+        from ccpd import batch
+
+        batch.AddArguments(batch_parser)
+    arguments = parser.parse_args()
+
+    if arguments.command == "batch":
+        batch.RunCommand(arguments)
+    else:
+        main("Preliminary")
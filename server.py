@@ -0,0 +1,264 @@
+"""
+Author: Alejandro Valencia
+Design Server
+Update: October 17, 2026
+
+Long lived process that answers preliminary design requests, so callers do
+not pay the interpreter startup, the imports and the reading of the input,
+settings and fluid files on every design. The fluid database and solver
+settings are loaded once when the server starts.
+
+Requests and responses are JSON objects, one per line, read from stdin and
+written to stdout or exchanged over a local TCP socket. A request holds the
+fields of DesignInputs and an optional "id" echoed back in its response:
+
+    {"id": 7, "mass_flow_rate": 1.5, ..., "fluid": "hydrogen", "material": "aluminum"}
+
+A response holds the status of the design and every field of the design by
+its dotted path, see COMPRESSOR_FIELDS, or an error message:
+
+    {"id": 7, "status": "CONVERGED", "design": {"total_efficiency": 0.83, ...}}
+    {"id": 7, "error": "..."}
+
+Requests are designed concurrently on a pool of worker processes, each with
+its own DesignCache, and responses are written as soon as their design
+finishes, so they may come back in a different order than the requests.
+With zero workers the designs run one at a time in the server process.
+
+With a batch window the requests are instead collected by a MicroBatcher
+and designed together through the batch engine, identical concurrent
+requests sharing one design. Every request then waits up to one window
+before its batch runs.
+
+Run as python -m ccpd.server [--port PORT] [--workers WORKERS]
+[--batch-window MILLISECONDS] [--max-batch-size SIZE].
+"""
+
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.inputs import DesignInputs
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.main import load_solver_settings
+from ccpd.utilities.batch_centrifugal_calcs import COMPRESSOR_FIELDS
+from ccpd.utilities.design_cache import DesignCache
+from ccpd.utilities.fluid_registry import DefaultFluidRegistry
+from ccpd.utilities.micro_batcher import MicroBatcher
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import io
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def DesignFields(design: CentrifugalCompressor) -> dict:
+    """
+    Every field of a design by its dotted path
+    """
+    fields = {}
+    for path in COMPRESSOR_FIELDS:
+        node = design
+        for name in path.split("."):
+            node = getattr(node, name)
+        fields[path] = node
+    return fields
+
+
+# Worker state, set once per worker by _InitializeWorker
+_worker = {}
+
+
+def _InitializeWorker(settings: SolverSettings, cache_entries: int) -> None:
+    DefaultFluidRegistry()
+    _worker["settings"] = settings
+    _worker["cache"] = DesignCache(cache_entries) if cache_entries else None
+
+
+def _DesignResponse(request_id, design: CentrifugalCompressor) -> dict:
+    return {"id": request_id, "status": design.status.name, "design": DesignFields(design)}
+
+
+def _ErrorResponse(request_id, error: Exception) -> dict:
+    logger.warning(f"Request {request_id} failed: {error!r}")
+    return {"id": request_id, "error": repr(error)}
+
+
+def _RunRequest(request: dict) -> dict:
+    """
+    Designs the compressor of a request and returns its response
+    """
+    request = dict(request)
+    request_id = request.pop("id", None)
+    try:
+        design_inputs = DesignInputs(**request)
+        inputs = (design_inputs, CreateInputsII(design_inputs), _worker["settings"])
+        if _worker["cache"] is None:
+            design = preliminary_design(*inputs)
+        else:
+            design = _worker["cache"].GetOrCompute(inputs, preliminary_design)
+    except Exception as error:
+        return _ErrorResponse(request_id, error)
+    return _DesignResponse(request_id, design)
+
+
+class DesignServer:
+    def __init__(
+        self,
+        settings: SolverSettings = None,
+        workers: int = None,
+        cache_entries: int = 1024,
+        batch_window: float = None,
+        max_batch_size: int = 256,
+    ) -> None:
+        """
+        Loads the settings, from solver_settings.json unless given, and the
+        fluid database and starts the workers, all cores by default. With a
+        batch window, in seconds, the designs run on a MicroBatcher instead
+        of the workers.
+        """
+        self.settings = load_solver_settings() if settings is None else settings
+        self.workers = os.cpu_count() if workers is None else workers
+        DefaultFluidRegistry()
+        self._executor = None
+        self._batcher = None
+        if batch_window is not None:
+            self._batcher = MicroBatcher(self.settings, batch_window, max_batch_size)
+            logger.info(f"Design server started with a {batch_window} s batch window")
+            return
+
+        arguments = dict(initializer=_InitializeWorker, initargs=(self.settings, cache_entries))
+        if self.workers:
+            self._executor = ProcessPoolExecutor(self.workers, **arguments)
+        else:
+            self._executor = ThreadPoolExecutor(1, **arguments)
+        logger.info(f"Design server started with {self.workers} workers")
+
+    def __enter__(self) -> "DesignServer":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.Close()
+
+    def Close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.Close()
+        else:
+            self._executor.shutdown()
+
+    def Submit(self, request: dict) -> Future:
+        """
+        Schedules the design of a request, the future holds its response
+        """
+        if self._batcher is None:
+            return self._executor.submit(_RunRequest, request)
+
+        request = dict(request)
+        request_id = request.pop("id", None)
+        response = Future()
+
+        def OnDone(design: Future) -> None:
+            try:
+                response.set_result(_DesignResponse(request_id, design.result()))
+            except Exception as error:
+                response.set_result(_ErrorResponse(request_id, error))
+
+        try:
+            self._batcher.Submit(DesignInputs(**request)).add_done_callback(OnDone)
+        except Exception as error:
+            response.set_result(_ErrorResponse(request_id, error))
+        return response
+
+    def ServeStream(self, reader, writer) -> int:
+        """
+        Answers every request line read from reader, writing each response
+        line to writer as soon as it is ready. Returns once every request
+        was answered, with the number of requests.
+        """
+        write_lock = threading.Lock()
+        answered = threading.Semaphore(0)
+
+        def Respond(response: dict) -> None:
+            line = json.dumps(response) + "\n"
+            with write_lock:
+                writer.write(line)
+                writer.flush()
+
+        def OnDone(request_id, future: Future) -> None:
+            try:
+                try:
+                    response = future.result()
+                except Exception as error:
+                    response = {"id": request_id, "error": repr(error)}
+                Respond(response)
+            finally:
+                answered.release()
+
+        pending = []
+        for line in reader:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                assert isinstance(request, dict), f"[Error]: A request must be a JSON object"
+            except (ValueError, AssertionError) as error:
+                Respond({"id": None, "error": repr(error)})
+                continue
+            future = self.Submit(request)
+            future.add_done_callback(lambda future, request_id=request.get("id"): OnDone(request_id, future))
+            pending.append(future)
+
+        # Done callbacks may still be writing after the futures complete
+        for _ in pending:
+            answered.acquire()
+        return len(pending)
+
+    def ServeTcp(self, host: str = "127.0.0.1", port: int = 0) -> "_TcpServer":
+        """
+        Socket server answering the request lines of every connection on
+        its own thread. Call serve_forever on it, the bound address is in
+        server_address.
+        """
+        return _TcpServer((host, port), self)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+        writer = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+        count = self.server.design_server.ServeStream(reader, writer)
+        logger.info(f"Connection {self.client_address} closed after {count} requests")
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple, design_server: DesignServer) -> None:
+        self.design_server = design_server
+        super().__init__(address, _ConnectionHandler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answers design requests, one JSON object per line")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Serve over TCP instead of stdin/stdout")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, all cores by default")
+    parser.add_argument("--batch-window", type=float, default=None, help="Micro batch window in milliseconds")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    arguments = parser.parse_args()
+
+    batch_window = None if arguments.batch_window is None else arguments.batch_window / 1000
+    with DesignServer(
+        workers=arguments.workers, batch_window=batch_window, max_batch_size=arguments.max_batch_size
+    ) as design_server:
+        if arguments.port is None:
+            design_server.ServeStream(sys.stdin, sys.stdout)
+        else:
+            with design_server.ServeTcp(arguments.host, arguments.port) as tcp_server:
+                print(f"[ccpd]: serving on {tcp_server.server_address}", file=sys.stderr)
+                tcp_server.serve_forever()
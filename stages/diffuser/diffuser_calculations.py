@@ -27,6 +27,7 @@ def diffuser_calcs(
     inlet_total_pressure: float,
     isentropic_exponent: float,
     eulerian_work: float,
+    inlet_specific_heat: float = None,
 ) -> tuple[CompressorStage, float, float]:
     """
     This function calculates the thermodynamic quantities of the wedge
@@ -36,6 +37,8 @@ def diffuser_calcs(
     The following is the input:
 
         design: Current design with vanless diffuser
+        inlet_specific_heat: Specific heat of the isentropic work, the one
+            of the working fluid when not given
 
     The following is the output
 
@@ -77,7 +80,7 @@ def diffuser_calcs(
     P4.static = prc * (PT3 - P3) + P3  # [Pa] Static pressure
     T4is = T3 * (P4.static / P3) ** isentropic_exponent  # [K]  Isentropic static temperature
     T4.static = T3 + (T4is - T3) / diffuser_efficiency  # [K]  Real static temperature
-    rho4.static = P4.static / (working_fluid.specific_gas_constant * T4.static)  # [kg/m^3] Density
+    rho4.static = working_fluid.Density(P4.static, T4.static)  # [kg/m^3] Density
 
     ## [.1]:Losses
     # Looking at a Mollier diagram for points 3 to 4, we notice that the
@@ -92,32 +95,32 @@ def diffuser_calcs(
 
     ## [.2]:Continue with remaining thermodynamic values
     TT4is = T4.total - dhloss / working_fluid.specific_heat  # [K]  Isentropic total temperature
-    P4.total = P4.static * (TT4is / T4.static) ** (
-        working_fluid.specific_ratio / (working_fluid.specific_ratio - 1)
-    )  # [Pa] Total pressure
+    P4.total = P4.static * (TT4is / T4.static) ** working_fluid.inverse_isentropic_exponent  # [Pa] Total pressure
 
     ## []:Velocity
     # Velocity at the outlet can be derived from the total temperature. The
     #   total temperature is the sum of the static temperature plus
     #   V^2/(2cp)
     V4 = np.sqrt(2 * working_fluid.specific_heat * (T4.total - T4.static))
-    M4 = V4 / (working_fluid.specific_ratio * T4.static)
+    M4 = V4 / working_fluid.SpeedOfSound(T4.static, P4.static)
     logger.debug(f"Diffuser velocity magnitude: {V4:0.6}")
     logger.debug(f"Diffuser Mach Number: {M4:0.6}")
 
     ## []:Final End to End Efficiency
     # Calculate total isentropic enthalpy change [J/kg], then divide by the
     #   Eulerian work of our compressor
+    if inlet_specific_heat is None:
+        inlet_specific_heat = working_fluid.specific_heat
     Be = P4.total / inlet_total_pressure
-    htis = working_fluid.specific_heat * inlet_total_temperature * (Be**isentropic_exponent - 1)
+    htis = inlet_specific_heat * inlet_total_temperature * (Be**isentropic_exponent - 1)
     eta_tt = htis / eulerian_work
 
     logger.debug(f"Isentropic enthalpy drop: {htis:0.6}")
     logger.info(f"End to end pressure ratio: {Be:0.3} | End to end efficiency: {eta_tt:0.3f}")
 
     diffuser = CompressorStage(
-        _thermodynamic_point=ThermoPoint(_pressure=P4, _density=rho4, _temperature=T4),
-        _blade=ThreeDimensionalBlade(_mid=VelocityTriangle(_absolute=VelocityVector(_magnitude=V4))),
+        _thermodynamic_point=ThermoPoint(pressure=P4, density=rho4, temperature=T4),
+        _blade=ThreeDimensionalBlade(_mid=VelocityTriangle(absolute=VelocityVector(magnitude=V4))),
     )
 
     ## []:Output
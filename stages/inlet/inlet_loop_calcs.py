@@ -13,10 +13,13 @@ from ccpd.data_types.three_dimensional_blade import (
 )
 from ccpd.data_types.thermo_point import ThermodynamicVariable, ThermoPoint
 from ccpd.data_types.inputs import Inputs
+from ccpd.data_types.solver_status import ConvergenceReport
 from ccpd.data_types.working_fluid import WorkingFluid
 from ccpd.stages.inlet.tip_diameter import ComputeTipDiameter
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.fixed_point import DEFAULT_ACCELERATION, CreateAccelerator
+from ccpd.utilities.time_budget import OutOfTime
 from numpy import pi, sqrt, float64
-from colorama import Fore
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,12 +38,14 @@ logger = logging.getLogger(__name__)
 #           hub_diameter  : Hub diameter
 #           itermx: Max iterations
 #           tol   : Tolerance
-#           monitor_residual: String either 'yes' or 'no'
+#           acceleration: Fixed point acceleration method, see fixed_point
 #
 #       The following are outputs:
 #
 #           result: Structure containing the thermofluid properties at
-# 					 the inlet after converging to the inlet density
+# 					 the inlet after converging to the inlet density. The
+# 					 iteration count and final residual of the density loop
+# 					 are stored in result.convergence
 #
 # In order to optimize the tip diameter we begin by choosing a hub
 #   diameter. The optimal tip diameter will be found by minimizing the
@@ -95,6 +100,8 @@ class InletLoopCollector:
         self.name = __name__
 
     def Print(self) -> None:
+        from colorama import Fore
+
         for key, value in self.__dict__.items():
             if key == "name":
                 print(f"{Fore.YELLOW}INFO: {__name__}{Fore.RESET}")
@@ -110,10 +117,14 @@ def IsInletLoopConverged(density_residual: float, tolerance: float, iteration: i
         return True
 
     elif density_residual > 1e6:
+        from colorama import Fore
+
         logger.error(f"{Fore.RED}Error:{Fore.RESET} solution diverging")
         return False
 
     elif iteration == max_iterations:
+        from colorama import Fore
+
         logger.warning(f"{Fore.YELLOW}WARNING:{Fore.RESET} Max iterations reached")
 
 
@@ -125,8 +136,10 @@ def InletLoop(
     compressor_geometry: CompressorGeometry,
     max_iterations: int,
     tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
 ) -> CompressorStage:
     inlet_loop_collector = InletLoopCollector()
+    accelerator = CreateAccelerator(acceleration)
 
     # Quantities
     T = ThermodynamicVariable()
@@ -134,6 +147,8 @@ def InletLoop(
     rho = ThermodynamicVariable()
     V = VelocityVector()
     inlet_flow_area = 0.0
+    density_residual = float("inf")
+    approximate = False
 
     T.total = inputs.inlet_total_temperature
     P.total = inputs.inlet_total_pressure
@@ -142,6 +157,7 @@ def InletLoop(
     for iteration in range(0, max_iterations):
         iteration += 1
         logger.debug(f"Iteration: {iteration}")
+        CheckCancelled()
 
         # Minimize Inlet Tip Diameter
         tip_diameter = ComputeTipDiameter(
@@ -149,7 +165,6 @@ def InletLoop(
             inputs.mass_flow_rate,
             float64(static_density_guess),
             inputs.hub_diameter,
-            float64(0.2),
             bounds=[
                 0.4 * compressor_geometry.outer_diameter,
                 0.6 * compressor_geometry.outer_diameter,
@@ -168,32 +183,39 @@ def InletLoop(
         T.static = T.total - V.magnitude**2 / (2 * fluid.specific_heat)  # [K]
         logger.debug(f"Static temperature: {T.static}")
 
-        mach_number = V.magnitude / sqrt(fluid.specific_ratio * fluid.specific_gas_constant * T.static)  # []
+        mach_number = V.magnitude / fluid.SpeedOfSound(T.static, P.total)  # []
 
         P.static = P.total / (1 + (fluid.specific_ratio - 1) / 2 * mach_number**2) ** (
-            fluid.specific_ratio / (fluid.specific_ratio - 1)
+            fluid.inverse_isentropic_exponent
         )  # [Pa]
         logger.debug(f"Static pressure: {P.static}")
 
-        rho.static = P.static / (fluid.specific_gas_constant * T.static)  # [kg/m^3]
+        rho.static = fluid.Density(P.static, T.static)  # [kg/m^3]
 
         density_residual = abs(rho.static - static_density_guess) / static_density_guess
         logger.debug(f"Residual: {density_residual}\n")
 
         if IsInletLoopConverged(density_residual, tolerance, iteration, max_iterations):
             break
+        elif OutOfTime():
+            logger.warning(f"Inlet loop stopped after {iteration} iterations, time budget exhausted")
+            approximate = True
+            break
 
         # Reset Density
-        static_density_guess = rho.static
+        static_density_guess = accelerator(static_density_guess, rho.static)
 
-    rho.static = P.static / (fluid.specific_gas_constant * T.static)
+    rho.static = fluid.Density(P.static, T.static)
+    convergence = ConvergenceReport.FromResidual(iteration, density_residual, tolerance, approximate=approximate)
 
     # [I]:Output
     # result.mach_number = M1  # []    Absolute Mach number
     # result.inlet_flow_area = S1  # [m^2] Inlet flow area
 
-    blade = ThreeDimensionalBlade(_mid=VelocityTriangle(_absolute=V))
-    inlet_thermo_point = ThermoPoint(_pressure=P, _density=rho, _temperature=T)
-    inlet = CompressorStage(_thermodynamic_point=inlet_thermo_point, _blade=blade, _flow_area=inlet_flow_area)
+    blade = ThreeDimensionalBlade(_mid=VelocityTriangle(absolute=V))
+    inlet_thermo_point = ThermoPoint(pressure=P, density=rho, temperature=T)
+    inlet = CompressorStage(
+        _thermodynamic_point=inlet_thermo_point, _blade=blade, _flow_area=inlet_flow_area, _convergence=convergence
+    )
 
     return inlet
@@ -56,10 +56,9 @@ def CalculateRemainingInletQuantities(
     )
 
     # [m/s]: Speed of sound
-    speed_of_sound_at_inlet = np.sqrt(
-        working_fluid.specific_ratio
-        * working_fluid.specific_gas_constant
-        * inlet.thermodynamic_point.temperature.total
+    speed_of_sound_at_inlet = working_fluid.SpeedOfSound(
+        inlet.thermodynamic_point.temperature.total,
+        inlet.thermodynamic_point.pressure.total,
     )
     inlet.thermodynamic_point.speed_of_sound = speed_of_sound_at_inlet
 
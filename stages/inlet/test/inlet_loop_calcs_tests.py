@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import unittest
 from ccpd.data_types.thermo_point import ThermodynamicVariable
 from ccpd.data_types.centrifugal_compressor_geometry import CompressorGeometry
+from ccpd.data_types.solver_status import SolverStatus
 from ccpd.stages.inlet.inlet_loop_calcs import InletLoop
 from ccpd.data_types.test_utils import MockInputs, MockWorkingFluid
 
@@ -69,11 +70,36 @@ class TestInletLoopCalculations(unittest.TestCase):
             outer_diameter,
             inlet_loop_max_iterations,
             inlet_loop_tolerance,
+            acceleration="none",
         )
 
         # Expect
         self.assertAlmostEqual(result.blade.mid.absolute.magnitude, 28.695, delta=self.tolerance)
 
+    def test_given_accelerated_loop_expect_converged_report(self):
+        # Given
+        inputs = MockInputs()
+        working_fluid = MockWorkingFluid()
+        inlet_loop_max_iterations = 10
+        inlet_loop_tolerance = 0.001
+
+        # Call
+        result = InletLoop(
+            inputs,
+            working_fluid,
+            0.125,
+            35.0,
+            CreateBasicCompressorGeometry(),
+            inlet_loop_max_iterations,
+            inlet_loop_tolerance,
+        )
+
+        # Expect
+        self.assertEqual(result.convergence.status, SolverStatus.CONVERGED)
+        self.assertLess(result.convergence.residual, inlet_loop_tolerance)
+        self.assertLessEqual(result.convergence.iterations, inlet_loop_max_iterations)
+        self.assertAlmostEqual(result.blade.mid.absolute.magnitude, 28.695, delta=28.695 * inlet_loop_tolerance)
+
 
 if __name__ == "__main__":
     unittest.main()
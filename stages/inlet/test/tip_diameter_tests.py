@@ -5,6 +5,7 @@ Update: May 1, 2023
 
 import unittest
 from ccpd.stages.inlet.tip_diameter import ComputeTipDiameter
+import numpy as np
 
 
 class TestComputeTipDiameter(unittest.TestCase):
@@ -14,7 +15,6 @@ class TestComputeTipDiameter(unittest.TestCase):
         mass_flow_rate = 5.0
         density = 0.125
         hub_diameter = 0.35
-        initial_guess = 0.4
         bounds = [0.4, 0.6]
 
         # Call
@@ -23,20 +23,72 @@ class TestComputeTipDiameter(unittest.TestCase):
             mass_flow_rate,
             density,
             hub_diameter,
-            initial_guess,
             bounds,
         )
 
         # Expect
         self.assertAlmostEqual(result, 0.6, 3)
 
+    def test_given_interior_minimum_expect_minimum_of_relative_velocity(self):
+        # Given
+        rotational_speed = 6000.0
+        mass_flow_rate = 1.0
+        density = 0.1
+        hub_diameter = 0.02
+        bounds = [0.0, 1.0]
+        tip_diameters = np.linspace(0.03, 0.3, 100001)
+        relative_velocity = rotational_speed**2 * tip_diameters**2 / 4.0 + (
+            mass_flow_rate / (density * np.pi / 4 * (tip_diameters**2 - hub_diameter**2))
+        ) ** 2
+
+        # Call
+        result = ComputeTipDiameter(
+            rotational_speed,
+            mass_flow_rate,
+            density,
+            hub_diameter,
+            bounds,
+        )
+
+        # Expect
+        self.assertAlmostEqual(result, tip_diameters[np.argmin(relative_velocity)], 5)
+
+    def test_given_arrays_expect_element_wise_results(self):
+        # Given
+        rotational_speed = np.array([40.0, 6000.0])
+        mass_flow_rate = np.array([5.0, 1.0])
+        density = np.array([0.125, 0.1])
+        hub_diameter = np.array([0.35, 0.02])
+        bounds = [np.array([0.4, 0.0]), np.array([0.6, 1.0])]
+
+        # Call
+        result = ComputeTipDiameter(
+            rotational_speed,
+            mass_flow_rate,
+            density,
+            hub_diameter,
+            bounds,
+        )
+
+        # Expect
+        for lane in range(0, 2):
+            self.assertAlmostEqual(
+                result[lane],
+                ComputeTipDiameter(
+                    rotational_speed[lane],
+                    mass_flow_rate[lane],
+                    density[lane],
+                    hub_diameter[lane],
+                    [bounds[0][lane], bounds[1][lane]],
+                ),
+            )
+
     def test_given_immaginary_rotational_speed_expect_valid_results(self):
         # Given
         rotational_speed = 40.0j
         mass_flow_rate = 5.0
         density = 0.125
         hub_diameter = 0.35
-        initial_guess = 0.4
         bounds = [0.4, 0.6]
 
         # Expect
@@ -46,7 +98,6 @@ class TestComputeTipDiameter(unittest.TestCase):
                 mass_flow_rate,
                 density,
                 hub_diameter,
-                initial_guess,
                 bounds,
             )
 
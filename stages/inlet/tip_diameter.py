@@ -2,18 +2,29 @@
   Author: Alejandro Valencia
   Centrifugal Compressor Preliminary Design
   Minimize tip diameter
-  Update: 28 January, 2023
+  Update: 17 October, 2026
 """
 
-from scipy import optimize
 import numpy as np
 
 #
 # This function takes initial design parameters and calculates the inlet
 #  tip diameter minimizing the relative velocity function. This comes
 # 	from the fact that for a centrifugal compressor we want to minimize
-# 	the relative Mach number. MATLAB's built in optimization function
-# 	fmincon is utilized.
+# 	the relative Mach number.
+#
+#  The squared relative velocity at the tip is
+#
+#      W^2 = w^2 * Dtip^2 / 4 + (mdot / (rho * pi / 4 * (Dtip^2 - Dhub^2)))^2
+#
+#  Written in terms of x = Dtip^2 it is convex for Dtip > Dhub and its
+#  stationary point is found in closed form:
+#
+#      (x - Dhub^2)^3 = 8 * (4 * mdot / (rho * pi))^2 / w^2
+#
+#  Since Dtip grows with x, clipping the stationary point to the bounds
+#  gives the bounded minimum. Every input may be an array, the tip
+#  diameters are computed element wise.
 #
 #      The following are inputs:
 #
@@ -21,7 +32,7 @@ import numpy as np
 #          rho   : Inlet density
 #          Dhub  : Hub diameter
 #          w     : rotational speed
-#          Dlimit: Max diameter limit
+#          bounds: Min and max diameter limits
 #
 #      The following are outputs:
 #
@@ -34,27 +45,15 @@ def ComputeTipDiameter(
     mass_flow_rate: np.float64,
     density: np.float64,
     hub_diameter: np.float64,
-    initial_guess: np.float64,
     bounds: list,
 ) -> np.float64:
 
-    assert not isinstance(rotational_speed, complex), (
+    assert not np.iscomplexobj(rotational_speed), (
         f"ERROR: rotational speed is immaginary" + f", is isentropic work positive?"
     )
 
-    function = lambda tip_diameter, *args: (
-        args[0] ** 2 * (tip_diameter**2 / 4.0)
-        + (args[1] / (args[2] * np.pi / 4 * (tip_diameter**2 - args[3] ** 2))) ** 2
-    )
-
-    Bounds = optimize.Bounds(bounds[0], bounds[1])
-
-    # TODO: create a minimization function to reduce the overkill of scipy's optimize.minimize
-    result = optimize.minimize(
-        function,
-        initial_guess,
-        args=(rotational_speed, mass_flow_rate, density, hub_diameter),
-        bounds=Bounds,
-    )
+    flow_term = 4.0 * mass_flow_rate / (density * np.pi)
+    with np.errstate(divide="ignore"):
+        tip_diameter = np.sqrt(np.square(hub_diameter) + np.cbrt(8.0 * np.square(flow_term / rotational_speed)))
 
-    return result.x[0]
+    return np.clip(tip_diameter, bounds[0], bounds[1])
@@ -9,9 +9,12 @@ from ccpd.data_types.working_fluid import WorkingFluid
 from ccpd.data_types.inputs import Inputs
 from ccpd.data_types.centrifugal_compressor import CompressorStage, CompressorGeometry
 from ccpd.data_types.centrifugal_compressor_geometry import DiameterStruct
-from ccpd.stages.outlet.friction_coefficient import CalculateFrictionCoefficient
+from ccpd.data_types.solver_status import ConvergenceReport
+from ccpd.stages.outlet.friction_coefficient import DEFAULT_FRICTION_METHOD, CalculateFrictionCoefficient
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.fixed_point import DEFAULT_ACCELERATION, CreateAccelerator
+from ccpd.utilities.time_budget import OutOfTime
 import numpy as np
-from colorama import Fore
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,8 @@ class OutletLoopCollector:
         self.name = __name__
 
     def Print(self) -> None:
+        from colorama import Fore
+
         for key, value in self.__dict__.items():
             if key == "name":
                 print(f"{Fore.YELLOW}INFO: {__name__}{Fore.RESET}")
@@ -102,6 +107,7 @@ def CalculateFrictionalLosses(
     slip_factor: float,
     surface_roughness: float,
     hydraulic_length: float,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
 ) -> float:
     """
     We first calculate our outlet perimeter and area. Remember that the
@@ -116,7 +122,7 @@ def CalculateFrictionalLosses(
 
     # Enthalpy increase
     relative_roughness = surface_roughness / hydraulic_diameter
-    coefficient_of_friction = CalculateFrictionCoefficient(reynolds_number, relative_roughness)
+    coefficient_of_friction = CalculateFrictionCoefficient(reynolds_number, relative_roughness, friction_method)
     adjusted_friction_coefficient = coefficient_of_friction + 0.0015
 
     return (
@@ -136,13 +142,22 @@ def optimize_mass_flow(
     inputs: Inputs,
     max_iterations: int,
     tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
 ) -> tuple[CompressorStage, dict, int]:
+    """
+    Iterates on the impeller efficiency until the enthalpy losses of the
+    impeller match the assumed efficiency. The iteration count and final
+    residual of the loop are stored in outlet.convergence.
+    """
     outlet_debug_collector = OutletLoopCollector()
+    accelerator = CreateAccelerator(acceleration)
     # []:Initalize
     # Assume an isentropic process for the rotor to begin the iteration
     #   process. This process is to converge to the real pressure at the
     #   outlet of the compressor.
     eta_0 = 1.0
+    residual = float("inf")
     D1 = DiameterStruct(
         compressor_geometry.inlet_hub_diameter,
         compressor_geometry.inlet_mid_diameter,
@@ -163,24 +178,24 @@ def optimize_mass_flow(
     # Loop
     number_of_blades = 0
     geometric_inlet_angle = {}
+    approximate = False
     for iteration in range(0, max_iterations):
         iteration += 1
         logger.debug(f"Iteration: {iteration}")
+        CheckCancelled()
 
         # [A]:Total & Static Temperature
         temperature.total = inlet.thermodynamic_point.temperature.total + (eulerian_work * eta_0 / fluid.specific_heat)
         temperature.static = temperature.total - (V2.magnitude**2) / (2 * fluid.specific_heat)
         logger.debug(f"Outlet temperature: {temperature}")
 
-        outlet.blade.mid_mach_number.absolute = V2.magnitude / np.sqrt(
-            fluid.specific_ratio * fluid.specific_heat * temperature.static
-        )
-
         # [B]:Isentropic Outlet Pressure
         pressure.static = inlet.thermodynamic_point.pressure.static * (
             temperature.static / inlet.thermodynamic_point.temperature.static
         ) ** (inverse_exponent)
 
+        outlet.blade.mid_mach_number.absolute = V2.magnitude / fluid.SpeedOfSound(temperature.static, pressure.static)
+
         pressure.total = pressure.static * (
             1.0
             + ((fluid.specific_ratio - 1.0) / 2.0) * (outlet.blade.mid_mach_number.absolute**2) ** inverse_exponent
@@ -188,9 +203,13 @@ def optimize_mass_flow(
         logger.debug(f"Outlet pressure: {pressure}")
 
         # [C]:Density & Blade Height
-        density.static = pressure.static / (fluid.specific_gas_constant * temperature.static)
+        density.static = fluid.Density(pressure.static, temperature.static)
         logger.debug(f"Outlet density: {density}")
 
+        outlet.thermodynamic_point.pressure = pressure
+        outlet.thermodynamic_point.temperature = temperature
+        outlet.thermodynamic_point.density = density
+
         compressor_geometry.outlet_blade_height = inputs.mass_flow_rate / (
             density.static * np.pi * compressor_geometry.outer_diameter * V2.axial
         )
@@ -234,9 +253,7 @@ def optimize_mass_flow(
         #   geometrical outlet angle and the fluid outlet angle. Here we
         #   need the thickness of our blade that is assumed for now.
         blade_thickness = 0.002
-        inlet_relative_velocity_angles = {
-            key: value for key, value in zip(D1.__dict__.keys(), inlet.blade.__dict__.values())
-        }
+        inlet_relative_velocity_angles = {key: getattr(inlet.blade, key) for key in D1.__dict__.keys()}
         geometric_inlet_angle = calculate_geometric_inlet_angle(
             D1, inlet_relative_velocity_angles, number_of_blades, blade_thickness
         )
@@ -249,12 +266,13 @@ def optimize_mass_flow(
         # From paper provided by Gaetani we found the following relation to
         #   calculate tip losses. The tip clearance was also found via
         #   other papers to be roughly 2% of the exit blade height
-        if inputs.tip_clearance == 0:
-            inputs.tip_clearance = 0.02 * blade_thickness
+        tip_clearance = inputs.tip_clearance
+        if tip_clearance == 0:
+            tip_clearance = 0.02 * blade_thickness
 
         clearance_losses = (
             0.6
-            * inputs.tip_clearance
+            * tip_clearance
             / compressor_geometry.outlet_blade_height
             * V2.tangential
             * np.sqrt(
@@ -302,6 +320,7 @@ def optimize_mass_flow(
             slip_factor,
             inputs.surface_roughness,
             hydraulic_length,
+            friction_method,
         )
         logger.debug(f"friction_losses: {friction_losses:.3}")
 
@@ -314,18 +333,20 @@ def optimize_mass_flow(
         if residual < tolerance:
             logger.info(f"Outlet calculations converged in {iteration} iterations; residual = {residual:0.6f}")
             break
+        elif OutOfTime():
+            logger.warning(f"Outlet loop stopped after {iteration} iterations, time budget exhausted")
+            approximate = True
+            break
 
         # [K]:New Total Enthalpy Change & Eulerian Work
-        isentropic_work_new = eulerian_work * eta_new
-        eta_0 = eta_new
+        eta_0 = accelerator(eta_0, eta_new)
         logger.debug(f"Outlet efficiency: {eta_0}")
 
         if iteration == max_iterations:
+            from colorama import Fore
+
             logger.warning(f"{Fore.YELLOW}WARNING:{Fore.RESET} Max iterations reached")
             break
 
-        outlet.thermodynamic_point.pressure = pressure
-        outlet.thermodynamic_point.temperature = temperature
-        outlet.thermodynamic_point.density = density
-
+    outlet.convergence = ConvergenceReport.FromResidual(iteration, residual, tolerance, approximate=approximate)
     return (outlet, geometric_inlet_angle, number_of_blades)
@@ -75,15 +75,14 @@ def SetupOutletStage(
     )
 
     # Mach Numbers
-    absolute_mach_number = outlet_absolute_velocity.magnitude / np.sqrt(
-        temperature.static * working_fluid.specific_ratio * working_fluid.specific_gas_constant
-    )
-    relative_mach_number = outlet_relative_velocity.magnitude / np.sqrt(
-        temperature.static * working_fluid.specific_ratio * working_fluid.specific_gas_constant
-    )
-    translational_mach_number = outlet_translational_velocity.magnitude / np.sqrt(
-        temperature.static * working_fluid.specific_ratio * working_fluid.specific_gas_constant
+    # The outlet pressure is not known yet, real gases are evaluated at the
+    #   design outlet pressure
+    speed_of_sound = working_fluid.SpeedOfSound(
+        temperature.static, inputs.inlet_total_pressure * inputs.compression_ratio
     )
+    absolute_mach_number = outlet_absolute_velocity.magnitude / speed_of_sound
+    relative_mach_number = outlet_relative_velocity.magnitude / speed_of_sound
+    translational_mach_number = outlet_translational_velocity.magnitude / speed_of_sound
 
     # Setup three dimensional blade
     mid_velocity = VelocityTriangle(
@@ -96,4 +95,4 @@ def SetupOutletStage(
     )
     blade = ThreeDimensionalBlade(_mid=mid_velocity, _mid_mach_number=mid_mach_triangle)
 
-    return CompressorStage(ThermoPoint(_temperature=temperature), blade)
+    return CompressorStage(ThermoPoint(temperature=temperature), blade)
@@ -0,0 +1,71 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from ccpd.stages.outlet.friction_coefficient import FRICTION_METHODS, CalculateFrictionCoefficient
+import numpy as np
+
+
+def Colebrook(friction, reynolds_number, relative_roughness):
+    return 1 / np.sqrt(friction) + 2 * np.log10(relative_roughness / 3.7 + 2.51 / (reynolds_number * np.sqrt(friction)))
+
+
+class TestCalculateFrictionCoefficient(unittest.TestCase):
+    def test_given_laminar_flow_expect_hagen_poiseuille(self):
+        # Given
+        reynolds_number = 1000.0
+
+        # Call
+        result = CalculateFrictionCoefficient(reynolds_number, 1e-3)
+
+        # Expect
+        self.assertAlmostEqual(result, 0.064)
+
+    def test_given_turbulent_flow_expect_colebrook_solution(self):
+        # Given
+        reynolds_number = np.array([1e4, 1e6, 1e9])
+        relative_roughness = np.array([0.0, 1e-4, 1e-2])
+
+        # Call
+        result = CalculateFrictionCoefficient(reynolds_number, relative_roughness)
+
+        # Expect
+        np.testing.assert_allclose(Colebrook(result, reynolds_number, relative_roughness), 0.0, atol=1e-9)
+
+    def test_given_each_method_expect_documented_error_bounds(self):
+        # Given
+        rng = np.random.default_rng(0)
+        reynolds_number = 10.0 ** rng.uniform(np.log10(4000), 8, 1000)
+        relative_roughness = 10.0 ** rng.uniform(-6, np.log10(0.05), 1000)
+        bounds = {"newton": 1e-9, "haaland": 0.015, "swamee_jain": 0.034, "table": 2e-4}
+        reference = CalculateFrictionCoefficient(reynolds_number, relative_roughness)
+
+        for method in FRICTION_METHODS:
+            # Call
+            result = CalculateFrictionCoefficient(reynolds_number, relative_roughness, method)
+
+            # Expect
+            np.testing.assert_allclose(result, reference, rtol=bounds[method], err_msg=method)
+
+    def test_given_transitional_flow_expect_continuous_blend(self):
+        # Given
+        reynolds_number = np.array([2300.0 - 1e-6, 2300.0 + 1e-6, 4000.0 - 1e-6, 4000.0 + 1e-6])
+
+        # Call
+        result = CalculateFrictionCoefficient(reynolds_number, 1e-3)
+
+        # Expect
+        self.assertAlmostEqual(result[0], result[1])
+        self.assertAlmostEqual(result[2], result[3])
+        self.assertTrue(np.all(result > 0.0))
+
+    def test_given_unknown_method_expect_error(self):
+        # Expect
+        with self.assertRaises(AssertionError):
+            CalculateFrictionCoefficient(1e6, 1e-3, "moody")
+
+
+if __name__ == "__main__":
+    unittest.main()
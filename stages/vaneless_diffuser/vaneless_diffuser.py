@@ -7,9 +7,18 @@ Update: December 20, 2023
 import numpy as np
 from ccpd.data_types.centrifugal_compressor import CompressorStage
 from ccpd.data_types.centrifugal_compressor_geometry import CompressorGeometry
+from ccpd.data_types.solver_status import ConvergenceReport
 from ccpd.data_types.thermo_point import ThermoPoint, ThermodynamicVariable
-from ccpd.data_types.three_dimensional_blade import MachTriangle, ThreeDimensionalBlade, VelocityTriangle
+from ccpd.data_types.three_dimensional_blade import (
+    MachTriangle,
+    ThreeDimensionalBlade,
+    VelocityTriangle,
+    VelocityVector,
+)
 from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.fixed_point import DEFAULT_ACCELERATION, CreateAccelerator
+from ccpd.utilities.time_budget import OutOfTime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +31,7 @@ def vaneless_diffuser_calcs(
     mass_flow_rate: float,
     max_iterations: int,
     tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
 ) -> tuple[CompressorStage, float]:
     """
     This function takes a current compressor design and calculates the
@@ -35,12 +45,16 @@ def vaneless_diffuser_calcs(
                  design: Current design structure
                  max_iterations: Max iterations for loop
                  tolerance: Tolerance
+                 acceleration: Fixed point acceleration method, see fixed_point
 
     The following is the output
 
-                 result: Design with added vaneless diffuser structure
+                 result: Design with added vaneless diffuser structure. The
+                     iteration count and final residual of the density loop
+                     are stored in result.convergence
 
     """
+    accelerator = CreateAccelerator(acceleration)
 
     # []:Grab Required Values From Design
     outlet_density = outlet.thermodynamic_point.density  # [kg/m^3] Outlet density
@@ -69,10 +83,13 @@ def vaneless_diffuser_calcs(
     #   average velocity with the compressor outlet conditions. As a
     #   result, set rho3 and V3 to outlet_density and V2 respectively to begin the
     #   optimization process. Note that since the diffuser is basically a
-    #   stator and no work is done. TT3 will equal TT2.
+    #   stator and no work is done. TT3 will equal TT2. V3 is a copy so the
+    #   outlet velocity is left untouched.
     temperature.total = outlet_temperature.total  # [K]
     density.static = outlet_density.static  # [kg/m^3]
-    V3 = V2  # [m/s]
+    V3 = VelocityVector(V2.axial, V2.tangential, V2.magnitude, V2.angle)  # [m/s]
+    residual = float("inf")
+    approximate = False
     M3 = MachTriangle()
     hydraulic_diameter = (4 * np.pi * D3 * b3) / (2 * (np.pi * D3 + b3))  # [m]
     logger.debug(f"Hydraulic diameter: {hydraulic_diameter}")
@@ -80,6 +97,7 @@ def vaneless_diffuser_calcs(
     for iteration in range(0, max_iterations):
         iteration += 1
         logger.debug(f"Iteration: {iteration}")
+        CheckCancelled()
 
         # []:Calculate Average Quantities
         average_density = (outlet_density.static + density.static) / 2  # [kg/m^3]
@@ -102,9 +120,7 @@ def vaneless_diffuser_calcs(
 
         # []:Thermodynamic Values
         temperature.static = temperature.total - V3.magnitude**2 / (2 * working_fluid.specific_heat)
-        M3.absolute = V3.magnitude / np.sqrt(
-            working_fluid.specific_ratio * working_fluid.specific_gas_constant * temperature.static
-        )
+        M3.absolute = V3.magnitude / working_fluid.SpeedOfSound(temperature.static, outlet_pressure.static)
 
         # []:Calculate Losses
         num = cf * D2 / 2 * (1 - (1 / vaneless_diffuser_to_outlet_diameter_ratio) ** 1.5) * V2.magnitude**2
@@ -114,15 +130,12 @@ def vaneless_diffuser_calcs(
         # []:Calculate Isentropic Values
         TT3is = temperature.total - enthalpy_drop / working_fluid.specific_heat
         T3is = TT3is - V3.magnitude**2 / (2 * working_fluid.specific_heat)
-        pressure.total = outlet_pressure.static * (TT3is / outlet_temperature.static) ** (
-            working_fluid.specific_ratio / (working_fluid.specific_ratio - 1)
-        )
-        pressure.static = pressure.total / (1 + (working_fluid.specific_ratio - 1) / 2 * M3.absolute**2) ** (
-            working_fluid.specific_ratio / (working_fluid.specific_ratio - 1)
-        )
+        exponent = working_fluid.inverse_isentropic_exponent
+        pressure.total = outlet_pressure.static * (TT3is / outlet_temperature.static) ** exponent
+        pressure.static = pressure.total / (1 + (working_fluid.specific_ratio - 1) / 2 * M3.absolute**2) ** exponent
 
         # []:Calculate Outlet Density
-        new_density = pressure.static / (working_fluid.specific_gas_constant * temperature.static)
+        new_density = working_fluid.Density(pressure.static, temperature.static)
         logger.debug(f"New density: {new_density}")
 
         # []:Calculate Residual
@@ -134,12 +147,17 @@ def vaneless_diffuser_calcs(
             break
         elif iteration == max_iterations:
             logger.warning(f"WARNING: Max iterations reached\n")
+        elif OutOfTime():
+            logger.warning(f"Vaneless diffuser loop stopped after {iteration} iterations, time budget exhausted")
+            approximate = True
+            break
 
-        density.static = new_density
+        density.static = accelerator(density.static, new_density)
 
     vaneless_diffuser = CompressorStage(
         ThermoPoint(pressure, density, temperature),
-        ThreeDimensionalBlade(_mid=VelocityTriangle(_absolute=V3), _mid_mach_number=M3),
+        ThreeDimensionalBlade(_mid=VelocityTriangle(absolute=V3), _mid_mach_number=M3),
+        _convergence=ConvergenceReport.FromResidual(iteration, residual, tolerance, approximate=approximate),
     )
     logger.debug(f"Vaneless diffuser: {vaneless_diffuser}")
 
@@ -0,0 +1,253 @@
+"""
+Author: Alejandro Valencia
+Design Space Sweep Runner
+Update: October 17, 2026
+
+Splits a sweep over design points across a pool of worker processes. The
+sweep inputs and every output column live in shared memory blocks, so the
+workers read their chunk of inputs and write their chunk of results in
+place and only chunk boundaries travel through the pool.
+
+Each chunk runs the preliminary design loop of main through the batch
+engine. Lanes are independent of each other, so the results do not depend
+on the number of workers nor on the chunk size.
+
+With a store directory the sweep is written to a columnar result store
+instead, see result_store. The workers send the results of every chunk back
+and the chunks are appended in sweep order as they finish, so the results
+are never held in memory as a whole and a partly written store can already
+be read.
+"""
+
+from ccpd.data_types.inputs import InputsII
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.utilities.batch_centrifugal_calcs import (
+    COMPRESSOR_FIELDS,
+    BatchResults,
+    _BroadcastInputs,
+    batch_preliminary_design,
+)
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.result_store import ResultStore, ResultWriter
+from multiprocessing import shared_memory
+import multiprocessing
+import attrs
+import numpy as np
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+INPUT_ROWS = ["specific_diameter", "specific_speed", "end_to_end_efficiency"] + [
+    item.name for item in attrs.fields(InputsII)
+]
+
+
+class _SharedMatrix:
+    """
+    Two dimensional array, one row per column of the sweep, backed by a
+    shared memory block
+    """
+
+    def __init__(self, shape: tuple, dtype, name: str = None) -> None:
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        self.is_owner = name is None
+        self.memory = shared_memory.SharedMemory(name=name, create=self.is_owner, size=max(size, 1))
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.memory.buf)
+        self.spec = (self.memory.name, shape, np.dtype(dtype).str)
+
+    @classmethod
+    def Attach(cls, spec: tuple) -> "_SharedMatrix":
+        name, shape, dtype = spec
+        return cls(shape, np.dtype(dtype), name=name)
+
+    def Close(self) -> None:
+        del self.array
+        self.memory.close()
+        if self.is_owner:
+            self.memory.unlink()
+
+
+# Worker process state, set once per worker by _InitializeWorker
+_worker = {}
+
+
+def _InitializeWorker(
+    input_spec: tuple,
+    output_spec: tuple,
+    status_spec: tuple,
+    fluid: str,
+    material: str,
+    settings: SolverSettings,
+) -> None:
+    _worker["inputs"] = _SharedMatrix.Attach(input_spec)
+    # Without shared outputs, in store mode, chunks return their results
+    _worker["outputs"] = output_spec and _SharedMatrix.Attach(output_spec)
+    _worker["status"] = status_spec and _SharedMatrix.Attach(status_spec)
+    _worker["fluid"] = fluid
+    _worker["material"] = material
+    _worker["working_fluid"] = LoadWorkingFluid(fluid)
+    _worker["settings"] = settings
+
+
+def _RunChunk(bounds: tuple) -> tuple:
+    """
+    Runs a chunk of the sweep. Returns its bounds and, in store mode, its
+    outputs and status
+    """
+    start, stop = bounds
+    if _worker["outputs"] is None:
+        block = (np.empty((len(COMPRESSOR_FIELDS), stop - start)), np.empty(stop - start, dtype=np.int8))
+        outputs, status = block
+    else:
+        block = None
+        outputs, status = _worker["outputs"].array[:, start:stop], _worker["status"].array[start:stop]
+
+    rows = dict(zip(INPUT_ROWS, _worker["inputs"].array[:, start:stop]))
+    result = batch_preliminary_design(
+        rows.pop("specific_diameter"),
+        rows.pop("specific_speed"),
+        rows.pop("end_to_end_efficiency"),
+        _worker["fluid"],
+        _worker["material"],
+        InputsII(**rows),
+        _worker["settings"],
+        working_fluid=_worker["working_fluid"],
+    )
+
+    for row, path in enumerate(COMPRESSOR_FIELDS):
+        outputs[row] = result.columns[path]
+
+    status[:] = result.status
+    return bounds, block
+
+
+def run_sweep(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    fluid: str,
+    material: str,
+    inputs: InputsII,
+    workers: int = None,
+    chunk_size: int = 4096,
+    progress=None,
+    settings: SolverSettings = SolverSettings(),
+    store: str = None,
+) -> BatchResults | ResultStore:
+    """
+    Runs the preliminary design of every point of a sweep. The design
+    parameters and the fields of the inputs are broadcast against each
+    other as in batch_centrifugal_calcs.
+
+    The following are inputs besides the design parameters:
+
+        workers: Number of worker processes, all cores by default. With a
+            single worker the sweep runs in the calling process.
+        chunk_size: Number of design points evaluated per task
+        progress: Optional callable called as progress(completed, total,
+            designs_per_second) every time a chunk finishes
+        settings: Solver settings of batch_preliminary_design
+        store: Optional new directory the sweep is written to, see the
+            module description. The sweep then returns the ResultStore,
+            its rows are in sweep order: column "point" holds the index of
+            the design point of each row and the "inputs.<name>" columns
+            its inputs.
+    """
+    specific_diameter, specific_speed, end_to_end_efficiency, input_columns, _ = _BroadcastInputs(
+        specific_diameter, specific_speed, end_to_end_efficiency, inputs, LoadWorkingFluid(fluid)
+    )
+    number_of_designs = len(specific_diameter)
+    workers = workers or os.cpu_count()
+    chunks = [(start, min(start + chunk_size, number_of_designs)) for start in range(0, number_of_designs, chunk_size)]
+
+    input_matrix = _SharedMatrix((len(INPUT_ROWS), number_of_designs), np.float64)
+    if store is None:
+        output_matrix = _SharedMatrix((len(COMPRESSOR_FIELDS), number_of_designs), np.float64)
+        status_matrix = _SharedMatrix((number_of_designs,), np.int8)
+        writer = None
+    else:
+        output_matrix = status_matrix = None
+        writer = ResultWriter(
+            store,
+            columns={"point": np.int64} | {f"inputs.{name}": np.float64 for name in INPUT_ROWS},
+            metadata={
+                "fluid": fluid,
+                "material": material,
+                "settings": attrs.asdict(settings),
+                "number_of_designs": number_of_designs,
+            },
+        )
+    try:
+        input_matrix.array[:3] = (specific_diameter, specific_speed, end_to_end_efficiency)
+        for row, name in enumerate(INPUT_ROWS[3:]):
+            input_matrix.array[3 + row] = input_columns[name]
+
+        initializer_arguments = (
+            input_matrix.spec,
+            output_matrix and output_matrix.spec,
+            status_matrix and status_matrix.spec,
+            fluid,
+            material,
+            settings,
+        )
+        logger.info(f"Sweep of {number_of_designs} designs in {len(chunks)} chunks on {workers} workers")
+
+        start_time = time.perf_counter()
+        completed = 0
+
+        # Chunks that finished before the ones ahead of them in sweep order
+        #   wait here to be written to the store
+        pending = {}
+        next_start = 0
+
+        def Report(finished: tuple) -> None:
+            nonlocal completed, next_start
+            (start, stop), block = finished
+            completed += stop - start
+            if writer is not None:
+                pending[start] = (stop, block)
+                while next_start in pending:
+                    stop, (outputs, status) = pending.pop(next_start)
+                    columns = {f"inputs.{name}": values for name, values in zip(INPUT_ROWS, input_matrix.array)}
+                    writer.Append(
+                        BatchResults(columns=dict(zip(COMPRESSOR_FIELDS, outputs)), status=status),
+                        {name: values[next_start:stop] for name, values in columns.items()}
+                        | {"point": np.arange(next_start, stop)},
+                    )
+                    next_start = stop
+            rate = completed / max(time.perf_counter() - start_time, 1e-9)
+            logger.info(f"Sweep progress: {completed}/{number_of_designs} designs ({rate:0.1f} designs/s)")
+            if progress is not None:
+                progress(completed, number_of_designs, rate)
+
+        if workers == 1:
+            _InitializeWorker(*initializer_arguments)
+            try:
+                for chunk in chunks:
+                    Report(_RunChunk(chunk))
+            finally:
+                for key in ("inputs", "outputs", "status"):
+                    matrix = _worker.pop(key)
+                    if matrix is not None:
+                        matrix.Close()
+        else:
+            with multiprocessing.Pool(workers, _InitializeWorker, initializer_arguments) as pool:
+                for finished in pool.imap_unordered(_RunChunk, chunks):
+                    Report(finished)
+
+        if writer is not None:
+            return ResultStore(store)
+
+        return BatchResults(
+            columns={path: output_matrix.array[row].copy() for row, path in enumerate(COMPRESSOR_FIELDS)},
+            status=status_matrix.array.copy(),
+        )
+    finally:
+        input_matrix.Close()
+        if writer is None:
+            output_matrix.Close()
+            status_matrix.Close()
+        else:
+            writer.Close()
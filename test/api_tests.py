@@ -0,0 +1,77 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from unittest import mock
+import os
+import subprocess
+import sys
+from ccpd.api import CreateInputsII, design, preliminary_design
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.data_types.working_fluid import WorkingFluid
+
+HYDROGEN = WorkingFluid(
+    {
+        "specific_heat": 14310.0,
+        "specific_ratio": 1.41,
+        "specific_gas_constant": 4120.0,
+        "kinematic_viscosity": 0.88e-5,
+    }
+)
+
+
+class TestApi(unittest.TestCase):
+    def test_given_working_fluid_expect_same_design_as_fluid_name(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+        expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+
+        # Call
+        result = design(CreateDesignInputs(fluid="not in the database"), HYDROGEN)
+
+        # Expect
+        self.assertEqual(result.status, expected.status)
+        self.assertEqual(result.total_efficiency, expected.total_efficiency)
+        self.assertEqual(result.geometry.outer_diameter, expected.geometry.outer_diameter)
+
+    def test_given_working_fluid_expect_no_file_opened(self):
+        # Call
+        with mock.patch("builtins.open", side_effect=AssertionError("file opened")) as opened:
+            result = design(CreateDesignInputs(), HYDROGEN, SolverSettings(solver="newton"))
+            result = design(CreateDesignInputs(), HYDROGEN)
+
+        # Expect
+        opened.assert_not_called()
+        self.assertTrue(result.converged)
+
+    def test_given_newton_solver_expect_main_loop_settings_used(self):
+        # Given
+        settings = SolverSettings(solver="newton", main=LoopSettings(1, 1e-5))
+
+        # Call
+        result = design(CreateDesignInputs(), HYDROGEN, settings)
+
+        # Expect
+        self.assertEqual(result.convergence.iterations, 1)
+        self.assertEqual(result.convergence.status, SolverStatus.MAX_ITERATIONS)
+
+    def test_given_import_expect_logging_not_configured(self):
+        # Given
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        script = "import logging, ccpd.api, ccpd.main; print(len(logging.getLogger().handlers))"
+
+        # Call
+        output = subprocess.run(
+            [sys.executable, "-c", script], env=environment, capture_output=True, text=True, check=True
+        ).stdout
+
+        # Expect
+        self.assertEqual(output.strip(), "0")
+
+
+if __name__ == "__main__":
+    unittest.main()
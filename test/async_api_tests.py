@@ -0,0 +1,85 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import asyncio
+import time
+import attrs
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from ccpd.async_api import design, design_many
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.main import CreateInputsII, preliminary_design
+
+# A zero tolerance, which the settings reject, keeps the inlet loop
+#   iterating until the design is stopped
+with attrs.validators.disabled():
+    RUNAWAY_SETTINGS = SolverSettings(inlet=LoopSettings(10**9, 0.0))
+
+
+class TestAsyncDesign(unittest.TestCase):
+    def test_given_inputs_expect_same_design_as_preliminary_design(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+        expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+
+        # Call
+        result = asyncio.run(design(design_inputs))
+
+        # Expect
+        self.assertEqual(result.total_efficiency, expected.total_efficiency)
+
+    def test_given_runaway_design_and_timeout_expect_worker_thread_released(self):
+        # Given
+        executor = ThreadPoolExecutor(1)
+
+        async def Run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await design(CreateDesignInputs(), RUNAWAY_SETTINGS, executor, timeout=0.1)
+            # The single worker thread must be free for the next design
+            return await design(CreateDesignInputs(), executor=executor, timeout=10.0)
+
+        # Call
+        start = time.perf_counter()
+        result = asyncio.run(Run())
+        executor.shutdown()
+
+        # Expect
+        self.assertTrue(result.converged)
+        self.assertLess(time.perf_counter() - start, 10.0)
+
+    def test_given_runaway_design_in_process_expect_worker_process_released(self):
+        # Given
+        executor = ProcessPoolExecutor(1)
+
+        async def Run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await design(CreateDesignInputs(), RUNAWAY_SETTINGS, executor, timeout=0.5)
+            return await design(CreateDesignInputs(), executor=executor, timeout=30.0)
+
+        # Call
+        result = asyncio.run(Run())
+        executor.shutdown()
+
+        # Expect
+        self.assertTrue(result.converged)
+
+    def test_given_many_designs_expect_results_in_order_with_limited_concurrency(self):
+        # Given
+        requests = [CreateDesignInputs(3.5 + 0.1 * index) for index in range(6)]
+        executor = ThreadPoolExecutor(4)
+
+        # Call
+        results = asyncio.run(design_many(requests, executor=executor, max_concurrency=2))
+        executor.shutdown()
+
+        # Expect
+        for design_inputs, result in zip(requests, results):
+            expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+            self.assertAlmostEqual(result.total_efficiency, expected.total_efficiency)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from unittest import mock
+import argparse
+import csv
+import io
+import json
+import os
+import tempfile
+from ccpd import batch
+from ccpd.batch import DESIGN_COLUMNS, ReadChunks, run_batch
+from ccpd.data_types.inputs import DesignInputs
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.main import CreateInputsII, preliminary_design
+
+
+def CreateRow(specific_diameter: float = 3.8, fluid: str = "hydrogen") -> dict:
+    return {
+        "mass_flow_rate": 1.5,
+        "inlet_total_pressure": 100000.0,
+        "inlet_total_temperature": 303.0,
+        "compression_ratio": 1.25,
+        "surface_roughness": 0.00025,
+        "tip_clearance": 0.0005,
+        "hub_diameter": 0.1,
+        "outlet_angle_guess": 65,
+        "specific_diameter": specific_diameter,
+        "specific_rotational_speed": 0.6,
+        "end_to_end_efficiency": 0.85,
+        "fluid": fluid,
+        "material": "aluminum",
+    }
+
+
+def CreateCatalog(rows: list, input_format: str) -> io.StringIO:
+    stream = io.StringIO(newline="")
+    if input_format == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(DESIGN_COLUMNS)
+        writer.writerows([row[name] for name in DESIGN_COLUMNS] for row in rows)
+    else:
+        stream.writelines(json.dumps(row) + "\n" for row in rows)
+    stream.seek(0)
+    return stream
+
+
+ROWS = [CreateRow(3.6, "hydrogen"), CreateRow(3.8, "air"), CreateRow(4.0, "hydrogen"), CreateRow(3.7, "air")]
+
+
+class TestBatch(unittest.TestCase):
+    def test_given_csv_catalog_expect_columns_in_chunks(self):
+        # Call
+        chunks = list(ReadChunks(CreateCatalog(ROWS, "csv"), "csv", chunk_size=3))
+
+        # Expect
+        self.assertEqual([len(chunk["fluid"]) for chunk in chunks], [3, 1])
+        self.assertEqual(chunks[0]["specific_diameter"].tolist(), [3.6, 3.8, 4.0])
+        self.assertEqual(chunks[1]["fluid"].tolist(), ["air"])
+
+    def test_given_jsonl_catalog_expect_same_designs_as_preliminary_design(self):
+        # Given
+        output = io.StringIO()
+
+        # Call
+        count = run_batch(CreateCatalog(ROWS, "jsonl"), output, "jsonl", "jsonl", chunk_size=3)
+
+        # Expect
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(count, 4)
+        self.assertEqual([response["row"] for response in responses], [0, 1, 2, 3])
+        for row, response in zip(ROWS, responses):
+            design_inputs = DesignInputs(**row)
+            expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+            self.assertEqual(response["status"], expected.status.name)
+            self.assertAlmostEqual(response["design"]["total_efficiency"], expected.total_efficiency, delta=1e-4)
+
+    def test_given_command_without_settings_expect_solver_settings_file(self):
+        # Given
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, "catalog.jsonl"), "w") as catalog:
+            catalog.write(CreateCatalog(ROWS, "jsonl").getvalue())
+        parser = argparse.ArgumentParser()
+        batch.AddArguments(parser)
+        arguments = parser.parse_args(
+            [os.path.join(directory, "catalog.jsonl"), "--output", os.path.join(directory, "results.jsonl")]
+        )
+
+        # Call
+        with mock.patch.object(batch, "LoadSolverSettings", return_value=SolverSettings(main=LoopSettings(1, 1e-5))):
+            batch.RunCommand(arguments)
+
+        # Expect
+        with open(os.path.join(directory, "results.jsonl"), "r") as results:
+            responses = [json.loads(line) for line in results]
+        self.assertEqual([response["status"] for response in responses], ["MAX_ITERATIONS"] * 4)
+
+    def test_given_csv_output_expect_one_header_and_results_independent_of_chunk_size(self):
+        # Given
+        whole, chunked = io.StringIO(), io.StringIO()
+
+        # Call
+        run_batch(CreateCatalog(ROWS, "csv"), whole, "csv", "csv", chunk_size=16)
+        run_batch(CreateCatalog(ROWS, "csv"), chunked, "csv", "csv", chunk_size=1)
+
+        # Expect
+        lines = chunked.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[0].startswith("row,status,total_efficiency"))
+        self.assertEqual(whole.getvalue(), chunked.getvalue())
+
+    def test_given_csv_without_design_column_expect_error(self):
+        # Given
+        stream = io.StringIO("mass_flow_rate,fluid\n1.5,hydrogen\n")
+
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            list(ReadChunks(stream, "csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import io
+import json
+import socket
+import threading
+from ccpd.data_types.inputs import DesignInputs
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.main import CreateInputsII, preliminary_design
+from ccpd.server import DesignServer
+
+
+def CreateRequest(request_id, specific_diameter: float = 3.8) -> dict:
+    return {
+        "id": request_id,
+        "mass_flow_rate": 1.5,
+        "inlet_total_pressure": 100000.0,
+        "inlet_total_temperature": 303.0,
+        "compression_ratio": 1.25,
+        "surface_roughness": 0.00025,
+        "tip_clearance": 0.0005,
+        "hub_diameter": 0.1,
+        "outlet_angle_guess": 65,
+        "specific_diameter": specific_diameter,
+        "specific_rotational_speed": 0.6,
+        "end_to_end_efficiency": 0.85,
+        "fluid": "hydrogen",
+        "material": "aluminum",
+    }
+
+
+class TestDesignServer(unittest.TestCase):
+    def test_given_request_line_expect_same_design_as_preliminary_design(self):
+        # Given
+        request = CreateRequest("a")
+        writer = io.StringIO()
+        design_inputs = DesignInputs(**{key: value for key, value in request.items() if key != "id"})
+        expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+
+        # Call
+        with DesignServer(SolverSettings(), workers=0) as server:
+            count = server.ServeStream(io.StringIO(json.dumps(request) + "\n"), writer)
+
+        # Expect
+        response = json.loads(writer.getvalue())
+        self.assertEqual(count, 1)
+        self.assertEqual(response["id"], "a")
+        self.assertEqual(response["status"], "CONVERGED")
+        self.assertAlmostEqual(response["design"]["total_efficiency"], expected.total_efficiency)
+        self.assertAlmostEqual(response["design"]["geometry.outer_diameter"], expected.geometry.outer_diameter)
+
+    def test_given_invalid_requests_expect_errors_and_following_requests_answered(self):
+        # Given
+        missing_field = CreateRequest(2)
+        missing_field.pop("fluid")
+        lines = ["not json", json.dumps(missing_field), "", json.dumps(CreateRequest(3))]
+        writer = io.StringIO()
+
+        # Call
+        with DesignServer(SolverSettings(), workers=0) as server:
+            server.ServeStream(io.StringIO("\n".join(lines) + "\n"), writer)
+
+        # Expect
+        responses = {response["id"]: response for response in map(json.loads, writer.getvalue().splitlines())}
+        self.assertEqual(set(responses), {None, 2, 3})
+        self.assertIn("error", responses[None])
+        self.assertIn("error", responses[2])
+        self.assertEqual(responses[3]["status"], "CONVERGED")
+
+    def test_given_batch_window_expect_requests_answered_through_batcher(self):
+        # Given
+        lines = [json.dumps(CreateRequest(index, 3.6 + 0.1 * (index % 2))) for index in range(4)]
+        writer = io.StringIO()
+
+        # Call
+        with DesignServer(SolverSettings(), batch_window=0.05) as server:
+            server.ServeStream(io.StringIO("\n".join(lines) + "\n"), writer)
+
+        # Expect
+        responses = {response["id"]: response for response in map(json.loads, writer.getvalue().splitlines())}
+        self.assertEqual(sorted(responses), [0, 1, 2, 3])
+        self.assertTrue(all(response["status"] == "CONVERGED" for response in responses.values()))
+        self.assertEqual(responses[0]["design"], responses[2]["design"])
+
+    def test_given_tcp_connections_expect_every_request_answered(self):
+        # Given
+        requests = [CreateRequest(index, 3.6 + 0.1 * index) for index in range(4)]
+
+        with DesignServer(SolverSettings(), workers=2) as server, server.ServeTcp() as tcp_server:
+            thread = threading.Thread(target=tcp_server.serve_forever, daemon=True)
+            thread.start()
+
+            # Call
+            with socket.create_connection(tcp_server.server_address) as connection:
+                connection.sendall("".join(json.dumps(request) + "\n" for request in requests).encode())
+                connection.shutdown(socket.SHUT_WR)
+                responses = [json.loads(line) for line in connection.makefile("r", encoding="utf-8")]
+            tcp_server.shutdown()
+
+        # Expect
+        self.assertEqual(sorted(response["id"] for response in responses), [0, 1, 2, 3])
+        self.assertTrue(all(response["status"] == "CONVERGED" for response in responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+
+Import time of the library entry points, relative to the import time of
+numpy and attrs which they can not start without, the best of a few runs.
+Measured at 0.3 to 0.5, a module such as scipy adds more than 1.0 on its
+own. Run with
+
+    python -m ccpd.test.startup_benchmark
+
+on two revisions to compare them. It is not a test, the times depend on
+the load of the machine.
+"""
+
+import ccpd
+import os
+import subprocess
+import sys
+
+RUNS = 5
+
+
+def _ImportTimes(module: str) -> dict:
+    # Self time in microseconds of every module imported, from -X importtime
+    environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(ccpd.__file__))))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines()[1:]:
+        self_time, _, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(self_time)
+    return times
+
+
+def _Overhead(module: str) -> float:
+    baselines = [_ImportTimes("numpy, attrs") for _ in range(RUNS)]
+    overhead = min(
+        sum(time for name, time in _ImportTimes(module).items() if name not in baselines[0]) for _ in range(RUNS)
+    )
+    return overhead / min(sum(baseline.values()) for baseline in baselines)
+
+
+def RunBenchmark() -> dict:
+    return {f"{module} import time ratio": _Overhead(module) for module in ["ccpd.api", "ccpd.main"]}
+
+
+if __name__ == "__main__":
+    for name, value in RunBenchmark().items():
+        print(f"{name:40s}{value:12.3f}")
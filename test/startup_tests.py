@@ -0,0 +1,42 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import ccpd
+import os
+import subprocess
+import sys
+
+# Modules a single design never needs, imported on first use only
+DEFERRED_MODULES = [
+    "ccpd.batch",
+    "ccpd.utilities.batch_centrifugal_calcs",
+    "ccpd.utilities.design_cache",
+    "ccpd.utilities.newton_solver",
+    "colorama",
+    "hashlib",
+    "scipy",
+    "tempfile",
+]
+
+
+def _Run(code: str) -> subprocess.CompletedProcess:
+    environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(ccpd.__file__))))
+    return subprocess.run([sys.executable, "-c", code], env=environment, capture_output=True, text=True, check=True)
+
+
+class TestStartup(unittest.TestCase):
+    def test_given_library_import_expect_deferred_modules_not_imported(self):
+        for module in ["ccpd.api", "ccpd.main"]:
+            # Call
+            imported = _Run(f"import sys, {module}; print('\\n'.join(sys.modules))").stdout.split()
+
+            # Expect
+            for deferred in DEFERRED_MODULES:
+                self.assertNotIn(deferred, imported, f"{module} imports {deferred}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import os
+import tempfile
+import numpy as np
+from ccpd.api import CreateInputsII
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.sweep import run_sweep
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+
+
+class TestRunSweep(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inputs = CreateInputsII(CreateDesignInputs())
+        self.specific_diameter = np.linspace(3.4, 4.2, 25)
+        self.specific_speed = np.linspace(0.55, 0.65, 25)
+        return super().setUp()
+
+    def test_given_different_worker_counts_expect_identical_results(self):
+        # Call
+        serial = run_sweep(
+            self.specific_diameter, self.specific_speed, 0.85, "hydrogen", "aluminum", self.inputs, workers=1
+        )
+        parallel = run_sweep(
+            self.specific_diameter,
+            self.specific_speed,
+            0.85,
+            "hydrogen",
+            "aluminum",
+            self.inputs,
+            workers=2,
+            chunk_size=7,
+        )
+
+        # Expect
+        np.testing.assert_array_equal(serial.status, parallel.status)
+        for path, column in serial.columns.items():
+            np.testing.assert_array_equal(column, parallel.columns[path], err_msg=path)
+
+    def test_given_sweep_expect_same_results_as_batch_design(self):
+        # Given
+        reports = []
+
+        # Call
+        result = run_sweep(
+            self.specific_diameter,
+            self.specific_speed,
+            0.85,
+            "hydrogen",
+            "aluminum",
+            self.inputs,
+            workers=1,
+            chunk_size=10,
+            progress=lambda completed, total, rate: reports.append((completed, total)),
+        )
+        expected = batch_preliminary_design(
+            self.specific_diameter, self.specific_speed, 0.85, "hydrogen", "aluminum", self.inputs
+        )
+
+        # Expect
+        np.testing.assert_allclose(result["total_efficiency"], expected["total_efficiency"])
+        np.testing.assert_allclose(result["geometry.outer_diameter"], expected["geometry.outer_diameter"])
+        self.assertEqual(reports[-1], (25, 25))
+        self.assertEqual(len(reports), 3)
+
+    def test_given_store_expect_same_results_in_sweep_order(self):
+        # Given
+        directory = os.path.join(tempfile.mkdtemp(), "sweep")
+        expected = run_sweep(
+            self.specific_diameter, self.specific_speed, 0.85, "hydrogen", "aluminum", self.inputs, workers=1
+        )
+
+        # Call
+        store = run_sweep(
+            self.specific_diameter[::-1],
+            self.specific_speed[::-1],
+            0.85,
+            "hydrogen",
+            "aluminum",
+            self.inputs,
+            workers=2,
+            chunk_size=4,
+            store=directory,
+        )
+
+        # Expect
+        self.assertEqual(len(store), 25)
+        self.assertEqual(store.metadata["fluid"], "hydrogen")
+        np.testing.assert_array_equal(store["point"], np.arange(25))
+        np.testing.assert_array_equal(store["inputs.specific_diameter"], self.specific_diameter[::-1])
+        result = store.Rows()
+        np.testing.assert_array_equal(result.status, expected.status[::-1])
+        for path, column in expected.columns.items():
+            np.testing.assert_array_equal(result[path], column[::-1], err_msg=path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.compressor_batch import CompressorBatch
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+
+THREADS = 8
+ROUNDS = 3
+
+# Switch threads every microsecond instead of every 5 ms, so designs
+#   interleave inside their loops
+SWITCH_INTERVAL = 1e-6
+
+
+def CreateCases() -> list[tuple]:
+    settings = [SolverSettings(), SolverSettings(gas_model="tabulated"), SolverSettings(solver="newton")]
+    return [
+        (CreateDesignInputs(specific_diameter, fluid), solver_settings)
+        for specific_diameter in (3.4, 3.6, 3.8, 4.0)
+        for fluid in ("air", "hydrogen", "hydrogen_methane_20")
+        for solver_settings in settings
+    ]
+
+
+def Design(case: tuple) -> CentrifugalCompressor:
+    design_inputs, settings = case
+    return preliminary_design(design_inputs, CreateInputsII(design_inputs), settings)
+
+
+class TestThreadSafety(unittest.TestCase):
+    def test_given_new_compressors_expect_no_shared_stages(self):
+        # Given
+        first, second = CentrifugalCompressor(), CentrifugalCompressor()
+
+        # Call
+        first.geometry.outer_diameter = 0.3
+        first.inlet.thermodynamic_point.pressure.total = 1e5
+
+        # Expect
+        for name in ["inlet", "outlet", "vaneless_diffuser", "diffuser", "geometry"]:
+            self.assertIsNot(getattr(first, name), getattr(second, name))
+        self.assertEqual(second.geometry.outer_diameter, 0.0)
+        self.assertEqual(second.inlet.thermodynamic_point.pressure.total, 0.0)
+
+    def test_given_parallel_designs_expect_same_designs_as_serial(self):
+        # Given
+        cases = CreateCases()
+        expected = CompressorBatch.FromCompressors([Design(case) for case in cases]).values
+        order = list(range(0, len(cases)))
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SWITCH_INTERVAL)
+
+        try:
+            for round in range(0, ROUNDS):
+                # Call
+                random.Random(round).shuffle(order)
+                with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                    designs = list(executor.map(Design, [cases[index] for index in order]))
+
+                # Expect
+                np.testing.assert_array_equal(CompressorBatch.FromCompressors(designs).values, expected[:, order])
+                self.assertEqual(len({id(design.geometry) for design in designs}), len(designs))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_given_zero_tip_clearance_expect_inputs_unchanged(self):
+        # Given
+        design_inputs = CreateDesignInputs(3.8, "air", tip_clearance=0.0)
+        inputs = CreateInputsII(design_inputs)
+
+        # Call
+        design = preliminary_design(design_inputs, inputs, SolverSettings())
+
+        # Expect
+        self.assertEqual(inputs.tip_clearance, 0.0)
+        self.assertTrue(np.isfinite(design.total_efficiency))
+
+
+if __name__ == "__main__":
+    unittest.main()
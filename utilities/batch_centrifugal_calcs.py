@@ -0,0 +1,1031 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Batch (Vectorized) Calculations
+Update: October 17, 2026
+
+This module mirrors centrifugal_calcs for whole arrays of design points.
+Every quantity is a NumPy array with one entry (lane) per design point and
+each iterative loop keeps a per-lane convergence mask, so lanes stop
+iterating as soon as they converge while the rest carry on. The stage
+kernels follow the scalar stage modules line by line and the loops use the
+same fixed point accelerators, so a lane of the batch reproduces the
+corresponding scalar design, convergence reports included.
+"""
+
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.compressor_batch import COMPRESSOR_FIELDS, BuildCompressor, CompressorBatch
+from ccpd.data_types.inputs import InputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.stages.inlet.tip_diameter import ComputeTipDiameter
+from ccpd.stages.outlet.friction_coefficient import DEFAULT_FRICTION_METHOD, CalculateFrictionCoefficient
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.fixed_point import DEFAULT_ACCELERATION, CreateAccelerator
+from ccpd.utilities.gas_properties import FluidAt
+from ccpd.utilities.real_gas import WithEquationOfState
+from dataclasses import dataclass, field
+import attrs
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+DIVERGENCE_THRESHOLD = 1e6
+
+# Unknowns of the stage loops, in the order the stages are solved
+STAGE_UNKNOWNS = ["inlet_density", "impeller_efficiency", "vaneless_density", "vaneless_velocity"]
+
+
+@dataclass
+class BatchResults:
+    """
+    Batch of centrifugal compressor designs. Each field of
+    CentrifugalCompressor is stored as a column keyed by its dotted path,
+    e.g. "inlet.blade.tip.relative.magnitude" or "outlet.convergence.status".
+    The status of each design is the most severe status of its loops, as in
+    CentrifugalCompressor.status. batch_preliminary_design also returns the
+    final value of the unknown of each stage loop, see STAGE_UNKNOWNS, to
+    warm start other designs.
+    """
+
+    columns: dict = field(default_factory=dict)
+    status: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int8))
+    unknowns: dict = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def __getitem__(self, path: str) -> np.ndarray:
+        return self.columns[path]
+
+    def design(self, index: int) -> CentrifugalCompressor:
+        """
+        Builds the CentrifugalCompressor object of a single lane
+        """
+        return BuildCompressor([self.columns[path][index].item() for path in COMPRESSOR_FIELDS])
+
+    @property
+    def compressors(self) -> CompressorBatch:
+        """
+        The designs as a CompressorBatch, a copy of the columns
+        """
+        return CompressorBatch.FromColumns(self.columns)
+
+
+def _LoopStatus(residuals: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Array version of ConvergenceReport.FromResidual
+    """
+    status = np.full(len(residuals), SolverStatus.MAX_ITERATIONS, dtype=np.int8)
+    status[residuals < tolerance] = SolverStatus.CONVERGED
+    status[~(residuals <= DIVERGENCE_THRESHOLD)] = SolverStatus.DIVERGED
+    return status
+
+
+def _StoreConvergence(
+    columns: dict,
+    prefix: str,
+    iterations: np.ndarray,
+    residuals: np.ndarray,
+    status: np.ndarray,
+) -> None:
+    columns[f"{prefix}convergence.iterations"] = iterations.astype(float)
+    columns[f"{prefix}convergence.residual"] = residuals
+    columns[f"{prefix}convergence.status"] = status.astype(float)
+
+
+def _MaskedIteration(
+    update,
+    state: dict,
+    parameters: dict,
+    max_iterations: int,
+    tolerance,
+    acceleration: str = DEFAULT_ACCELERATION,
+) -> tuple[dict, dict, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drives a vectorized fixed point iteration with a per-lane convergence
+    mask. Only the lanes that are still active are evaluated, the others
+    keep the values of the iteration in which they stopped.
+
+    The update function is called as update(state, **parameters) with the
+    active lanes of both and returns the residual, the state for the next
+    iteration and a dictionary with the quantities computed in the
+    iteration. The first entry of the state is the unknown of the loop, its
+    next guess goes through the fixed point accelerator. The tolerance may
+    be given per lane. Parameters are sliced by lane, so a working fluid
+    whose properties differ per lane is passed as a parameter.
+    """
+    number_of_lanes = len(next(iter(state.values())))
+    tolerance = np.broadcast_to(np.asarray(tolerance, dtype=float), (number_of_lanes,))
+    unknown = next(iter(state))
+    accelerator = CreateAccelerator(acceleration, number_of_lanes)
+    active = np.ones(number_of_lanes, dtype=bool)
+    iterations = np.zeros(number_of_lanes, dtype=np.int64)
+    residuals = np.full(number_of_lanes, np.inf)
+    outputs = {}
+
+    for iteration in range(0, max_iterations):
+        iteration += 1
+        lanes = np.flatnonzero(active)
+        if lanes.size == 0:
+            break
+        CheckCancelled()
+
+        residual, next_state, values = update(
+            {key: value[lanes] for key, value in state.items()},
+            **{key: value[lanes] for key, value in parameters.items()},
+        )
+
+        for key, value in values.items():
+            if key not in outputs:
+                outputs[key] = np.zeros(number_of_lanes)
+            outputs[key][lanes] = value
+        iterations[lanes] = iteration
+        residuals[lanes] = residual
+
+        finished = (residual < tolerance[lanes]) | ~np.isfinite(residual)
+        next_state[unknown] = accelerator(state[unknown][lanes], next_state[unknown], lanes)
+        for key, value in next_state.items():
+            state[key][lanes[~finished]] = value[~finished]
+        active[lanes[finished]] = False
+
+    status = _LoopStatus(residuals, tolerance)
+    logger.info(
+        f"Batch loop finished in {iterations.max(initial=0)} iterations: "
+        + f"{np.count_nonzero(status == SolverStatus.CONVERGED)}/{number_of_lanes} lanes converged"
+    )
+    return state, outputs, status, iterations, residuals
+
+
+def _InletDensityUpdate(
+    state: dict,
+    rotational_speed: np.ndarray,
+    mass_flow_rate: np.ndarray,
+    hub_diameter: np.ndarray,
+    outer_diameter: np.ndarray,
+    total_temperature: np.ndarray,
+    total_pressure: np.ndarray,
+    fluid: WorkingFluid = None,
+) -> tuple[np.ndarray, dict, dict]:
+    static_density_guess = state["density"]
+    tip_diameter = ComputeTipDiameter(
+        rotational_speed,
+        mass_flow_rate,
+        static_density_guess,
+        hub_diameter,
+        bounds=[0.4 * outer_diameter, 0.6 * outer_diameter],
+    )
+    inlet_flow_area = np.pi / 4.0 * (tip_diameter**2 - hub_diameter**2)
+    velocity = mass_flow_rate / (static_density_guess * inlet_flow_area)
+
+    static_temperature = total_temperature - velocity**2 / (2 * fluid.specific_heat)
+    mach_number = velocity / fluid.SpeedOfSound(static_temperature, total_pressure)
+    static_pressure = total_pressure / (1 + (fluid.specific_ratio - 1) / 2 * mach_number**2) ** (
+        fluid.inverse_isentropic_exponent
+    )
+    static_density = fluid.Density(static_pressure, static_temperature)
+
+    residual = np.abs(static_density - static_density_guess) / static_density_guess
+    values = {
+        "tip_diameter": tip_diameter,
+        "flow_area": inlet_flow_area,
+        "velocity": velocity,
+        "static_temperature": static_temperature,
+        "static_pressure": static_pressure,
+        "static_density": static_density,
+    }
+    return residual, {"density": static_density}, values
+
+
+def BatchInletLoop(
+    columns: dict,
+    fluid: WorkingFluid,
+    static_density_guess: np.ndarray,
+    rotational_speed: np.ndarray,
+    mass_flow_rate: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of InletLoop followed by the inlet geometry, free vortex
+    and remaining inlet quantities of centrifugal_calcs. Returns the status
+    of the density loop of each lane and its final density guess.
+    """
+    hub_diameter = columns["geometry.inlet_hub_diameter"]
+    outer_diameter = columns["geometry.outer_diameter"]
+    total_temperature = columns["inlet.thermodynamic_point.temperature.total"]
+    total_pressure = columns["inlet.thermodynamic_point.pressure.total"]
+
+    state, values, status, iterations, residuals = _MaskedIteration(
+        _InletDensityUpdate,
+        {"density": np.array(static_density_guess, dtype=float)},
+        {
+            "fluid": fluid,
+            "rotational_speed": rotational_speed,
+            "mass_flow_rate": mass_flow_rate,
+            "hub_diameter": hub_diameter,
+            "outer_diameter": outer_diameter,
+            "total_temperature": total_temperature,
+            "total_pressure": total_pressure,
+        },
+        max_iterations,
+        tolerance,
+        acceleration,
+    )
+    _StoreConvergence(columns, "inlet.", iterations, residuals, status)
+    velocity = values["velocity"]
+    tip_diameter = values["tip_diameter"]
+
+    columns["inlet.flow_area"] = values["flow_area"]
+    columns["inlet.thermodynamic_point.pressure.static"] = values["static_pressure"]
+    columns["inlet.thermodynamic_point.density.static"] = values["static_density"]
+    columns["inlet.blade.mid.absolute.magnitude"] = velocity
+    columns["inlet.blade.mid.absolute.axial"] = velocity * np.cos(0.0)
+    columns["inlet.blade.mid.absolute.tangential"] = velocity * np.sin(0.0)
+
+    # [F.1]:Inlet Geometry
+    mid_diameter = (tip_diameter + hub_diameter) / 2.0
+    columns["geometry.inlet_tip_diameter"] = tip_diameter
+    columns["geometry.inlet_blade_height"] = (tip_diameter - hub_diameter) / 2.0
+    columns["geometry.inlet_mid_diameter"] = mid_diameter
+    columns["geometry.inlet_blade_ratio"] = hub_diameter / tip_diameter
+    columns["geometry.outer_blade_height_ratio"] = tip_diameter / outer_diameter
+
+    # Free vortex method
+    speed_of_sound = fluid.SpeedOfSound(total_temperature, total_pressure)
+    columns["inlet.thermodynamic_point.speed_of_sound"] = speed_of_sound
+    columns["inlet.blade.mid_mach_number.absolute"] = velocity / speed_of_sound
+    for section, diameter in zip(("hub", "mid", "tip"), (hub_diameter, mid_diameter, tip_diameter)):
+        translational_velocity = rotational_speed * (diameter / 2.0)
+        relative_tangential = columns["inlet.blade.mid.absolute.tangential"] - translational_velocity
+        relative_magnitude = np.sqrt(np.square(velocity) + np.square(relative_tangential))
+        columns[f"inlet.blade.{section}.translational.magnitude"] = translational_velocity
+        columns[f"inlet.blade.{section}.relative.tangential"] = relative_tangential
+        columns[f"inlet.blade.{section}.relative.axial"] = velocity
+        columns[f"inlet.blade.{section}.relative.magnitude"] = relative_magnitude
+        columns[f"inlet.blade.{section}.relative.angle"] = np.arctan2(relative_tangential, velocity)
+        columns[f"inlet.blade.{section}_mach_number.relative"] = relative_magnitude / speed_of_sound
+
+    columns["inlet.thermodynamic_point.temperature.static"] = total_temperature - velocity**2 / (
+        2 * fluid.specific_heat
+    )
+    return status, state["density"]
+
+
+def BatchSetupOutletStage(
+    columns: dict,
+    alpha2: float,
+    eulerian_work: np.ndarray,
+    fluid: WorkingFluid,
+    design_outlet_pressure: np.ndarray,
+) -> None:
+    """
+    Array version of SetupOutletStage, real gases are evaluated at the
+    design outlet pressure
+    """
+    translational_velocity = columns["outlet.blade.mid.translational.magnitude"]
+
+    # Absolute Velocity
+    absolute_tangential = eulerian_work / translational_velocity
+    absolute_magnitude = absolute_tangential / np.sin(alpha2)
+    absolute_axial = absolute_magnitude * np.cos(alpha2)
+    columns["outlet.blade.mid.absolute.angle"] = np.full_like(absolute_tangential, alpha2)
+    columns["outlet.blade.mid.absolute.tangential"] = absolute_tangential
+    columns["outlet.blade.mid.absolute.magnitude"] = absolute_magnitude
+    columns["outlet.blade.mid.absolute.axial"] = absolute_axial
+
+    # Relative Velocity
+    relative_tangential = absolute_tangential - translational_velocity
+    columns["outlet.blade.mid.relative.tangential"] = relative_tangential
+    columns["outlet.blade.mid.relative.axial"] = absolute_axial
+    columns["outlet.blade.mid.relative.angle"] = np.arctan(relative_tangential / absolute_axial)
+    columns["outlet.blade.mid.relative.magnitude"] = np.sqrt(relative_tangential**2 + absolute_axial**2)
+
+    # Total & Static Temperature
+    total_temperature = columns["inlet.thermodynamic_point.temperature.total"] + eulerian_work / fluid.specific_heat
+    static_temperature = total_temperature - absolute_magnitude**2 / (2 * fluid.specific_heat)
+    columns["outlet.thermodynamic_point.temperature.total"] = total_temperature
+    columns["outlet.thermodynamic_point.temperature.static"] = static_temperature
+
+    # Mach Numbers
+    speed_of_sound = fluid.SpeedOfSound(static_temperature, design_outlet_pressure)
+    columns["outlet.blade.mid_mach_number.absolute"] = absolute_magnitude / speed_of_sound
+    columns["outlet.blade.mid_mach_number.relative"] = columns["outlet.blade.mid.relative.magnitude"] / speed_of_sound
+    columns["outlet.blade.mid_mach_number.translational"] = translational_velocity / speed_of_sound
+
+
+def _OutletEfficiencyUpdate(
+    state: dict,
+    inlet_total_temperature: np.ndarray,
+    inlet_static_temperature: np.ndarray,
+    inlet_static_pressure: np.ndarray,
+    inlet_axial_velocity: np.ndarray,
+    inlet_relative_magnitude: np.ndarray,
+    inlet_relative_angle: np.ndarray,
+    inlet_hub_diameter: np.ndarray,
+    inlet_mid_diameter: np.ndarray,
+    inlet_tip_diameter: np.ndarray,
+    outer_diameter: np.ndarray,
+    absolute_magnitude: np.ndarray,
+    absolute_tangential: np.ndarray,
+    absolute_axial: np.ndarray,
+    relative_magnitude: np.ndarray,
+    relative_angle: np.ndarray,
+    translational_magnitude: np.ndarray,
+    eulerian_work: np.ndarray,
+    mass_flow_rate: np.ndarray,
+    tip_clearance: np.ndarray,
+    surface_roughness: np.ndarray,
+    fluid: WorkingFluid = None,
+    inverse_exponent: float = None,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
+) -> tuple[np.ndarray, dict, dict]:
+    eta_0 = state["efficiency"]
+
+    # [A]:Total & Static Temperature
+    total_temperature = inlet_total_temperature + (eulerian_work * eta_0 / fluid.specific_heat)
+    static_temperature = total_temperature - (absolute_magnitude**2) / (2 * fluid.specific_heat)
+
+    # [B]:Isentropic Outlet Pressure
+    static_pressure = inlet_static_pressure * (static_temperature / inlet_static_temperature) ** inverse_exponent
+    mach_number = absolute_magnitude / fluid.SpeedOfSound(static_temperature, static_pressure)
+    total_pressure = static_pressure * (
+        1.0 + ((fluid.specific_ratio - 1.0) / 2.0) * (mach_number**2) ** inverse_exponent
+    )
+
+    # [C]:Density & Blade Height
+    static_density = fluid.Density(static_pressure, static_temperature)
+    blade_height = mass_flow_rate / (static_density * np.pi * outer_diameter * absolute_axial)
+
+    # [F]:Number of Blades
+    average_inlet_relative_angle = (relative_angle + inlet_relative_angle[:, 1]) / 2
+    inverse_solidity = 0.4
+    number_of_blades = (
+        2
+        * (np.pi * np.cos(average_inlet_relative_angle))
+        / (inverse_solidity * np.log(outer_diameter / inlet_mid_diameter))
+    )
+    number_of_blades = np.ceil(number_of_blades) + 1
+    pitch = np.pi * outer_diameter / number_of_blades
+
+    # [G]:Slip Factor
+    slip_factor = 1 - 0.63 * np.pi / number_of_blades
+
+    # [I.1]:Incidence Losses At The Hub
+    blade_thickness = 0.002
+    section_area = np.pi * inlet_hub_diameter - number_of_blades * blade_thickness
+    optimal_area = np.pi * inlet_hub_diameter
+    geometric_inlet_angle = np.arctan((section_area / optimal_area) * np.tan(inlet_relative_angle[:, 0]))
+    incidence = geometric_inlet_angle - inlet_relative_angle[:, 0]
+    incidence_losses = ((inlet_relative_magnitude[:, 0] * np.sin(incidence)) ** 2) / 2.0
+
+    # [I.2]:Tip Clearance Losses
+    tip_clearance = np.where(tip_clearance == 0, 0.02 * blade_thickness, tip_clearance)
+    clearance_losses = (
+        0.6
+        * tip_clearance
+        / blade_height
+        * absolute_tangential
+        * np.sqrt(
+            4
+            * np.pi
+            / (blade_height * number_of_blades)
+            * np.ceil(
+                (inlet_tip_diameter**2 / 4 - inlet_hub_diameter**2 / 4)
+                / ((outer_diameter / 2 - inlet_tip_diameter / 2) * (1 + static_pressure / inlet_static_pressure))
+            )
+            * absolute_tangential
+            * inlet_axial_velocity
+        )
+    )
+
+    # [I.3]:Diffusion Losses
+    hydraulic_length = (outer_diameter / 2 - inlet_mid_diameter / 2) / np.cos(average_inlet_relative_angle)
+    average_relative_inlet_velocity = np.mean(inlet_relative_magnitude, axis=1)
+    diffusion_factor = (
+        1
+        - relative_magnitude / average_relative_inlet_velocity
+        + (np.pi * outer_diameter * absolute_tangential)
+        / (2 * number_of_blades * hydraulic_length * average_relative_inlet_velocity)
+        + 0.1
+        * (inlet_tip_diameter / 2 - inlet_hub_diameter / 2 + blade_height)
+        / (outer_diameter / 2 - inlet_tip_diameter / 2)
+        * (1 + relative_magnitude / average_relative_inlet_velocity)
+    )
+    diffusion_losses = 0.05 * diffusion_factor**2 * translational_magnitude**2
+
+    # [I.4]:Friction Losses
+    outlet_flow_area = np.pi * outer_diameter * blade_height
+    outlet_flow_perimeter = number_of_blades * (2 * blade_height + 2 * pitch)
+    hydraulic_diameter = 4 * outlet_flow_area / outlet_flow_perimeter
+    reynolds_number = static_pressure * relative_magnitude * hydraulic_diameter / slip_factor
+    coefficient_of_friction = CalculateFrictionCoefficient(
+        reynolds_number, surface_roughness / hydraulic_diameter, friction_method
+    )
+    friction_losses = (
+        4 * ((coefficient_of_friction + 0.0015) * hydraulic_length * relative_magnitude**2) / (2 * hydraulic_diameter)
+    )
+
+    # [J]:Calculate New Efficiency
+    sum_of_enthalpy_losses = diffusion_losses + friction_losses + clearance_losses + incidence_losses
+    eta_new = (eulerian_work - sum_of_enthalpy_losses) / eulerian_work
+    residual = np.abs(eta_new - eta_0) / eta_0
+
+    values = {
+        "total_temperature": total_temperature,
+        "static_temperature": static_temperature,
+        "mach_number": mach_number,
+        "static_pressure": static_pressure,
+        "total_pressure": total_pressure,
+        "static_density": static_density,
+        "blade_height": blade_height,
+        "number_of_blades": number_of_blades,
+    }
+    return residual, {"efficiency": eta_new}, values
+
+
+def batch_optimize_mass_flow(
+    columns: dict,
+    fluid: WorkingFluid,
+    inverse_exponent,
+    eulerian_work: np.ndarray,
+    mass_flow_rate: np.ndarray,
+    tip_clearance: np.ndarray,
+    surface_roughness: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
+    efficiency_guess: np.ndarray = None,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of optimize_mass_flow. The loop starts from an isentropic
+    impeller unless an efficiency guess is given. Returns the status of the
+    efficiency loop of each lane and its final efficiency guess.
+    """
+
+    def update(state, **parameters):
+        return _OutletEfficiencyUpdate(state, friction_method=friction_method, **parameters)
+
+    sections = ("hub", "mid", "tip")
+    if efficiency_guess is None:
+        efficiency_guess = np.ones_like(eulerian_work)
+
+    state, values, status, iterations, residuals = _MaskedIteration(
+        update,
+        {"efficiency": np.array(efficiency_guess, dtype=float)},
+        {
+            "fluid": fluid,
+            "inverse_exponent": np.broadcast_to(np.asarray(inverse_exponent, dtype=float), eulerian_work.shape),
+            "inlet_total_temperature": columns["inlet.thermodynamic_point.temperature.total"],
+            "inlet_static_temperature": columns["inlet.thermodynamic_point.temperature.static"],
+            "inlet_static_pressure": columns["inlet.thermodynamic_point.pressure.static"],
+            "inlet_axial_velocity": columns["inlet.blade.mid.absolute.axial"],
+            "inlet_relative_magnitude": np.stack(
+                [columns[f"inlet.blade.{section}.relative.magnitude"] for section in sections], axis=1
+            ),
+            "inlet_relative_angle": np.stack(
+                [columns[f"inlet.blade.{section}.relative.angle"] for section in sections], axis=1
+            ),
+            "inlet_hub_diameter": columns["geometry.inlet_hub_diameter"],
+            "inlet_mid_diameter": columns["geometry.inlet_mid_diameter"],
+            "inlet_tip_diameter": columns["geometry.inlet_tip_diameter"],
+            "outer_diameter": columns["geometry.outer_diameter"],
+            "absolute_magnitude": columns["outlet.blade.mid.absolute.magnitude"],
+            "absolute_tangential": columns["outlet.blade.mid.absolute.tangential"],
+            "absolute_axial": columns["outlet.blade.mid.absolute.axial"],
+            "relative_magnitude": columns["outlet.blade.mid.relative.magnitude"],
+            "relative_angle": columns["outlet.blade.mid.relative.angle"],
+            "translational_magnitude": columns["outlet.blade.mid.translational.magnitude"],
+            "eulerian_work": eulerian_work,
+            "mass_flow_rate": mass_flow_rate,
+            "tip_clearance": tip_clearance,
+            "surface_roughness": surface_roughness,
+        },
+        max_iterations,
+        tolerance,
+        acceleration,
+    )
+    _StoreConvergence(columns, "outlet.", iterations, residuals, status)
+
+    prefix = "outlet.thermodynamic_point"
+    columns[f"{prefix}.temperature.total"] = values["total_temperature"]
+    columns[f"{prefix}.temperature.static"] = values["static_temperature"]
+    columns[f"{prefix}.pressure.static"] = values["static_pressure"]
+    columns[f"{prefix}.pressure.total"] = values["total_pressure"]
+    columns[f"{prefix}.density.static"] = values["static_density"]
+
+    columns["outlet.blade.mid_mach_number.absolute"] = values["mach_number"]
+    columns["geometry.outlet_blade_height"] = values["blade_height"]
+    columns["geometry.outer_blade_height_ratio"] = values["blade_height"] / (columns["geometry.outer_diameter"] / 2)
+    return status, state["efficiency"]
+
+
+def _VanelessDensityUpdate(
+    state: dict,
+    outlet_static_density: np.ndarray,
+    outlet_static_pressure: np.ndarray,
+    outlet_static_temperature: np.ndarray,
+    outlet_magnitude: np.ndarray,
+    outlet_tangential: np.ndarray,
+    outlet_angle: np.ndarray,
+    total_temperature: np.ndarray,
+    outer_diameter: np.ndarray,
+    vaneless_diameter: np.ndarray,
+    blade_height: np.ndarray,
+    hydraulic_diameter: np.ndarray,
+    mass_flow_rate: np.ndarray,
+    fluid: WorkingFluid = None,
+    diameter_ratio: float = None,
+) -> tuple[np.ndarray, dict, dict]:
+    density = state["density"]
+
+    # []:Calculate Average Quantities
+    average_density = (outlet_static_density + density) / 2
+    average_velocity = (state["magnitude"] + outlet_magnitude) / 2
+    reynolds_number = average_density * hydraulic_diameter * average_velocity / fluid.kinematic_viscosity
+
+    # []:Calculate Friction Coefficient
+    cf = 0.02 * (1.8 * 10**5 / reynolds_number)
+
+    # []:Vanless Diffuser Outlet Velocity
+    den = (
+        diameter_ratio
+        + cf
+        / 2
+        * np.pi
+        * outlet_static_density
+        * outlet_tangential
+        * vaneless_diameter
+        * (vaneless_diameter - outer_diameter)
+        / mass_flow_rate
+    )
+    tangential = outlet_tangential / den
+    axial = mass_flow_rate / (np.pi * vaneless_diameter * blade_height * density)
+    magnitude = np.sqrt(np.square(axial) + np.square(tangential))
+    angle = np.arctan2(tangential, axial)
+
+    # []:Thermodynamic Values
+    static_temperature = total_temperature - magnitude**2 / (2 * fluid.specific_heat)
+    mach_number = magnitude / fluid.SpeedOfSound(static_temperature, outlet_static_pressure)
+
+    # []:Calculate Losses
+    num = cf * outer_diameter / 2 * (1 - (1 / diameter_ratio) ** 1.5) * outlet_magnitude**2
+    enthalpy_drop = num / (1.5 * blade_height * np.cos(outlet_angle))
+
+    # []:Calculate Isentropic Values
+    exponent = fluid.inverse_isentropic_exponent
+    isentropic_total_temperature = total_temperature - enthalpy_drop / fluid.specific_heat
+    total_pressure = outlet_static_pressure * (isentropic_total_temperature / outlet_static_temperature) ** exponent
+    static_pressure = total_pressure / (1 + (fluid.specific_ratio - 1) / 2 * mach_number**2) ** exponent
+
+    # []:Calculate Outlet Density
+    new_density = fluid.Density(static_pressure, static_temperature)
+    residual = np.abs(density - new_density) / density
+
+    values = {
+        "static_temperature": static_temperature,
+        "static_pressure": static_pressure,
+        "total_pressure": total_pressure,
+        "mach_number": mach_number,
+        "tangential": tangential,
+        "axial": axial,
+        "magnitude": magnitude,
+        "angle": angle,
+    }
+    return residual, {"density": new_density, "magnitude": magnitude}, values
+
+
+def batch_vaneless_diffuser_calcs(
+    columns: dict,
+    fluid: WorkingFluid,
+    mass_flow_rate: np.ndarray,
+    max_iterations: int,
+    tolerance: float,
+    acceleration: str = DEFAULT_ACCELERATION,
+    density_guess: np.ndarray = None,
+    velocity_guess: np.ndarray = None,
+) -> tuple[np.ndarray, dict]:
+    """
+    Array version of vaneless_diffuser_calcs. The loop starts from the
+    impeller outlet density and velocity unless guesses are given. Returns
+    the status of the density loop of each lane and its final density and
+    velocity magnitude guesses.
+    """
+    vaneless_diffuser_to_outlet_diameter_ratio = 1.2
+    outer_diameter = columns["geometry.outer_diameter"]
+    blade_height = columns["geometry.outlet_blade_height"]
+    vaneless_diameter = vaneless_diffuser_to_outlet_diameter_ratio * outer_diameter
+    hydraulic_diameter = (4 * np.pi * vaneless_diameter * blade_height) / (
+        2 * (np.pi * vaneless_diameter + blade_height)
+    )
+    total_temperature = columns["outlet.thermodynamic_point.temperature.total"]
+
+    def update(state, **parameters):
+        return _VanelessDensityUpdate(state, diameter_ratio=vaneless_diffuser_to_outlet_diameter_ratio, **parameters)
+
+    if density_guess is None:
+        density_guess = columns["outlet.thermodynamic_point.density.static"]
+    if velocity_guess is None:
+        velocity_guess = columns["outlet.blade.mid.absolute.magnitude"]
+
+    state, values, status, iterations, residuals = _MaskedIteration(
+        update,
+        {
+            "density": np.array(density_guess, dtype=float),
+            "magnitude": np.array(velocity_guess, dtype=float),
+        },
+        {
+            "fluid": fluid,
+            "outlet_static_density": columns["outlet.thermodynamic_point.density.static"],
+            "outlet_static_pressure": columns["outlet.thermodynamic_point.pressure.static"],
+            "outlet_static_temperature": columns["outlet.thermodynamic_point.temperature.static"],
+            "outlet_magnitude": columns["outlet.blade.mid.absolute.magnitude"],
+            "outlet_tangential": columns["outlet.blade.mid.absolute.tangential"],
+            "outlet_angle": columns["outlet.blade.mid.absolute.angle"],
+            "total_temperature": total_temperature,
+            "outer_diameter": outer_diameter,
+            "vaneless_diameter": vaneless_diameter,
+            "blade_height": blade_height,
+            "hydraulic_diameter": hydraulic_diameter,
+            "mass_flow_rate": mass_flow_rate,
+        },
+        max_iterations,
+        tolerance,
+        acceleration,
+    )
+
+    prefix = "vaneless_diffuser"
+    _StoreConvergence(columns, f"{prefix}.", iterations, residuals, status)
+    columns["geometry.vaneless_diffuser_diameter"] = vaneless_diameter
+    columns[f"{prefix}.thermodynamic_point.temperature.total"] = total_temperature
+    columns[f"{prefix}.thermodynamic_point.temperature.static"] = values["static_temperature"]
+    columns[f"{prefix}.thermodynamic_point.pressure.static"] = values["static_pressure"]
+    columns[f"{prefix}.thermodynamic_point.pressure.total"] = values["total_pressure"]
+    columns[f"{prefix}.thermodynamic_point.density.static"] = state["density"]
+    columns[f"{prefix}.blade.mid_mach_number.absolute"] = values["mach_number"]
+    for component in ("tangential", "axial", "magnitude", "angle"):
+        columns[f"{prefix}.blade.mid.absolute.{component}"] = values[component]
+    return status, state
+
+
+def batch_diffuser_calcs(
+    columns: dict,
+    fluid: WorkingFluid,
+    inlet_total_temperature: np.ndarray,
+    inlet_total_pressure: np.ndarray,
+    isentropic_exponent,
+    eulerian_work: np.ndarray,
+    inlet_specific_heat=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of diffuser_calcs
+    """
+    TT3 = columns["outlet.thermodynamic_point.temperature.total"]
+    T3 = columns["outlet.thermodynamic_point.temperature.static"]
+    PT3 = columns["outlet.thermodynamic_point.pressure.total"]
+    P3 = columns["outlet.thermodynamic_point.pressure.static"]
+
+    prc = 0.62  # Pressure recovery coefficient
+    diffuser_efficiency = 0.87  # Diffuser efficiency corresponding to a 2theta = 8 [deg]
+
+    P4 = prc * (PT3 - P3) + P3
+    T4is = T3 * (P4 / P3) ** isentropic_exponent
+    T4 = T3 + (T4is - T3) / diffuser_efficiency
+    rho4 = fluid.Density(P4, T4)
+
+    dhloss = fluid.specific_heat * (T4 - T4is)
+    TT4is = TT3 - dhloss / fluid.specific_heat
+    PT4 = P4 * (TT4is / T4) ** fluid.inverse_isentropic_exponent
+    V4 = np.sqrt(2 * fluid.specific_heat * (TT3 - T4))
+
+    if inlet_specific_heat is None:
+        inlet_specific_heat = fluid.specific_heat
+    Be = PT4 / inlet_total_pressure
+    htis = inlet_specific_heat * inlet_total_temperature * (Be**isentropic_exponent - 1)
+    eta_tt = htis / eulerian_work
+
+    prefix = "diffuser.thermodynamic_point"
+    columns[f"{prefix}.temperature.total"] = TT3
+    columns[f"{prefix}.temperature.static"] = T4
+    columns[f"{prefix}.pressure.static"] = P4
+    columns[f"{prefix}.pressure.total"] = PT4
+    columns[f"{prefix}.density.static"] = rho4
+    columns["diffuser.blade.mid.absolute.magnitude"] = V4
+    return Be, eta_tt
+
+
+def _BroadcastInputs(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    inputs: InputsII,
+    working_fluid: WorkingFluid,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict, WorkingFluid]:
+    """
+    Broadcasts the design parameters and every field of the inputs against
+    each other into flat float arrays. A working fluid with array
+    properties, e.g. an array of mixture compositions, is broadcast along
+    with them into one fluid per lane.
+    """
+    input_names = [item.name for item in attrs.fields(InputsII)]
+    fluid_shape = np.shape(working_fluid.specific_heat)
+    broadcast = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in (specific_diameter, specific_speed, end_to_end_efficiency)],
+        *[np.asarray(getattr(inputs, name), dtype=float) for name in input_names],
+        np.arange(int(np.prod(fluid_shape))).reshape(fluid_shape),
+    )
+    broadcast = [np.atleast_1d(value).ravel() for value in broadcast]
+    return (
+        broadcast[0],
+        broadcast[1],
+        broadcast[2],
+        dict(zip(input_names, broadcast[3:-1])),
+        working_fluid[broadcast[-1]],
+    )
+
+
+def _StageChain(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    inputs: dict,
+    working_fluid: WorkingFluid,
+    settings: SolverSettings,
+    inner_tolerance=0.0,
+    guesses: dict = None,
+) -> tuple[BatchResults, dict]:
+    """
+    Runs the stages of centrifugal_calcs on broadcast inputs. Each loop uses
+    the larger of its tolerance in settings and the inner tolerance, which
+    may be given per lane, and starts from the guess of its unknown in
+    guesses when present, see STAGE_UNKNOWNS. Lanes with a NaN guess start
+    cold as in centrifugal_calcs. Each stage evaluates the working fluid
+    at its own temperature with the gas model and equation of state of the
+    settings, as the stages of centrifugal_calcs do. Returns the batch of designs and the
+    final guess of every unknown.
+    """
+    guesses = guesses or {}
+    acceleration = settings.acceleration
+
+    def Loop(loop: LoopSettings) -> tuple:
+        return loop.max_iterations, np.maximum(loop.tolerance, inner_tolerance)
+
+    def Guess(unknown: str, cold: np.ndarray) -> np.ndarray:
+        if unknown not in guesses:
+            return cold
+        return np.where(np.isnan(guesses[unknown]), cold, guesses[unknown])
+
+    number_of_designs = len(specific_diameter)
+    columns = {path: np.zeros(number_of_designs) for path in COMPRESSOR_FIELDS}
+
+    # [B]:Initial Calculations
+    working_fluid = WithEquationOfState(working_fluid, settings.equation_of_state)
+    inlet_fluid = FluidAt(working_fluid, inputs["inlet_total_temperature"], settings.gas_model)
+    isentropic_exponent = inlet_fluid.isentropic_exponent
+
+    isentropic_work = (
+        inlet_fluid.specific_heat
+        * inputs["inlet_total_temperature"]
+        * ((inputs["compression_ratio"] ** isentropic_exponent) - 1.0)
+    )
+
+    total_density = inlet_fluid.Density(inputs["inlet_total_pressure"], inputs["inlet_total_temperature"])
+    total_volume_flow_rate = inputs["mass_flow_rate"] / total_density
+    outer_diameter = specific_diameter * np.sqrt(total_volume_flow_rate) / (isentropic_work**0.25)
+    rotational_speed = specific_speed * (isentropic_work**0.75) / np.sqrt(total_volume_flow_rate)
+
+    columns["geometry.inlet_hub_diameter"] = inputs["hub_diameter"]
+    columns["geometry.outer_diameter"] = outer_diameter
+    columns["inlet.thermodynamic_point.temperature.total"] = inputs["inlet_total_temperature"]
+    columns["inlet.thermodynamic_point.pressure.total"] = inputs["inlet_total_pressure"]
+    columns["inlet.thermodynamic_point.density.total"] = total_density
+
+    # [C]:Calculate Velocities and Eulerian Work
+    translational_velocity = rotational_speed * outer_diameter / 2.0
+    eulerian_work = isentropic_work / end_to_end_efficiency
+    absolute_tangential = eulerian_work / translational_velocity
+    columns["outlet.blade.mid.translational.magnitude"] = translational_velocity
+
+    # [D]:Calculate Flow Perfomance Indicators
+    columns["stage_loading"] = isentropic_work / np.square(absolute_tangential)
+    columns["flow_coefficient"] = inputs["mass_flow_rate"] / (
+        total_density * (absolute_tangential * (outer_diameter / 2.0))
+    )
+    columns["blade_orientation_ratio"] = absolute_tangential / translational_velocity
+
+    # [F]:Inlet Loop
+    inlet_status, inlet_density = BatchInletLoop(
+        columns,
+        inlet_fluid,
+        Guess("inlet_density", total_density),
+        rotational_speed,
+        inputs["mass_flow_rate"],
+        *Loop(settings.inlet),
+        acceleration,
+    )
+
+    # [G]:Outlet
+    alpha2 = 65 * (np.pi / 180.0)
+    outlet_fluid = FluidAt(
+        working_fluid,
+        inputs["inlet_total_temperature"] + eulerian_work / (2.0 * inlet_fluid.specific_heat),
+        settings.gas_model,
+    )
+    BatchSetupOutletStage(
+        columns, alpha2, eulerian_work, outlet_fluid, inputs["inlet_total_pressure"] * inputs["compression_ratio"]
+    )
+    outlet_status, impeller_efficiency = batch_optimize_mass_flow(
+        columns,
+        outlet_fluid,
+        outlet_fluid.inverse_isentropic_exponent,
+        eulerian_work,
+        inputs["mass_flow_rate"],
+        inputs["tip_clearance"],
+        inputs["surface_roughness"],
+        *Loop(settings.outlet),
+        acceleration,
+        Guess("impeller_efficiency", np.ones(number_of_designs)),
+        settings.friction_method,
+    )
+    columns["impeller_compression_ratio"] = (
+        columns["outlet.thermodynamic_point.pressure.total"] / columns["inlet.thermodynamic_point.pressure.total"]
+    )
+
+    # []:Diffusion & Check For Stall
+    inlet_relative_tangential = columns["inlet.blade.mid.relative.tangential"]
+    inlet_relative_magnitude = columns["inlet.blade.mid.relative.magnitude"]
+    outlet_relative_magnitude = columns["outlet.blade.mid.relative.magnitude"]
+    columns["diffusion_ratio"] = np.abs(inlet_relative_tangential / outlet_relative_magnitude)
+    columns["de_haller_number"] = outlet_relative_magnitude / inlet_relative_magnitude
+    columns["lieblien_diffusion_factor"] = (1 - outlet_relative_magnitude / inlet_relative_magnitude) + np.abs(
+        inlet_relative_tangential - columns["outlet.blade.mid.relative.tangential"]
+    ) / (2 * inlet_relative_magnitude) * 0.4
+
+    #  []:Vanless & Vaned Diffuser Calculations
+    diffuser_fluid = FluidAt(working_fluid, columns["outlet.thermodynamic_point.temperature.total"], settings.gas_model)
+    vaneless_status, vaneless_state = batch_vaneless_diffuser_calcs(
+        columns,
+        diffuser_fluid,
+        inputs["mass_flow_rate"],
+        *Loop(settings.vaneless_diffuser),
+        acceleration,
+        Guess("vaneless_density", columns["outlet.thermodynamic_point.density.static"]),
+        Guess("vaneless_velocity", columns["outlet.blade.mid.absolute.magnitude"]),
+    )
+    columns["total_compression_ratio"], columns["total_efficiency"] = batch_diffuser_calcs(
+        columns,
+        diffuser_fluid,
+        inputs["inlet_total_temperature"],
+        inputs["inlet_total_pressure"],
+        isentropic_exponent,
+        eulerian_work,
+        inlet_fluid.specific_heat,
+    )
+
+    result = BatchResults(columns=columns, status=np.maximum.reduce([inlet_status, outlet_status, vaneless_status]))
+    return result, {
+        "inlet_density": inlet_density,
+        "impeller_efficiency": impeller_efficiency,
+        "vaneless_density": vaneless_state["density"],
+        "vaneless_velocity": vaneless_state["magnitude"],
+    }
+
+
+def batch_centrifugal_calcs(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    fluid: str,
+    material: str,
+    inputs: InputsII,
+    settings: SolverSettings = SolverSettings(),
+    inner_tolerance=0.0,
+    working_fluid: WorkingFluid = None,
+) -> BatchResults:
+    """
+    Array version of centrifugal_calcs. The design parameters and every
+    field of the inputs may be scalars or arrays, they are broadcast
+    against each other and each resulting lane is an independent design.
+    The inner tolerance may be given per lane. An already loaded working
+    fluid may be passed to skip reading the fluid database, one with array
+    properties, e.g. an array of mixture compositions, is broadcast against
+    the design parameters as well, see gas_mixture.
+
+    The status of each design is the most severe status of its inlet, outlet
+    and vaneless diffuser loops, see SolverStatus. The iteration count and
+    final residual of each loop are stored in the convergence columns of its
+    stage.
+    """
+    if working_fluid is None:
+        working_fluid = LoadWorkingFluid(fluid)
+    specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid = _BroadcastInputs(
+        specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid
+    )
+
+    result, _ = _StageChain(
+        specific_diameter,
+        specific_speed,
+        end_to_end_efficiency,
+        inputs,
+        working_fluid,
+        settings,
+        inner_tolerance,
+    )
+    return result
+
+
+def batch_preliminary_design(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    fluid: str,
+    material: str,
+    inputs: InputsII,
+    settings: SolverSettings = SolverSettings(),
+    working_fluid: WorkingFluid = None,
+    guesses: dict = None,
+) -> BatchResults:
+    """
+    Array version of the preliminary design loop of main. The end to end
+    efficiency of each lane is iterated on until it matches the total
+    efficiency of its design, only the lanes that have not converged yet
+    are recomputed. Each lane follows the tolerance schedule of the
+    settings on its own. The convergence report of the efficiency loop is
+    stored in the top level convergence columns.
+
+    Given guesses of the stage unknowns, e.g. the unknowns of a
+    neighbouring design, every pass starts its stage loops from the
+    previous pass, beginning with the guesses. Lanes with NaN guesses start
+    cold. The designs then match the ones of cold starts to the tolerances
+    of the stage loops.
+    """
+    if working_fluid is None:
+        working_fluid = LoadWorkingFluid(fluid)
+    specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid = _BroadcastInputs(
+        specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid
+    )
+    number_of_designs = len(specific_diameter)
+
+    result = BatchResults(
+        columns={path: np.zeros(number_of_designs) for path in COMPRESSOR_FIELDS},
+        status=np.zeros(number_of_designs, dtype=np.int8),
+    )
+    max_iterations = settings.main.max_iterations
+    tolerance = settings.main.tolerance
+    efficiency = end_to_end_efficiency.copy()
+    accelerator = CreateAccelerator(settings.acceleration, number_of_designs)
+    active = np.ones(number_of_designs, dtype=bool)
+    iterations = np.zeros(number_of_designs, dtype=np.int64)
+    residuals = np.full(number_of_designs, np.inf)
+    warm_start = guesses is not None
+    guesses = {name: np.array(value, dtype=float) for name, value in (guesses or {}).items()}
+
+    for iteration in range(0, max_iterations):
+        iteration += 1
+        lanes = np.flatnonzero(active)
+        if lanes.size == 0:
+            break
+        logger.info(f"Batch main iteration: {iteration} ({lanes.size} lanes)")
+        CheckCancelled()
+
+        # Inexact passes start the stage loops from the previous pass, exact
+        #   passes start them cold as centrifugal_calcs does unless guesses
+        #   were given
+        inner_tolerance = settings.InnerTolerance(residuals[lanes])
+        exact = settings.IsExact(inner_tolerance) & (not warm_start)
+        design, states = _StageChain(
+            specific_diameter[lanes],
+            specific_speed[lanes],
+            efficiency[lanes],
+            {name: value[lanes] for name, value in inputs.items()},
+            working_fluid[lanes],
+            settings,
+            inner_tolerance,
+            {name: np.where(exact, np.nan, value[lanes]) for name, value in guesses.items()},
+        )
+        for name, value in states.items():
+            guesses.setdefault(name, np.zeros(number_of_designs))[lanes] = value
+        for path, column in design.columns.items():
+            result.columns[path][lanes] = column
+        result.status[lanes] = design.status
+
+        total_efficiency = design.columns["total_efficiency"]
+        residual = np.abs(efficiency[lanes] - total_efficiency) / total_efficiency
+        iterations[lanes] = iteration
+        residuals[lanes] = residual
+
+        finished = ((residual < tolerance) & settings.IsExact(inner_tolerance)) | ~np.isfinite(residual)
+        next_efficiency = accelerator(efficiency[lanes], total_efficiency, lanes)
+        efficiency[lanes[~finished]] = next_efficiency[~finished]
+        active[lanes[finished]] = False
+
+    main_status = _LoopStatus(residuals, tolerance)
+    _StoreConvergence(result.columns, "", iterations, residuals, main_status)
+    result.status = np.maximum(result.status, main_status)
+    result.unknowns = guesses
+    return result
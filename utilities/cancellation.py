@@ -0,0 +1,70 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Cooperative Cancellation
+Update: October 17, 2026
+
+A design running on a thread or in another process can not be interrupted
+from the outside. Instead every solver loop calls CheckCancelled once per
+iteration, which raises DesignCancelled when the cancellation token of the
+current context has been cancelled. A token is made current with
+
+    with CancellationToken(event):
+        design = preliminary_design(...)
+
+The event may be a threading.Event, or a multiprocessing Event or Manager
+Event proxy when the design runs in another process. Reading an event of
+another process is slow, so the event is only read once every poll
+interval, by default one millisecond, and a cancelled design stops within
+one loop iteration after that.
+
+Without a current token CheckCancelled does nothing.
+"""
+
+import contextvars
+import threading
+import time
+
+_current_token = contextvars.ContextVar("cancellation_token", default=None)
+
+
+class DesignCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    def __init__(self, event=None, poll_interval: float = 1e-3) -> None:
+        self.event = threading.Event() if event is None else event
+        self.poll_interval = poll_interval
+        self._cancelled = False
+        self._next_poll = 0.0
+        self._reset_tokens = []
+
+    def __enter__(self) -> "CancellationToken":
+        self._reset_tokens.append(_current_token.set(self))
+        return self
+
+    def __exit__(self, *exception) -> None:
+        _current_token.reset(self._reset_tokens.pop())
+
+    def Cancel(self) -> None:
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._cancelled:
+            now = time.monotonic()
+            if now >= self._next_poll:
+                self._next_poll = now + self.poll_interval
+                self._cancelled = self.event.is_set()
+        return self._cancelled
+
+
+def CheckCancelled() -> None:
+    """
+    Raises DesignCancelled when the token of the current context was
+    cancelled
+    """
+    token = _current_token.get()
+    if token is not None and token.cancelled:
+        raise DesignCancelled("[Error]: Design cancelled")
@@ -6,69 +6,68 @@ Update: 30 April, 2023
 """
 
 from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.centrifugal_compressor_geometry import CompressorGeometry
 from ccpd.data_types.thermo_point import ThermodynamicVariable
 from ccpd.data_types.working_fluid import WorkingFluid
 from ccpd.data_types.inputs import InputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
 from ccpd.stages.inlet.inlet_loop_calcs import InletLoop
 from ccpd.stages.inlet.inlet_utils import CalculateRemainingInletQuantities
 from ccpd.stages.outlet.setup_outlet_stage import SetupOutletStage
 from ccpd.stages.outlet.optimize_mass_flow_rate import optimize_mass_flow
 from ccpd.stages.vaneless_diffuser.vaneless_diffuser import vaneless_diffuser_calcs
 from ccpd.stages.diffuser.diffuser_calculations import diffuser_calcs
-import json
-import sys
+from ccpd.utilities.fluid_registry import DefaultFluidRegistry
+from ccpd.utilities.gas_properties import FluidAt
+from ccpd.utilities.real_gas import WithEquationOfState
+from ccpd.utilities.stage_graph import Stage, StageGraph
+import copy
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def centrifugal_calcs(
-    specific_diameter: float,
-    specific_speed: float,
-    end_to_end_efficiency: float,
-    fluid: str,
-    material: str,
-    inputs: InputsII,
-) -> CentrifugalCompressor:
+def LoadWorkingFluid(fluid: str) -> WorkingFluid:
     """
-    This function takes initial design parameters and calculates the first
-    centrifugal design iteration. Velocity triangles and thermodynamic
-    properties are calculated as well.
+    Returns the requested working fluid of the default fluid registry. The
+    fluid database is parsed once per process and every design shares the
+    same fluid object.
+    """
+    return DefaultFluidRegistry()[fluid]
 
-    The following are inputs:
 
-        Ds: Specific diameter
-        Oms: Specific rotational speed
-        eta: Baseline/guess efficiency
-        fluid: Working fluid
-        mat: Compressor material
+def ResolveWorkingFluid(fluid: str | WorkingFluid) -> WorkingFluid:
+    """
+    Working fluid given by its name in the fluid database, or a
+    WorkingFluid which is used as is without reading the database
+    """
+    return fluid if isinstance(fluid, WorkingFluid) else LoadWorkingFluid(fluid)
 
-    The following are outputs: In this case the output is collected in one
-    single data structure result. This structure contains five main
-    sub data structures: inlet, outlet, comp, vldiff, and diff
 
-        inlet: structure containing thermodynamic and velocity conditions
-        outlet: same as inlet
-        comp: structure containing information regarding the geometry and overall characteristics of the compressor
-                (blade heights, No. of blades, etc)
-        vldiff: Structure containing the information on the vanless diffuser
-        diff: Structure containing the information on the wedge diffuser both thermodynamic and geometrical quantites
-    """
-    compressor = CentrifugalCompressor()
+def _FluidStage(fluid: str | WorkingFluid, equation_of_state: str) -> WorkingFluid:
+    return WithEquationOfState(ResolveWorkingFluid(fluid), equation_of_state)
 
-    try:
-        fluid_database_file = open("ccpd/fluids/fluids.json", "r")
-    except IOError as io_error:
-        print(f"{io_error} Fluid database import failed!")
-        sys.exit()
 
-    fluid_database = json.load(fluid_database_file)
-    working_fluid = WorkingFluid(fluid_database[fluid])
+def _InletStage(
+    specific_diameter: float,
+    specific_speed: float,
+    inputs: InputsII,
+    loop: LoopSettings,
+    acceleration: str,
+    gas_model: str,
+    working_fluid: WorkingFluid,
+) -> dict:
+    """
+    Sizes the compressor and runs the inlet loop, none of which depends on
+    the end to end efficiency guess. The inlet uses the fluid at the inlet
+    total temperature.
+    """
+    geometry = CompressorGeometry()
+    working_fluid = FluidAt(working_fluid, inputs.inlet_total_temperature, gas_model)
 
     # [B]:Initial Calculations
-    isentropic_exponent = (working_fluid.specific_ratio - 1.0) / working_fluid.specific_ratio
-    inverse_isentropic_exponent = 1.0 / isentropic_exponent
+    isentropic_exponent = working_fluid.isentropic_exponent
 
     isentropic_work = (
         working_fluid.specific_heat
@@ -77,34 +76,16 @@ def centrifugal_calcs(
     )
 
     # @todo Create a method within the centrifugal compressor class to initialize the inlet with these initial values
-    compressor.geometry.inlet_hub_diameter = inputs.hub_diameter
+    geometry.inlet_hub_diameter = inputs.hub_diameter
     density = ThermodynamicVariable()
-    density.total = inputs.inlet_total_pressure / (working_fluid.specific_gas_constant * inputs.inlet_total_temperature)
+    density.total = working_fluid.Density(inputs.inlet_total_pressure, inputs.inlet_total_temperature)
     total_volume_flow_rate = inputs.mass_flow_rate / density.total
 
-    compressor.geometry.outer_diameter = specific_diameter * np.sqrt(total_volume_flow_rate) / (isentropic_work**0.25)
+    geometry.outer_diameter = specific_diameter * np.sqrt(total_volume_flow_rate) / (isentropic_work**0.25)
 
     rotational_speed = specific_speed * (isentropic_work**0.75) / np.sqrt(total_volume_flow_rate)
     logger.info(f"Rotational speed: {rotational_speed:8.6} ({rotational_speed * 60/(2*np.pi):6.6} [RPM])")
 
-    # [C]:Calculate Velocities and Eulerian Work
-    compressor.outlet.blade.mid.translational.magnitude = rotational_speed * compressor.geometry.outer_diameter / 2.0
-
-    eulerian_work = isentropic_work / end_to_end_efficiency
-    logger.info(f"Eulerian work: {eulerian_work}")
-    compressor.outlet.blade.mid.absolute.tangential = (
-        eulerian_work / compressor.outlet.blade.mid.translational.magnitude
-    )
-
-    # [D]:Calculate Flow Perfomance Indicators
-    compressor.stage_loading = isentropic_work / np.square(compressor.outlet.blade.mid.absolute.tangential)
-    compressor.flow_coefficient = inputs.mass_flow_rate / (
-        density.total * (compressor.outlet.blade.mid.absolute.tangential * (compressor.geometry.outer_diameter / 2.0))
-    )
-    compressor.blade_orientation_ratio = (
-        compressor.outlet.blade.mid.absolute.tangential / compressor.outlet.blade.mid.translational.magnitude
-    )
-
     # %% [E]:Hub Diameter
     # % If a hub diameter is specified then it is automatically placed in
     # % 	the inlet diameter structure. Otherwise it is set considering a
@@ -119,25 +100,77 @@ def centrifugal_calcs(
     # end
 
     # %% [F]:Setup Inlet Loop
-    inlet_loop_max_iterations = 1000
-    inlet_loop_tolerance = 1e-3
     inlet = InletLoop(
         inputs,
         working_fluid,
         density.total,
         rotational_speed,
-        compressor.geometry,
-        inlet_loop_max_iterations,
-        inlet_loop_tolerance,
+        geometry,
+        loop.max_iterations,
+        loop.tolerance,
+        acceleration,
     )
 
     #  [F.1]:Inlet Geometry
-    compressor.geometry.CalculateInletBladeHeightAndRatios()
-    inlet.blade.CalculateComponentsViaFreeVortexMethod(compressor.geometry, rotational_speed)
+    geometry.CalculateInletBladeHeightAndRatios()
+    inlet.blade.CalculateComponentsViaFreeVortexMethod(geometry, rotational_speed)
     CalculateRemainingInletQuantities(inlet, working_fluid)
     inlet.thermodynamic_point.density.total = density.total
     inlet.thermodynamic_point.pressure.total = inputs.inlet_total_pressure
 
+    return {
+        "geometry": geometry,
+        "inlet": inlet,
+        "rotational_speed": rotational_speed,
+        "isentropic_exponent": isentropic_exponent,
+        "isentropic_work": isentropic_work,
+        "total_density": density.total,
+        "fluid": working_fluid,
+    }
+
+
+def _OutletSetupStage(
+    end_to_end_efficiency: float,
+    inputs: InputsII,
+    gas_model: str,
+    working_fluid: WorkingFluid,
+    inlet_stage: dict,
+) -> dict:
+    # The outlet and the diffusers add to the geometry of the inlet stage,
+    #   which is shared with the stage graph
+    compressor = CentrifugalCompressor()
+    compressor.geometry = copy.copy(inlet_stage["geometry"])
+    inlet = inlet_stage["inlet"]
+    isentropic_work = inlet_stage["isentropic_work"]
+
+    # [C]:Calculate Velocities and Eulerian Work
+    compressor.outlet.blade.mid.translational.magnitude = (
+        inlet_stage["rotational_speed"] * compressor.geometry.outer_diameter / 2.0
+    )
+
+    eulerian_work = isentropic_work / end_to_end_efficiency
+    logger.info(f"Eulerian work: {eulerian_work}")
+
+    # The impeller uses the fluid halfway through its temperature rise
+    working_fluid = FluidAt(
+        working_fluid,
+        inputs.inlet_total_temperature + eulerian_work / (2.0 * inlet_stage["fluid"].specific_heat),
+        gas_model,
+    )
+    compressor.outlet.blade.mid.absolute.tangential = (
+        eulerian_work / compressor.outlet.blade.mid.translational.magnitude
+    )
+
+    # [D]:Calculate Flow Perfomance Indicators
+    compressor.stage_loading = isentropic_work / np.square(compressor.outlet.blade.mid.absolute.tangential)
+    compressor.flow_coefficient = inputs.mass_flow_rate / (
+        inlet_stage["total_density"]
+        * (compressor.outlet.blade.mid.absolute.tangential * (compressor.geometry.outer_diameter / 2.0))
+    )
+    compressor.blade_orientation_ratio = (
+        compressor.outlet.blade.mid.absolute.tangential / compressor.outlet.blade.mid.translational.magnitude
+    )
+
     # [G]:Outlet
     # This for the moment is a little vague. Since we do not know our
     # 	outlet blade height we assume an outlet absolute angle and check
@@ -159,19 +192,38 @@ def centrifugal_calcs(
     logger.info(f"Reaction: {X:0.3}")
     # outlet.D2 = D2;
 
+    return {"compressor": compressor, "outlet": outlet, "eulerian_work": eulerian_work, "fluid": working_fluid}
+
+
+def _OutletLoopStage(
+    inputs: InputsII,
+    loop: LoopSettings,
+    acceleration: str,
+    friction_method: str,
+    inlet_stage: dict,
+    outlet_setup: dict,
+) -> CentrifugalCompressor:
+    # The loop completes the compressor, inlet and outlet of the stages
+    #   before it, which are shared with the stage graph
+    compressor = copy.copy(outlet_setup["compressor"])
+    compressor.geometry = copy.copy(compressor.geometry)
+    inlet = inlet_stage["inlet"].Copy()
+    outlet = outlet_setup["outlet"].Copy()
+    working_fluid = outlet_setup["fluid"]
+
     # [G.1]:Loop and Iterate
-    max_outlet_loop_iterations = 10
-    outlet_loop_tolerance = 1e-3
     optimize_mass_flow(
         inlet,
         outlet,
         compressor.geometry,
         working_fluid,
-        inverse_isentropic_exponent,
-        eulerian_work,
+        working_fluid.inverse_isentropic_exponent,
+        outlet_setup["eulerian_work"],
         inputs,
-        max_outlet_loop_iterations,
-        outlet_loop_tolerance,
+        loop.max_iterations,
+        loop.tolerance,
+        acceleration,
+        friction_method,
     )
     # [outlet,inlet.beta1_geo,Nb] = outlet_loop(inlet, outlet, l_eul, itrmx, tol);
     compressor.impeller_compression_ratio = (
@@ -193,20 +245,63 @@ def centrifugal_calcs(
         inlet.blade.mid.relative.tangential - outlet.blade.mid.relative.tangential
     ) / (2 * inlet.blade.mid.relative.magnitude) * 0.4
     logger.debug(f"Diffusion ratios:\nDiffusion Ratio: {DR}\nDe Haller: {DH}\nLieblein diffusion factor: {DF}")
+    compressor.diffusion_ratio = DR
+    compressor.de_haller_number = DH["mid"]
+    compressor.lieblien_diffusion_factor = DF
+
+    compressor.inlet = inlet
+    compressor.outlet = outlet
+    return compressor
+
+
+def _VanelessDiffuserStage(
+    inputs: InputsII,
+    loop: LoopSettings,
+    acceleration: str,
+    gas_model: str,
+    working_fluid: WorkingFluid,
+    compressor: CentrifugalCompressor,
+) -> CentrifugalCompressor:
+    # The compressor of the outlet loop is shared with the stage graph
+    compressor = copy.copy(compressor)
+    compressor.geometry = copy.copy(compressor.geometry)
+
+    # The diffusers use the fluid at the impeller outlet total temperature
+    working_fluid = FluidAt(working_fluid, compressor.outlet.thermodynamic_point.temperature.total, gas_model)
 
     #  []:Vanless & Vaned Diffuser Calculations
     compressor.vaneless_diffuser, compressor.geometry.vaneless_diffuser_diameter = vaneless_diffuser_calcs(
-        outlet, compressor.geometry, working_fluid, inputs.mass_flow_rate, 100, 0.001
+        compressor.outlet,
+        compressor.geometry,
+        working_fluid,
+        inputs.mass_flow_rate,
+        loop.max_iterations,
+        loop.tolerance,
+        acceleration,
     )
+    return compressor
+
 
-    compressor.diffuser, compressor.total_efficiency, _ = diffuser_calcs(
-        outlet_temperature_struct=outlet.thermodynamic_point.temperature,
-        outlet_pressure_struct=outlet.thermodynamic_point.pressure,
+def _DiffuserStage(
+    inputs: InputsII,
+    gas_model: str,
+    working_fluid: WorkingFluid,
+    inlet_stage: dict,
+    outlet_setup: dict,
+    compressor: CentrifugalCompressor,
+) -> CentrifugalCompressor:
+    # The compressor of the vaneless diffuser is shared with the stage graph
+    compressor = copy.copy(compressor)
+    working_fluid = FluidAt(working_fluid, compressor.outlet.thermodynamic_point.temperature.total, gas_model)
+    compressor.diffuser, compressor.total_compression_ratio, compressor.total_efficiency = diffuser_calcs(
+        outlet_temperature_struct=compressor.outlet.thermodynamic_point.temperature,
+        outlet_pressure_struct=compressor.outlet.thermodynamic_point.pressure,
         working_fluid=working_fluid,
         inlet_total_temperature=inputs.inlet_total_temperature,
         inlet_total_pressure=inputs.inlet_total_pressure,
-        isentropic_exponent=isentropic_exponent,
-        eulerian_work=eulerian_work,
+        isentropic_exponent=inlet_stage["isentropic_exponent"],
+        eulerian_work=outlet_setup["eulerian_work"],
+        inlet_specific_heat=inlet_stage["fluid"].specific_heat,
     )
     # result = diff_diameter(result);
     # result.comp.eta_tt = result.diff.eta_tt;
@@ -221,3 +316,115 @@ def centrifugal_calcs(
     # result.comp.C      = C;         % [] Operating line constant
     # oo = 0
     return compressor
+
+
+def CreateStageGraph() -> StageGraph:
+    """
+    Stages of centrifugal_calcs. The working fluid and the inlet are only
+    recomputed when their parameters change, the stages after them read
+    the end to end efficiency guess and run on every call. The stages
+    only modify the objects they create. Each stage evaluates the working
+    fluid at its own temperature with the gas model of the settings, the
+    fluid stage applies their equation of state.
+    """
+    return StageGraph(
+        [
+            Stage("fluid", _FluidStage, ("fluid", "equation_of_state")),
+            Stage(
+                "inlet",
+                _InletStage,
+                ("specific_diameter", "specific_speed", "inputs", "inlet_loop", "acceleration", "gas_model"),
+                ("fluid",),
+            ),
+            Stage(
+                "outlet_setup",
+                _OutletSetupStage,
+                ("end_to_end_efficiency", "inputs", "gas_model"),
+                ("fluid", "inlet"),
+            ),
+            Stage(
+                "outlet_loop",
+                _OutletLoopStage,
+                ("inputs", "outlet_loop", "acceleration", "friction_method"),
+                ("inlet", "outlet_setup"),
+            ),
+            Stage(
+                "vaneless_diffuser",
+                _VanelessDiffuserStage,
+                ("inputs", "vaneless_diffuser_loop", "acceleration", "gas_model"),
+                ("fluid", "outlet_loop"),
+            ),
+            Stage(
+                "diffuser",
+                _DiffuserStage,
+                ("inputs", "gas_model"),
+                ("fluid", "inlet", "outlet_setup", "vaneless_diffuser"),
+            ),
+        ]
+    )
+
+
+def centrifugal_calcs(
+    specific_diameter: float,
+    specific_speed: float,
+    end_to_end_efficiency: float,
+    fluid: str | WorkingFluid,
+    material: str,
+    inputs: InputsII,
+    settings: SolverSettings = SolverSettings(),
+    inner_tolerance: float = 0.0,
+    stage_graph: StageGraph = None,
+) -> CentrifugalCompressor:
+    """
+    This function takes initial design parameters and calculates the first
+    centrifugal design iteration. Velocity triangles and thermodynamic
+    properties are calculated as well.
+
+    The following are inputs:
+
+        Ds: Specific diameter
+        Oms: Specific rotational speed
+        eta: Baseline/guess efficiency
+        fluid: Working fluid, by name or as a WorkingFluid
+        mat: Compressor material
+        settings: Iteration limits, tolerances and acceleration method of
+            the stage loops
+        inner_tolerance: Tolerance requested by the efficiency loop, the
+            stage loops use the larger of this and their own tolerance
+        stage_graph: Stages from CreateStageGraph, passing the same graph
+            on every call reuses the stages whose inputs did not change
+
+    The following are outputs: In this case the output is collected in one
+    single data structure result. This structure contains five main
+    sub data structures: inlet, outlet, comp, vldiff, and diff
+
+        inlet: structure containing thermodynamic and velocity conditions
+        outlet: same as inlet
+        comp: structure containing information regarding the geometry and overall characteristics of the compressor
+                (blade heights, No. of blades, etc)
+        vldiff: Structure containing the information on the vanless diffuser
+        diff: Structure containing the information on the wedge diffuser both thermodynamic and geometrical quantites
+    """
+    if stage_graph is None:
+        stage_graph = CreateStageGraph()
+
+    def Loop(loop: LoopSettings) -> LoopSettings:
+        if inner_tolerance <= loop.tolerance:
+            return loop
+        return LoopSettings(loop.max_iterations, inner_tolerance)
+
+    outputs = stage_graph.Run(
+        specific_diameter=specific_diameter,
+        specific_speed=specific_speed,
+        end_to_end_efficiency=end_to_end_efficiency,
+        fluid=fluid,
+        inputs=inputs,
+        inlet_loop=Loop(settings.inlet),
+        outlet_loop=Loop(settings.outlet),
+        vaneless_diffuser_loop=Loop(settings.vaneless_diffuser),
+        acceleration=settings.acceleration,
+        friction_method=settings.friction_method,
+        gas_model=settings.gas_model,
+        equation_of_state=settings.equation_of_state,
+    )
+    return outputs["diffuser"]
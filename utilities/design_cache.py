@@ -0,0 +1,184 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Design Cache
+Update: October 17, 2026
+
+Memoizes designs on their inputs. The inputs, design parameters and solver
+settings are frozen attrs classes, so a tuple of them identifies a design
+and is used as the key.
+
+The cache keeps the most recently used designs in memory up to a maximum
+number of entries and can also store every design in a directory, one
+pickle file per design, so designs survive between runs and are shared by
+the processes that use the same directory.
+
+With significant_digits set every float of the key is rounded to that many
+significant digits before the lookup and the design is computed on the
+rounded inputs, so requests that differ only past those digits return the
+same design.
+
+Cached designs are returned as is, not copied, and must not be modified.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+import attrs
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+def _QuantizedKey(value, significant_digits: int):
+    """
+    Nested tuple of the fields of a value with every float rounded to the
+    given significant digits, cheaper to build than Quantize
+    """
+    if isinstance(value, float):
+        return float(f"{value:.{significant_digits}g}")
+    elif isinstance(value, tuple):
+        return tuple(_QuantizedKey(item, significant_digits) for item in value)
+    elif attrs.has(type(value)):
+        return (type(value).__name__,) + tuple(
+            _QuantizedKey(getattr(value, attribute.name), significant_digits) for attribute in value.__attrs_attrs__
+        )
+    return value
+
+
+def Quantize(value, significant_digits: int):
+    """
+    Rounds every float of a value to the given significant digits, going
+    through tuples and frozen attrs classes
+    """
+    if isinstance(value, float):
+        return float(f"{value:.{significant_digits}g}")
+    elif isinstance(value, tuple):
+        return tuple(Quantize(item, significant_digits) for item in value)
+    elif attrs.has(type(value)):
+        return attrs.evolve(
+            value,
+            **{
+                attribute.name: Quantize(getattr(value, attribute.name), significant_digits)
+                for attribute in attrs.fields(type(value))
+                if attribute.init
+            },
+        )
+    return value
+
+
+class DesignCache:
+    def __init__(self, max_entries: int = 1024, directory: str = None, significant_digits: int = None) -> None:
+        assert max_entries > 0, f"[Error]: The cache needs room for at least one design"
+        self.max_entries = max_entries
+        self.directory = directory
+        self.significant_digits = significant_digits
+        self.statistics = CacheStatistics()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def Key(self, key: tuple) -> tuple:
+        """
+        Key under which the design of the given inputs is stored
+        """
+        if self.significant_digits is None:
+            return key
+        return _QuantizedKey(key, self.significant_digits)
+
+    def GetOrCompute(self, inputs: tuple, compute: Callable[..., Any], keep: Callable[[Any], bool] = None) -> Any:
+        """
+        Returns the design stored for the inputs, computing it as
+        compute(*inputs) on a miss. With significant_digits set the design
+        is computed on the quantized inputs. A computed design for which
+        keep returns False is returned without being stored.
+        """
+        key = self.Key(inputs)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.statistics.hits += 1
+                return self._entries[key]
+
+        design = self._Load(key)
+        stored = design is not None
+        if not stored:
+            if self.significant_digits is not None:
+                inputs = Quantize(inputs, self.significant_digits)
+            design = compute(*inputs)
+            if keep is not None and not keep(design):
+                with self._lock:
+                    self.statistics.misses += 1
+                return design
+            self._Store(key, design)
+
+        with self._lock:
+            if stored:
+                self.statistics.disk_hits += 1
+            else:
+                self.statistics.misses += 1
+            self._entries[key] = design
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.statistics.evictions += 1
+        return design
+
+    def Clear(self) -> None:
+        """
+        Empties the in memory cache, the designs on disk are kept
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _Path(self, key: tuple) -> str:
+        return os.path.join(self.directory, hashlib.sha256(repr(key).encode()).hexdigest() + ".pkl")
+
+    def _Load(self, key: tuple) -> Any:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._Path(key), "rb") as design_file:
+                stored_key, design = pickle.load(design_file)
+        # Designs stored with an older layout of the data types fail with an
+        #   AttributeError and are computed again
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as error:
+            if not isinstance(error, FileNotFoundError):
+                logger.warning(f"{error}, ignoring the stored design")
+            return None
+        return design if stored_key == key else None
+
+    def _Store(self, key: tuple, design: Any) -> None:
+        if self.directory is None:
+            return
+        # Written to a temporary file first so other processes never read a
+        #   partially written design
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as design_file:
+            pickle.dump((key, design), design_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self._Path(key))
@@ -0,0 +1,178 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Fixed Point Acceleration
+Update: October 17, 2026
+
+Every loop of the preliminary design is a fixed point iteration x = g(x) on
+a single positive quantity (a density or an efficiency). Instead of using
+the new value g(x) directly as the next guess (successive substitution),
+the loops hand x and g(x) to an accelerator which returns the next guess.
+
+The following methods are available:
+
+    none: Successive substitution, x_k+1 = g(x_k)
+    aitken: Steffensen's method, Aitken's delta squared extrapolation
+        applied after every two substitution steps
+    anderson: Anderson mixing over the last few iterates
+    secant: Secant method on the residual r(x) = g(x) - x
+
+The accelerators work element wise, so the same object drives one scalar
+loop or every lane of a batch loop. For batch loops the accelerator is
+created with the number of lanes and each call passes the indices of the
+lanes being updated.
+"""
+
+import numpy as np
+
+ACCELERATION_METHODS = ("none", "aitken", "anderson", "secant")
+DEFAULT_ACCELERATION = "secant"
+
+
+class FixedPointAccelerator:
+    """
+    Successive substitution, base class of the accelerators
+    """
+
+    def __init__(self, shape: tuple = ()) -> None:
+        self.shape = tuple(int(size) for size in np.atleast_1d(shape))
+
+    def Extrapolate(self, x: np.ndarray, gx: np.ndarray, lanes) -> np.ndarray:
+        return gx
+
+    def __call__(self, x, gx, lanes=Ellipsis):
+        """
+        Returns the next guess given the current guess x and its image g(x).
+        Accelerated steps that are not finite or not positive fall back to
+        g(x), since every unknown of the loops is a positive quantity.
+        """
+        x = np.asarray(x, dtype=float)
+        gx = np.asarray(gx, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            next_guess = self.Extrapolate(x, gx, lanes)
+        next_guess = np.where(np.isfinite(next_guess) & (next_guess > 0.0), next_guess, gx)
+        return next_guess if next_guess.ndim else float(next_guess)
+
+
+class AitkenAccelerator(FixedPointAccelerator):
+    """
+    Steffensen's method. From an anchor x0 two substitution steps are taken,
+    x1 = g(x0) and x2 = g(x1), and the next anchor is the Aitken
+    extrapolation
+
+        x0 - (x1 - x0)^2 / (x2 - 2 * x1 + x0)
+    """
+
+    def __init__(self, shape: tuple = ()) -> None:
+        super().__init__(shape)
+        self.waiting_for_second_image = np.zeros(self.shape, dtype=bool)
+        self.anchor = np.zeros(self.shape)
+
+    def Extrapolate(self, x: np.ndarray, gx: np.ndarray, lanes) -> np.ndarray:
+        second_step = self.waiting_for_second_image[lanes]
+        anchor = self.anchor[lanes]
+
+        # On the second step x is the first image x1 and gx the second x2
+        denominator = gx - 2.0 * x + anchor
+        extrapolated = anchor - (x - anchor) ** 2 / denominator
+        usable = second_step & (np.abs(denominator) > 1e-12 * np.abs(gx))
+
+        self.anchor[lanes] = np.where(second_step, anchor, x)
+        self.waiting_for_second_image[lanes] = ~second_step
+        return np.where(usable, extrapolated, gx)
+
+
+class SecantAccelerator(FixedPointAccelerator):
+    """
+    Secant method on the residual r(x) = g(x) - x. The first step is a
+    substitution step.
+    """
+
+    def __init__(self, shape: tuple = ()) -> None:
+        super().__init__(shape)
+        self.has_previous = np.zeros(self.shape, dtype=bool)
+        self.previous_guess = np.zeros(self.shape)
+        self.previous_residual = np.zeros(self.shape)
+
+    def Extrapolate(self, x: np.ndarray, gx: np.ndarray, lanes) -> np.ndarray:
+        residual = gx - x
+        previous_guess = self.previous_guess[lanes]
+        previous_residual = self.previous_residual[lanes]
+
+        slope_denominator = residual - previous_residual
+        secant = x - residual * (x - previous_guess) / slope_denominator
+        usable = self.has_previous[lanes] & (slope_denominator != 0.0)
+
+        self.previous_guess[lanes] = x
+        self.previous_residual[lanes] = residual
+        self.has_previous[lanes] = True
+        return np.where(usable, secant, gx)
+
+
+class AndersonAccelerator(FixedPointAccelerator):
+    """
+    Anderson mixing (type II) with a history of the last "depth" iterates
+    and mixing parameter "mixing". With f = g(x) - x the next guess is
+
+        x + mixing * f - (dX + mixing * dF) * gamma
+
+    where dX and dF hold the differences of the last iterates and residuals
+    and gamma is the least squares solution of dF * gamma = f. The unknown
+    of each loop is a scalar, so the minimum norm solution is used.
+    """
+
+    def __init__(self, shape: tuple = (), depth: int = 2, mixing: float = 1.0) -> None:
+        super().__init__(shape)
+        self.depth = depth
+        self.mixing = mixing
+        self.count = np.zeros(self.shape, dtype=np.int64)
+        self.previous_guess = np.zeros(self.shape)
+        self.previous_residual = np.zeros(self.shape)
+        self.guess_differences = np.zeros((depth,) + self.shape)
+        self.residual_differences = np.zeros((depth,) + self.shape)
+
+    def Extrapolate(self, x: np.ndarray, gx: np.ndarray, lanes) -> np.ndarray:
+        residual = gx - x
+        count = self.count[lanes]
+        history = (slice(None), lanes)
+
+        # Shift the history and append the newest differences
+        guess_differences = np.roll(self.guess_differences[history], 1, axis=0)
+        residual_differences = np.roll(self.residual_differences[history], 1, axis=0)
+        guess_differences[0] = x - self.previous_guess[lanes]
+        residual_differences[0] = residual - self.previous_residual[lanes]
+
+        # Only the differences that have actually been recorded are used
+        recorded = np.arange(self.depth).reshape((-1,) + (1,) * np.ndim(x)) < np.minimum(count, self.depth)
+        guess_differences = np.where(recorded, guess_differences, 0.0)
+        residual_differences = np.where(recorded, residual_differences, 0.0)
+
+        norm = np.sum(residual_differences**2, axis=0)
+        gamma = residual_differences * residual / np.where(norm > 0.0, norm, 1.0)
+        anderson = (
+            x
+            + self.mixing * residual
+            - np.sum((guess_differences + self.mixing * residual_differences) * gamma, axis=0)
+        )
+
+        self.guess_differences[history] = guess_differences
+        self.residual_differences[history] = residual_differences
+        self.previous_guess[lanes] = x
+        self.previous_residual[lanes] = residual
+        self.count[lanes] = count + 1
+        return np.where((count > 0) & (norm > 0.0), anderson, x + self.mixing * residual)
+
+
+def CreateAccelerator(method: str, shape: tuple = ()) -> FixedPointAccelerator:
+    """
+    Returns the accelerator for the given method name, see
+    ACCELERATION_METHODS
+    """
+    accelerators = {
+        "none": FixedPointAccelerator,
+        "aitken": AitkenAccelerator,
+        "anderson": AndersonAccelerator,
+        "secant": SecantAccelerator,
+    }
+    assert method in accelerators, f"[Error]: Unknown acceleration method {method}, use one of {ACCELERATION_METHODS}"
+    return accelerators[method](shape)
@@ -0,0 +1,202 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Fluid Registry
+Update: October 17, 2026
+
+Working fluids by name. A FluidRegistry holds one WorkingFluid per name,
+built once from the properties of the fluid, so every design using a fluid
+shares the same object together with its derived constants, see
+WorkingFluid. The fluids of a registry are shared, so they are frozen: a
+fluid to modify is a copy.copy of one of them.
+
+The default registry is read from fluids/fluids.json the first time a
+fluid is looked up by name, see LoadWorkingFluid, through its precompiled
+form fluids/fluid_database.py: a Python module that the interpreter keeps
+as bytecode, so starting a process neither imports json nor parses the
+database. After editing fluids.json run
+
+    python -m ccpd.utilities.fluid_registry
+
+to compile it again, until then the database is parsed from fluids.json on
+every start and a warning is logged. More fluids can be added to the
+default registry while running with
+
+    RegisterFluid("propane", {"specific_heat": 1679.0, ...})
+
+after which designs may use them by name as any fluid of the database. A
+registered fluid is only known to the process that registered it and to
+the worker processes forked after that.
+
+Mixtures are given by the mole or mass fractions of fluids of the registry,
+in the database as
+
+    "wet_air": {"mole_fractions": {"air": 0.98, "water_vapor": 0.02}}
+
+or while running with MixtureFluid({"hydrogen": 0.9, "methane": 0.1}),
+whose fractions may also be arrays of compositions, see gas_mixture.
+"""
+
+from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.utilities.gas_mixture import CachedMixture
+import copy
+import functools
+import logging
+import numpy as np
+import os
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+FLUID_DATABASE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fluids", "fluids.json")
+COMPILED_DATABASE_PATH = os.path.join(os.path.dirname(FLUID_DATABASE_PATH), "fluid_database.py")
+
+
+class FluidRegistry:
+    def __init__(self, database: dict = None) -> None:
+        self._fluids = {}
+        self._lock = threading.Lock()
+        # Pure fluids first, so mixtures find their components regardless of
+        #   the order of the database
+        database = database or {}
+        for name in sorted(database, key=lambda name: _IsMixture(database[name])):
+            self.Register(name, database[name])
+
+    @classmethod
+    def FromFile(cls, path: str = FLUID_DATABASE_PATH) -> "FluidRegistry":
+        return cls(_ReadDatabase(path))
+
+    def Register(self, name: str, fluid: dict | WorkingFluid, replace: bool = False) -> WorkingFluid:
+        """
+        Adds a fluid, given by its properties or as a WorkingFluid, and
+        returns the registered fluid, frozen. A given WorkingFluid is
+        copied, the caller may keep changing its own. An existing fluid is
+        only replaced when asked to, designs that already hold it keep the
+        old one. Properties with mole or mass fractions register a mixture.
+        """
+        if _IsMixture(fluid):
+            basis = "mole" if "mole_fractions" in fluid else "mass"
+            fluid = self.Mixture(fluid[f"{basis}_fractions"], basis)
+        elif isinstance(fluid, WorkingFluid):
+            fluid = copy.copy(fluid)
+        else:
+            fluid = WorkingFluid(fluid)
+        assert fluid.specific_heat is not None and np.all(
+            np.asarray(fluid.specific_heat) > 0.0
+        ), f"[Error]: Fluid {name} needs a specific heat"
+        assert fluid.specific_ratio is not None and np.all(
+            np.asarray(fluid.specific_ratio) > 1.0
+        ), f"[Error]: Fluid {name} needs a specific ratio > 1"
+        assert fluid.specific_gas_constant is not None and np.all(
+            np.asarray(fluid.specific_gas_constant) > 0.0
+        ), f"[Error]: Fluid {name} needs a specific gas constant"
+        assert fluid.kinematic_viscosity is not None, f"[Error]: Fluid {name} needs a kinematic viscosity"
+        fluid.Freeze()
+
+        with self._lock:
+            assert replace or name not in self._fluids, f"[Error]: Fluid {name} is already registered"
+            self._fluids[name] = fluid
+        logger.info(f"Registered fluid {name}")
+        return fluid
+
+    def Mixture(self, composition: dict, basis: str = "mole") -> WorkingFluid:
+        """
+        Mixture of fluids of the registry given as {name: fraction}, the
+        same frozen fluid for every call with the same composition
+        """
+        for name in composition:
+            assert name in self, f"[Error]: Unknown mixture component {name}"
+        return CachedMixture([self[name] for name in composition], list(composition.values()), basis)
+
+    def __getitem__(self, name: str) -> WorkingFluid:
+        return self._fluids[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fluids
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._fluids)
+
+
+def _IsMixture(fluid: dict | WorkingFluid) -> bool:
+    return isinstance(fluid, dict) and ("mole_fractions" in fluid or "mass_fractions" in fluid)
+
+
+def _ReadDatabase(path: str) -> dict:
+    import json
+
+    with open(path, "r") as fluid_database_file:
+        return json.load(fluid_database_file)
+
+
+def _DatabaseChecksum(path: str) -> int:
+    with open(path, "rb") as fluid_database_file:
+        return zlib.crc32(fluid_database_file.read())
+
+
+def CompileFluidDatabase(path: str = FLUID_DATABASE_PATH, output: str = COMPILED_DATABASE_PATH) -> None:
+    """
+    Writes the precompiled form of the fluid database, see the module
+    description
+    """
+    import pprint
+
+    database = _ReadDatabase(path)
+    with open(output, "w") as compiled_file:
+        compiled_file.write(
+            '"""\n'
+            "Author: Alejandro Valencia\n"
+            "Centrifugal Compressor Preliminary Design\n"
+            "Compiled Fluid Database\n"
+            "\n"
+            "Generated from fluids.json by python -m ccpd.utilities.fluid_registry,\n"
+            "do not edit\n"
+            '"""\n'
+            "\n"
+            f"SOURCE_CHECKSUM = {_DatabaseChecksum(path)}\n"
+            "\n"
+            f"FLUIDS = {pprint.pformat(database, width=120, sort_dicts=False)}\n"
+        )
+    logger.info(f"Compiled {path} into {output}")
+
+
+def LoadFluidDatabase() -> dict:
+    """
+    Properties of the fluids of the database, from its precompiled form
+    when that is up to date with fluids.json
+    """
+    from ccpd.fluids import fluid_database
+
+    if fluid_database.SOURCE_CHECKSUM == _DatabaseChecksum(FLUID_DATABASE_PATH):
+        return fluid_database.FLUIDS
+    logger.warning(f"{FLUID_DATABASE_PATH} changed since it was compiled, run python -m ccpd.utilities.fluid_registry")
+    return _ReadDatabase(FLUID_DATABASE_PATH)
+
+
+@functools.lru_cache(maxsize=None)
+def DefaultFluidRegistry() -> FluidRegistry:
+    """
+    Registry of the fluid database, read from disk on first use only
+    """
+    return FluidRegistry(LoadFluidDatabase())
+
+
+def RegisterFluid(name: str, fluid: dict | WorkingFluid, replace: bool = False) -> WorkingFluid:
+    """
+    Adds a fluid to the default registry, see FluidRegistry.Register
+    """
+    return DefaultFluidRegistry().Register(name, fluid, replace)
+
+
+def MixtureFluid(composition: dict, basis: str = "mole") -> WorkingFluid:
+    """
+    Mixture of fluids of the default registry, see FluidRegistry.Mixture
+    """
+    return DefaultFluidRegistry().Mixture(composition, basis)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    CompileFluidDatabase()
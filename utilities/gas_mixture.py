@@ -0,0 +1,147 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Gas Mixtures
+Update: October 17, 2026
+
+Working fluids of gas mixtures, e.g. hydrogen blended with natural gas or
+humid air, from the fluids of their components and their mole or mass
+fractions. The mixture is an ideal mixture of its components:
+
+    R     = sum(y_i R_i)                  y mass fractions, x mole fractions
+    cp    = sum(y_i cp_i)
+    gamma = cp / sum(y_i cp_i / gamma_i)
+    mu    = sum(x_i mu_i / sum_j(x_j phi_ij))    Wilke
+
+    phi_ij = (1 + (mu_i / mu_j)^0.5 (M_j / M_i)^0.25)^2 / (8 (1 + M_i / M_j))^0.5
+
+with the molar masses M_i = R_u / R_i. The NASA polynomials of the mixture
+are the mass weighted polynomials of its components, when they all have
+the same temperature ranges, so the tabulated gas model applies to it as
+well, with the viscosity of the mixture kept constant. The critical point
+and acentric factor follow Kay's rule, mole weighted, for the real gas
+equation of state.
+
+Fractions may be arrays with one entry per design, one array per
+component, which gives a fluid with array properties for batch designs,
+see batch_centrifugal_calcs. The tabulated gas model and the real gas
+equation of state need one composition per fluid.
+
+Mixtures are cached per composition, so every design of a composition
+shares the same fluid together with its derived constants and tables.
+"""
+
+from ccpd.data_types.working_fluid import WorkingFluid
+import functools
+import numpy as np
+
+MIXTURE_BASES = ("mole", "mass")
+
+# [J/(kmol K)]
+UNIVERSAL_GAS_CONSTANT = 8314.462618
+
+# Mixtures kept by CachedMixture, sweeps over many compositions drop the
+#   least recently used ones
+MIXTURE_CACHE_SIZE = 4096
+
+
+def _Column(values: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+    # One value per component, broadcast against fractions of any number of
+    #   designs
+    return np.reshape(values, values.shape + (1,) * (fractions.ndim - 1))
+
+
+def _WilkeViscosity(viscosity: np.ndarray, molar_mass: np.ndarray, mole_fractions: np.ndarray) -> np.ndarray:
+    viscosity_ratio = viscosity[:, None] / viscosity[None, :]
+    mass_ratio = molar_mass[:, None] / molar_mass[None, :]
+    phi = (1.0 + np.sqrt(viscosity_ratio) * mass_ratio.T**0.25) ** 2 / np.sqrt(8.0 * (1.0 + mass_ratio))
+    denominators = np.tensordot(phi, mole_fractions, axes=(1, 0))
+    return np.sum(mole_fractions * _Column(viscosity, mole_fractions) / denominators, axis=0)
+
+
+def _MixturePolynomials(fluids: list, mass_fractions: np.ndarray, gas_constant: float) -> dict:
+    if mass_fractions.ndim > 1 or any(fluid.nasa_polynomials is None for fluid in fluids):
+        return None
+    ranges = fluids[0].nasa_polynomials["temperature_ranges"]
+    if any(list(fluid.nasa_polynomials["temperature_ranges"]) != list(ranges) for fluid in fluids):
+        return None
+    # cp / R of the mixture, the polynomials of the components are per unit
+    #   of their own gas constant
+    coefficients = sum(
+        fraction * fluid.specific_gas_constant * np.asarray(fluid.nasa_polynomials["coefficients"])
+        for fraction, fluid in zip(mass_fractions, fluids)
+    )
+    return {"temperature_ranges": list(ranges), "coefficients": (coefficients / gas_constant).tolist()}
+
+
+def _KayRule(fluids: list, mole_fractions: np.ndarray, name: str):
+    values = [getattr(fluid, name) for fluid in fluids]
+    if any(value is None for value in values):
+        return None
+    return np.sum(mole_fractions * _Column(np.array(values, dtype=float), mole_fractions), axis=0)
+
+
+def _Scalar(value):
+    return float(value) if isinstance(value, np.ndarray) and value.ndim == 0 else value
+
+
+def MixFluids(fluids: list, fractions, basis: str = "mole") -> WorkingFluid:
+    """
+    Working fluid of the mixture of the given fluids. The fractions have
+    one entry per fluid, each a scalar or an array with one entry per
+    design, and add up to one.
+    """
+    assert basis in MIXTURE_BASES, f"[Error]: Unknown mixture basis {basis}, use one of {MIXTURE_BASES}"
+    fractions = np.array(np.broadcast_arrays(*[np.asarray(fraction, dtype=float) for fraction in fractions]))
+    assert len(fractions) == len(fluids) > 0, "[Error]: A mixture needs one fraction per component"
+    assert np.all(fractions >= 0.0), "[Error]: Mixture fractions must not be negative"
+    assert np.allclose(np.sum(fractions, axis=0), 1.0, atol=1e-6), "[Error]: Mixture fractions must add up to one"
+    fractions = fractions / np.sum(fractions, axis=0)
+
+    # [A]:Mole & Mass Fractions
+    gas_constants = np.array([fluid.specific_gas_constant for fluid in fluids], dtype=float)
+    molar_mass = _Column(UNIVERSAL_GAS_CONSTANT / gas_constants, fractions)
+    if basis == "mole":
+        mole_fractions = fractions
+        mass_fractions = fractions * molar_mass / np.sum(fractions * molar_mass, axis=0)
+    else:
+        mass_fractions = fractions
+        mole_fractions = fractions / molar_mass / np.sum(fractions / molar_mass, axis=0)
+
+    # [B]:Mixing Rules
+    specific_heats = _Column(np.array([fluid.specific_heat for fluid in fluids], dtype=float), fractions)
+    specific_ratios = _Column(np.array([fluid.specific_ratio for fluid in fluids], dtype=float), fractions)
+    specific_heat = np.sum(mass_fractions * specific_heats, axis=0)
+    isochoric_specific_heat = np.sum(mass_fractions * specific_heats / specific_ratios, axis=0)
+    gas_constant = np.sum(mass_fractions * _Column(gas_constants, fractions), axis=0)
+    viscosity = _WilkeViscosity(
+        np.array([fluid.kinematic_viscosity for fluid in fluids], dtype=float),
+        UNIVERSAL_GAS_CONSTANT / gas_constants,
+        mole_fractions,
+    )
+
+    mixture = {
+        "specific_heat": specific_heat,
+        "specific_ratio": specific_heat / isochoric_specific_heat,
+        "specific_gas_constant": gas_constant,
+        "kinematic_viscosity": viscosity,
+        "nasa_polynomials": _MixturePolynomials(fluids, mass_fractions, gas_constant),
+        "critical_temperature": _KayRule(fluids, mole_fractions, "critical_temperature"),
+        "critical_pressure": _KayRule(fluids, mole_fractions, "critical_pressure"),
+        "acentric_factor": _KayRule(fluids, mole_fractions, "acentric_factor"),
+    }
+    return WorkingFluid({name: _Scalar(value) for name, value in mixture.items()})
+
+
+@functools.lru_cache(maxsize=MIXTURE_CACHE_SIZE)
+def _CachedMixture(fluids: tuple, fractions: bytes, shape: tuple, basis: str) -> WorkingFluid:
+    return MixFluids(list(fluids), np.frombuffer(fractions).reshape(shape), basis).Freeze()
+
+
+def CachedMixture(fluids: list, fractions, basis: str = "mole") -> WorkingFluid:
+    """
+    MixFluids computed once per composition, later calls with the same
+    fluids and fractions return the same fluid, frozen as it is shared
+    """
+    fractions = np.array(np.broadcast_arrays(*[np.asarray(fraction, dtype=float) for fraction in fractions]))
+    return _CachedMixture(tuple(fluids), fractions.tobytes(), fractions.shape, basis)
@@ -0,0 +1,150 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Temperature Dependent Gas Properties
+Update: October 17, 2026
+
+With the "constant" gas model (the default) a WorkingFluid keeps the
+specific heat, specific ratio and viscosity of the fluid database at every
+temperature. With the "tabulated" model each stage evaluates them at its
+own temperature instead:
+
+    cp(T) / R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4    NASA polynomials
+    gamma(T)  = cp(T) / (cp(T) - R)
+    mu(T)     = mu_ref (T / T_ref)^1.5 (T_ref + S) / (T + S)    Sutherland
+
+The polynomials have one set of coefficients per temperature range, given
+in the fluid database as
+
+    "nasa_polynomials": {
+        "temperature_ranges": [200.0, 1000.0, 3500.0],
+        "coefficients": [[a1, ..., a5], [a1, ..., a5]]
+    }
+
+together with the Sutherland temperature S of the fluid. The viscosity of
+the database is taken as mu_ref at the viscosity reference temperature.
+
+The expressions are evaluated once per fluid on a dense temperature grid,
+see PropertyTable, and a stage looks its properties up by linear
+interpolation, on scalars or on whole arrays of temperatures. Temperatures
+outside of the polynomial ranges take the properties of the closest end.
+"""
+
+from ccpd.data_types.working_fluid import FluidKey, WorkingFluid
+from dataclasses import dataclass
+import functools
+import numpy as np
+
+GAS_MODELS = ("constant", "tabulated")
+DEFAULT_GAS_MODEL = "constant"
+
+# [K] Spacing of the property tables, the interpolation error of cp is
+#   below 1e-6 relative for the fluids of the database
+TABLE_STEP = 1.0
+
+# Property tables kept by GetPropertyTable, the least recently used are
+#   dropped
+PROPERTY_TABLE_CACHE_SIZE = 256
+
+
+def NasaSpecificHeat(fluid: WorkingFluid, temperature) -> np.ndarray:
+    """
+    Specific heat from the NASA polynomials of the fluid, in [J/(kg K)]
+    """
+    temperature = np.asarray(temperature, dtype=float)
+    ranges = np.asarray(fluid.nasa_polynomials["temperature_ranges"], dtype=float)
+    coefficients = np.asarray(fluid.nasa_polynomials["coefficients"], dtype=float)
+    assert (
+        coefficients.shape[0] == len(ranges) - 1
+    ), "[Error]: NASA polynomials need one set of coefficients per temperature range"
+
+    # Each temperature uses the polynomial of its range, ranges share their
+    #   boundaries so the upper range starts at the boundary itself
+    range_index = np.clip(np.searchsorted(ranges, temperature, side="right") - 1, 0, len(ranges) - 2)
+    powers = temperature[..., None] ** np.arange(coefficients.shape[1])
+    return fluid.specific_gas_constant * np.sum(coefficients[range_index] * powers, axis=-1)
+
+
+def SutherlandViscosity(fluid: WorkingFluid, temperature) -> np.ndarray:
+    """
+    Viscosity of the fluid database scaled to the given temperature, it
+    stays constant for fluids without a Sutherland temperature
+    """
+    temperature = np.asarray(temperature, dtype=float)
+    if fluid.sutherland_temperature is None:
+        return np.full_like(temperature, fluid.kinematic_viscosity)
+    reference = fluid.viscosity_reference_temperature
+    return (
+        fluid.kinematic_viscosity
+        * (temperature / reference) ** 1.5
+        * (reference + fluid.sutherland_temperature)
+        / (temperature + fluid.sutherland_temperature)
+    )
+
+
+@dataclass(frozen=True)
+class PropertyTable:
+    """
+    Properties of a fluid on a uniform temperature grid
+    """
+
+    fluid: WorkingFluid
+    temperature: np.ndarray
+    specific_heat: np.ndarray
+    specific_ratio: np.ndarray
+    viscosity: np.ndarray
+
+    @classmethod
+    def FromFluid(cls, fluid: WorkingFluid, step: float = TABLE_STEP) -> "PropertyTable":
+        assert np.ndim(fluid.specific_heat) == 0, "[Error]: The tabulated gas model needs one composition per fluid"
+        assert fluid.nasa_polynomials is not None, "[Error]: The tabulated gas model needs NASA polynomials"
+        lowest, *_, highest = fluid.nasa_polynomials["temperature_ranges"]
+        temperature = np.linspace(lowest, highest, int(np.ceil((highest - lowest) / step)) + 1)
+        specific_heat = NasaSpecificHeat(fluid, temperature)
+        return cls(
+            fluid=fluid,
+            temperature=temperature,
+            specific_heat=specific_heat,
+            specific_ratio=specific_heat / (specific_heat - fluid.specific_gas_constant),
+            viscosity=SutherlandViscosity(fluid, temperature),
+        )
+
+    def __call__(self, temperature) -> WorkingFluid:
+        """
+        Working fluid with the properties at the given temperature, scalar
+        or array
+        """
+        fluid = WorkingFluid(
+            {
+                "specific_heat": np.interp(temperature, self.temperature, self.specific_heat),
+                "specific_ratio": np.interp(temperature, self.temperature, self.specific_ratio),
+                "specific_gas_constant": self.fluid.specific_gas_constant,
+                "kinematic_viscosity": np.interp(temperature, self.temperature, self.viscosity),
+            }
+        )
+        fluid.real_gas = self.fluid.real_gas
+        return fluid
+
+
+@functools.lru_cache(maxsize=PROPERTY_TABLE_CACHE_SIZE)
+def _CachedPropertyTable(key: FluidKey) -> PropertyTable:
+    return PropertyTable.FromFluid(key.fluid)
+
+
+def GetPropertyTable(fluid: WorkingFluid) -> PropertyTable:
+    """
+    Property table of a fluid, built on first use only. Fluids with the
+    same properties share a table, whether or not they are the same object.
+    """
+    return _CachedPropertyTable(fluid.cache_key)
+
+
+def FluidAt(fluid: WorkingFluid, temperature, gas_model: str = DEFAULT_GAS_MODEL) -> WorkingFluid:
+    """
+    Working fluid of a stage at the given temperature. The constant model
+    returns the fluid itself.
+    """
+    assert gas_model in GAS_MODELS, f"[Error]: Unknown gas model {gas_model}, use one of {GAS_MODELS}"
+    if gas_model == "constant":
+        return fluid
+    return GetPropertyTable(fluid)(temperature)
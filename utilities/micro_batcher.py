@@ -0,0 +1,156 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Micro Batcher
+Update: October 17, 2026
+
+Collects concurrent design requests and evaluates them together through
+batch_preliminary_design. A batch starts with the first request that
+arrives and is closed once the window has elapsed or it holds the maximum
+number of designs, so a request waits at most one window before its batch
+runs. The batches run one after the other on a thread of the batcher.
+
+Requests are keyed on their DesignInputs, which are frozen. A request equal
+to one that is still waiting or running shares its future instead of being
+computed again. Designs of different fluids or materials run as separate
+batches.
+
+The designs come from the batch engine and match the ones of main to the
+tolerances of the loops, see batch_centrifugal_calcs. They are shared by
+every caller of the same request and must not be modified.
+"""
+
+from ccpd.data_types.inputs import DesignInputs, InputsII
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from concurrent.futures import Future
+from dataclasses import dataclass
+import attrs
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchStatistics:
+    requests: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    designs: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.designs / self.batches if self.batches else 0.0
+
+
+class MicroBatcher:
+    def __init__(self, settings: SolverSettings = SolverSettings(), window: float = 0.005, max_batch_size: int = 256):
+        """
+        The window is in seconds
+        """
+        assert window >= 0.0, f"[Error]: The batch window can not be negative"
+        assert max_batch_size > 0, f"[Error]: A batch needs room for at least one design"
+        self.settings = settings
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.statistics = BatchStatistics()
+        self._queue = []
+        self._futures = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._Run, name="MicroBatcher", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "MicroBatcher":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.Close()
+
+    def Submit(self, design_inputs: DesignInputs) -> Future:
+        """
+        Schedules the design of the inputs, the future holds the
+        CentrifugalCompressor
+        """
+        with self._condition:
+            assert not self._closed, f"[Error]: The batcher is closed"
+            self.statistics.requests += 1
+            future = self._futures.get(design_inputs)
+            if future is not None:
+                self.statistics.coalesced += 1
+                return future
+
+            future = Future()
+            self._futures[design_inputs] = future
+            self._queue.append(design_inputs)
+            self._condition.notify()
+            return future
+
+    def Close(self) -> None:
+        """
+        Runs the requests still waiting and stops the batcher
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _NextBatch(self) -> list:
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._closed)
+            deadline = time.monotonic() + self.window
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0.0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            return batch
+
+    def _Run(self) -> None:
+        while True:
+            batch = self._NextBatch()
+            if not batch:
+                return
+            groups = {}
+            for design_inputs in batch:
+                groups.setdefault((design_inputs.fluid, design_inputs.material), []).append(design_inputs)
+            for (fluid, material), group in groups.items():
+                self._Evaluate(fluid, material, group)
+
+    def _Evaluate(self, fluid: str, material: str, group: list) -> None:
+        logger.info(f"Micro batch of {len(group)} {fluid} designs")
+        try:
+            columns = {
+                item.name: [getattr(design_inputs, item.name) for design_inputs in group]
+                for item in attrs.fields(InputsII)
+            }
+            result = batch_preliminary_design(
+                [design_inputs.specific_diameter for design_inputs in group],
+                [design_inputs.specific_rotational_speed for design_inputs in group],
+                [design_inputs.end_to_end_efficiency for design_inputs in group],
+                fluid,
+                material,
+                InputsII(**columns),
+                self.settings,
+                working_fluid=LoadWorkingFluid(fluid),
+            )
+            outcomes = [result.design(index) for index in range(len(group))]
+        except Exception as error:
+            logger.warning(f"Micro batch failed: {error!r}")
+            outcomes = [error] * len(group)
+
+        with self._condition:
+            self.statistics.batches += 1
+            self.statistics.designs += len(group)
+            futures = [self._futures.pop(design_inputs) for design_inputs in group]
+        for future, outcome in zip(futures, outcomes):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
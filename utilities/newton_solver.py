@@ -0,0 +1,311 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Coupled Newton Solver
+Update: October 17, 2026
+
+The preliminary design of main nests four fixed point loops: the end to end
+efficiency loop of main runs centrifugal_calcs, which runs the inlet density
+loop, the impeller efficiency loop and the vaneless diffuser density loop.
+Each inner loop is solved to its tolerance on every pass of the loop around
+it.
+
+This module instead solves for all the unknowns at once. With x the vector
+
+    [inlet density, impeller efficiency, vaneless diffuser density,
+     vaneless diffuser velocity, end to end efficiency]
+
+one pass through the stages maps x to G(x), the value of each unknown
+recomputed by its stage, and the design is the root of F(x) = G(x) / x - 1.
+The vaneless diffuser velocity is carried as an unknown because the
+friction of the vaneless diffuser depends on it, in the nested loops it is
+carried from one iteration to the next.
+
+F is solved with a damped Newton method. The Jacobian is computed by finite
+differences and then kept up to date with Broyden updates, it is only
+recomputed when a step fails to reduce the residual. Steps that do not
+reduce the residual with a fresh Jacobian are halved. Every lane of a batch
+is an independent system, solved in step with the others.
+"""
+
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.inputs import InputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.stages.outlet.friction_coefficient import DEFAULT_FRICTION_METHOD
+from ccpd.utilities.batch_centrifugal_calcs import (
+    STAGE_UNKNOWNS,
+    BatchResults,
+    _BroadcastInputs,
+    _LoopStatus,
+    _StageChain,
+    _StoreConvergence,
+)
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.cancellation import CheckCancelled
+from ccpd.utilities.gas_properties import DEFAULT_GAS_MODEL
+from ccpd.utilities.real_gas import DEFAULT_EQUATION_OF_STATE
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+UNKNOWNS = STAGE_UNKNOWNS + ["end_to_end_efficiency"]
+FINITE_DIFFERENCE_STEP = 1e-7
+MIN_DAMPING = 1.0 / 64.0
+
+# Tolerance of the passes that evaluate G(x): a lane only stops short of
+#   its update at an exact fixed point, where the update changes nothing
+PLAIN_PASS_TOLERANCE = float(np.finfo(float).smallest_subnormal)
+
+
+class _CoupledSystem:
+    """
+    Residual of the coupled system for a batch of designs. Every call runs
+    one pass through the stages for the requested lanes.
+    """
+
+    def __init__(
+        self,
+        specific_diameter: np.ndarray,
+        specific_speed: np.ndarray,
+        inputs: dict,
+        working_fluid: WorkingFluid,
+        gas_model: str = DEFAULT_GAS_MODEL,
+        equation_of_state: str = DEFAULT_EQUATION_OF_STATE,
+        friction_method: str = DEFAULT_FRICTION_METHOD,
+    ) -> None:
+        self.specific_diameter = specific_diameter
+        self.specific_speed = specific_speed
+        self.inputs = inputs
+        self.working_fluid = working_fluid
+        self.gas_model = gas_model
+        self.equation_of_state = equation_of_state
+        self.friction_method = friction_method
+        self.evaluations = 0
+
+    def Pass(
+        self, x: np.ndarray, lanes: np.ndarray, tolerance: float = PLAIN_PASS_TOLERANCE
+    ) -> tuple[BatchResults, np.ndarray]:
+        """
+        Runs a single iteration of every stage loop starting from the
+        unknowns x of the given lanes. Returns the designs and G(x).
+        """
+        self.evaluations += len(lanes)
+        result, images = _StageChain(
+            self.specific_diameter[lanes],
+            self.specific_speed[lanes],
+            x[:, -1],
+            {name: value[lanes] for name, value in self.inputs.items()},
+            self.working_fluid[lanes],
+            _SinglePass(tolerance, self.gas_model, self.equation_of_state, self.friction_method),
+            guesses={name: x[:, column] for column, name in enumerate(STAGE_UNKNOWNS)},
+        )
+        images = np.column_stack([images[name] for name in STAGE_UNKNOWNS] + [result.columns["total_efficiency"]])
+        return result, images
+
+    def __call__(self, x: np.ndarray, lanes: np.ndarray) -> np.ndarray:
+        _, images = self.Pass(x, lanes)
+        return images / x - 1.0
+
+    def Jacobian(self, x: np.ndarray, residual: np.ndarray, lanes: np.ndarray) -> np.ndarray:
+        """
+        Forward difference Jacobian of the residual
+        """
+        jacobian = np.zeros(residual.shape + (residual.shape[1],))
+        for column in range(0, x.shape[1]):
+            step = FINITE_DIFFERENCE_STEP * x[:, column]
+            perturbed = x.copy()
+            perturbed[:, column] += step
+            jacobian[:, :, column] = (self(perturbed, lanes) - residual) / step[:, None]
+        return jacobian
+
+    def InitialGuess(self, end_to_end_efficiency: np.ndarray) -> np.ndarray:
+        """
+        Starting point of the nested loops: the inlet at total density, an
+        isentropic impeller and the vaneless diffuser at the impeller
+        outlet conditions
+        """
+        lanes = np.arange(len(end_to_end_efficiency))
+        x = np.ones((len(lanes), len(UNKNOWNS)))
+        x[:, -1] = end_to_end_efficiency
+        result, _ = _StageChain(
+            self.specific_diameter,
+            self.specific_speed,
+            end_to_end_efficiency,
+            self.inputs,
+            self.working_fluid,
+            _SinglePass(PLAIN_PASS_TOLERANCE, self.gas_model, self.equation_of_state, self.friction_method),
+            guesses={"impeller_efficiency": x[:, 1]},
+        )
+        x[:, 0] = result.columns["inlet.thermodynamic_point.density.total"]
+        x[:, 2] = result.columns["outlet.thermodynamic_point.density.static"]
+        x[:, 3] = result.columns["outlet.blade.mid.absolute.magnitude"]
+        return x
+
+
+def _SinglePass(
+    tolerance: float,
+    gas_model: str = DEFAULT_GAS_MODEL,
+    equation_of_state: str = DEFAULT_EQUATION_OF_STATE,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
+) -> SolverSettings:
+    """
+    Settings that run a single plain iteration of every stage loop
+    """
+    single_pass = LoopSettings(1, tolerance)
+    return SolverSettings(
+        inlet=single_pass,
+        outlet=single_pass,
+        vaneless_diffuser=single_pass,
+        acceleration="none",
+        gas_model=gas_model,
+        equation_of_state=equation_of_state,
+        friction_method=friction_method,
+    )
+
+
+def _Norm(residual: np.ndarray) -> np.ndarray:
+    return np.max(np.abs(residual), axis=-1)
+
+
+def batch_newton_design(
+    specific_diameter: np.ndarray,
+    specific_speed: np.ndarray,
+    end_to_end_efficiency: np.ndarray,
+    fluid: str,
+    material: str,
+    inputs: InputsII,
+    max_iterations: int = 50,
+    tolerance: float = 1e-8,
+    working_fluid: WorkingFluid = None,
+    gas_model: str = DEFAULT_GAS_MODEL,
+    equation_of_state: str = DEFAULT_EQUATION_OF_STATE,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
+) -> BatchResults:
+    """
+    Alternative to batch_preliminary_design that solves the efficiency loop
+    and the stage loops as one coupled system with a damped Newton method,
+    see the module description. The inputs are broadcast as in
+    batch_centrifugal_calcs, the fluid properties follow the given gas
+    model and equation of state, see gas_properties and real_gas, and the
+    friction of the vaneless diffuser the given friction method, see
+    friction_coefficient.
+
+    A lane converges once every unknown matches its recomputed value to
+    the given relative tolerance. The Newton iteration count, final
+    residual and status are stored in the top level convergence columns,
+    the stage convergence columns hold the residual of each stage at the
+    solution.
+    """
+    if working_fluid is None:
+        working_fluid = LoadWorkingFluid(fluid)
+    specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid = _BroadcastInputs(
+        specific_diameter, specific_speed, end_to_end_efficiency, inputs, working_fluid
+    )
+    number_of_designs = len(specific_diameter)
+    system = _CoupledSystem(
+        specific_diameter, specific_speed, inputs, working_fluid, gas_model, equation_of_state, friction_method
+    )
+
+    # [A]:Initial Guess & Jacobian
+    all_lanes = np.arange(number_of_designs)
+    x = system.InitialGuess(end_to_end_efficiency)
+    residual = system(x, all_lanes)
+    jacobian = system.Jacobian(x, residual, all_lanes)
+    fresh_jacobian = np.ones(number_of_designs, dtype=bool)
+    damping = np.ones(number_of_designs)
+
+    active = _Norm(residual) >= tolerance
+    iterations = np.zeros(number_of_designs, dtype=np.int64)
+
+    for iteration in range(0, max_iterations):
+        iteration += 1
+        lanes = np.flatnonzero(active)
+        if lanes.size == 0:
+            break
+        iterations[lanes] = iteration
+        CheckCancelled()
+
+        # [B]:Newton Step
+        # Steps are shortened so every unknown stays positive
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.linalg.solve(jacobian[lanes], -residual[lanes][..., None])[..., 0]
+            shrink = np.min(np.where(step < 0.0, -0.5 * x[lanes] / step, np.inf), axis=1)
+        step *= np.minimum(damping[lanes], shrink)[:, None]
+        trial = x[lanes] + step
+        usable = np.all(np.isfinite(trial), axis=1)
+        trial[~usable] = x[lanes][~usable]
+        trial_residual = system(trial, lanes)
+
+        # [C]:Accept Steps That Reduce The Residual
+        accepted = usable & (_Norm(trial_residual) < _Norm(residual[lanes]))
+        accepted_lanes = lanes[accepted]
+        change = trial_residual[accepted] - residual[accepted_lanes]
+        step = step[accepted]
+        correction = change - np.einsum("lij,lj->li", jacobian[accepted_lanes], step)
+        jacobian[accepted_lanes] += np.einsum("li,lj->lij", correction, step) / np.sum(step**2, axis=1)[:, None, None]
+        x[accepted_lanes] = trial[accepted]
+        residual[accepted_lanes] = trial_residual[accepted]
+        damping[accepted_lanes] = np.minimum(1.0, 2.0 * damping[accepted_lanes])
+        fresh_jacobian[accepted_lanes] = False
+
+        # [D]:Rejected Steps
+        # A stale Jacobian is recomputed, a fresh one gets a shorter step
+        rejected_lanes = lanes[~accepted]
+        stale = rejected_lanes[~fresh_jacobian[rejected_lanes]]
+        if stale.size:
+            jacobian[stale] = system.Jacobian(x[stale], residual[stale], stale)
+            fresh_jacobian[stale] = True
+        damped = np.setdiff1d(rejected_lanes, stale)
+        damping[damped] *= 0.5
+
+        active[lanes] = (_Norm(residual[lanes]) >= tolerance) & (damping[lanes] >= MIN_DAMPING)
+
+    # [E]:Design At The Solution
+    result, _ = system.Pass(x, all_lanes, tolerance)
+    norm = _Norm(residual)
+    main_status = _LoopStatus(norm, tolerance)
+    _StoreConvergence(result.columns, "", iterations, norm, main_status)
+    result.status = np.maximum(result.status, main_status)
+    logger.info(
+        f"Newton solver finished in {iterations.max(initial=0)} iterations and "
+        + f"{system.evaluations / number_of_designs:0.1f} stage passes per design: "
+        + f"{np.count_nonzero(result.status == 0)}/{number_of_designs} designs converged"
+    )
+    return result
+
+
+def newton_design(
+    specific_diameter: float,
+    specific_speed: float,
+    end_to_end_efficiency: float,
+    fluid: str,
+    material: str,
+    inputs: InputsII,
+    max_iterations: int = 50,
+    tolerance: float = 1e-8,
+    working_fluid: WorkingFluid = None,
+    gas_model: str = DEFAULT_GAS_MODEL,
+    equation_of_state: str = DEFAULT_EQUATION_OF_STATE,
+    friction_method: str = DEFAULT_FRICTION_METHOD,
+) -> CentrifugalCompressor:
+    """
+    Scalar version of batch_newton_design, returns the design and its
+    convergence report as a CentrifugalCompressor
+    """
+    result = batch_newton_design(
+        specific_diameter,
+        specific_speed,
+        end_to_end_efficiency,
+        fluid,
+        material,
+        inputs,
+        max_iterations,
+        tolerance,
+        working_fluid,
+        gas_model,
+        equation_of_state,
+        friction_method,
+    )
+    return result.design(0)
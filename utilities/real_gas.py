@@ -0,0 +1,311 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Real Gas Equation of State
+Update: October 17, 2026
+
+With the "ideal" equation of state (the default) the stages use the ideal
+gas law, rho = P / (R T), and the ideal gas speed of sound, sqrt(gamma R T).
+With "peng_robinson" they use the Peng-Robinson equation of state instead
+
+    P = R T / (v - b) - a(T) / (v^2 + 2 b v - b^2)
+
+through a table of its properties over pressure and temperature:
+
+    Z                compressibility factor, rho = P / (Z R T)
+    a / a_ideal      ratio of the real to the ideal gas speed of sound
+    h - h_ideal      enthalpy departure [J/kg]
+
+Solving the cubic of the equation of state on every density evaluation of
+the stage loops would be far too slow, so the table is computed once per
+fluid on a grid uniform in log(P) and T, written to TABLE_DIRECTORY and
+memory mapped from there. Processes using the same fluid, e.g. the workers
+of a batch, share the pages of one file and only the first one computes
+it. Tables are only loaded from directories owned by the user and not
+writable by anyone else, so other users can not plant or change them.
+Lookups interpolate bilinearly on scalars or arrays, pressures and
+temperatures outside of the grid take the values of its closest edge.
+
+The equation of state needs the critical temperature and pressure and the
+acentric factor of the fluid, see fluids/fluids.json. The ideal gas part
+of its specific heats is the specific heat of the fluid database.
+
+Only the equation of state is replaced: the stages keep relating
+temperature changes to enthalpy changes through the specific heat, and the
+enthalpy departure is tabulated for reference.
+"""
+
+from ccpd.data_types.working_fluid import FluidKey, WorkingFluid
+from dataclasses import dataclass
+import copy
+import functools
+import logging
+import math
+import numpy as np
+import os
+
+logger = logging.getLogger(__name__)
+
+EQUATIONS_OF_STATE = ("ideal", "peng_robinson")
+DEFAULT_EQUATION_OF_STATE = "ideal"
+
+# Directory of the tables, None for ccpd/real_gas_tables in the cache
+#   directory of the user, $XDG_CACHE_HOME or ~/.cache. Fluids already
+#   loaded in the process keep the table they were given.
+TABLE_DIRECTORY = None
+
+# [Pa], [K] Grid of the tables, the interpolation errors of Z and of the
+#   speed of sound ratio are below 1e-4 relative for the fluids of the
+#   database up to 200 bar above 250 K, and below 1e-3 on the whole grid
+PRESSURE_RANGE = (1e4, 1e8)
+TEMPERATURE_RANGE = (150.0, 1500.0)
+GRID_SIZE = (241, 271)
+
+# Version of the table file format, part of the file name
+TABLE_VERSION = 1
+
+# Real gas fluids kept by WithEquationOfState, the least recently used are
+#   dropped
+REAL_GAS_CACHE_SIZE = 64
+
+
+def _PengRobinsonCoefficients(fluid: WorkingFluid, temperature: np.ndarray) -> tuple:
+    """
+    a(T), da/dT, d2a/dT2 and b of the fluid, per unit mass
+    """
+    gas_constant = fluid.specific_gas_constant
+    critical_temperature = fluid.critical_temperature
+    critical_pressure = fluid.critical_pressure
+    omega = fluid.acentric_factor
+
+    kappa = 0.37464 + 1.54226 * omega - 0.26992 * omega**2
+    a_critical = 0.45724 * gas_constant**2 * critical_temperature**2 / critical_pressure
+    b = 0.07780 * gas_constant * critical_temperature / critical_pressure
+
+    sqrt_alpha = 1.0 + kappa * (1.0 - np.sqrt(temperature / critical_temperature))
+    a = a_critical * sqrt_alpha**2
+    da = -a_critical * kappa * sqrt_alpha / np.sqrt(temperature * critical_temperature)
+    d2a = (
+        a_critical
+        * kappa
+        / (2.0 * temperature)
+        * (kappa / critical_temperature + sqrt_alpha / np.sqrt(temperature * critical_temperature))
+    )
+    return a, da, d2a, b
+
+
+def PengRobinsonProperties(fluid: WorkingFluid, pressure, temperature) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compressibility factor, speed of sound ratio and enthalpy departure of
+    the gas root of the Peng-Robinson equation of state
+    """
+    pressure, temperature = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(temperature, dtype=float))
+    gas_constant = fluid.specific_gas_constant
+    a, da, d2a, b = _PengRobinsonCoefficients(fluid, temperature)
+
+    # [A]:Compressibility Factor
+    # Newton iterations on the cubic from above its largest root, where the
+    #   cubic is increasing and convex, converge monotonically to that root
+    A = a * pressure / (gas_constant * temperature) ** 2
+    B = b * pressure / (gas_constant * temperature)
+    c2, c1, c0 = -(1.0 - B), A - 3.0 * B**2 - 2.0 * B, -(A * B - B**2 - B**3)
+    Z = 2.0 + 2.0 * B
+    for _ in range(0, 100):
+        step = (((Z + c2) * Z + c1) * Z + c0) / ((3.0 * Z + 2.0 * c2) * Z + c1)
+        Z = Z - step
+        if np.all(np.abs(step) < 1e-14 * Z):
+            break
+
+    # [B]:Speed of Sound
+    # a^2 = -v^2 (cp / cv) (dP/dv)_T with the specific heats of the ideal
+    #   gas plus their departures
+    volume = Z * gas_constant * temperature / pressure
+    denominator = volume**2 + 2.0 * b * volume - b**2
+    logarithm = np.log((volume + (1.0 + np.sqrt(2.0)) * b) / (volume + (1.0 - np.sqrt(2.0)) * b))
+    dpdt = gas_constant / (volume - b) - da / denominator
+    dpdv = -gas_constant * temperature / (volume - b) ** 2 + 2.0 * a * (volume + b) / denominator**2
+    isochoric_specific_heat = (
+        fluid.specific_heat - gas_constant + temperature * d2a / (2.0 * np.sqrt(2.0) * b) * logarithm
+    )
+    isobaric_specific_heat = isochoric_specific_heat - temperature * dpdt**2 / dpdv
+    speed_of_sound = np.sqrt(-(volume**2) * isobaric_specific_heat / isochoric_specific_heat * dpdv)
+    # Relative to the ideal gas limit of the same specific heats, so the
+    #   ratio tends to one at low pressure
+    ideal_specific_ratio = fluid.specific_heat / (fluid.specific_heat - gas_constant)
+    speed_of_sound_ratio = speed_of_sound / np.sqrt(ideal_specific_ratio * gas_constant * temperature)
+
+    # [C]:Enthalpy Departure
+    enthalpy_departure = (
+        pressure * volume - gas_constant * temperature + (temperature * da - a) / (2.0 * np.sqrt(2.0) * b) * logarithm
+    )
+    return Z, speed_of_sound_ratio, enthalpy_departure
+
+
+@dataclass(frozen=True)
+class RealGasTable:
+    """
+    Properties of a fluid on a grid uniform in log(P) and T, one array of
+    shape GRID_SIZE per property
+    """
+
+    compressibility: np.ndarray
+    speed_of_sound_ratio: np.ndarray
+    enthalpy_departure: np.ndarray
+
+    @staticmethod
+    def Grid() -> tuple[np.ndarray, np.ndarray]:
+        pressure = np.geomspace(*PRESSURE_RANGE, GRID_SIZE[0])
+        temperature = np.linspace(*TEMPERATURE_RANGE, GRID_SIZE[1])
+        return pressure, temperature
+
+    @classmethod
+    def Compute(cls, fluid: WorkingFluid) -> np.ndarray:
+        """
+        Table values of the fluid, stacked in the layout of the table file
+        """
+        pressure, temperature = cls.Grid()
+        return np.stack(PengRobinsonProperties(fluid, pressure[:, None], temperature[None, :]))
+
+    @classmethod
+    def FromFile(cls, path: str) -> "RealGasTable":
+        # Plain views of the memory map, a np.memmap adds Python overhead to
+        #   every operation on it
+        values = np.asarray(np.load(path, mmap_mode="r"))
+        return cls(*values)
+
+    def _Interpolate(self, values: np.ndarray, pressure, temperature):
+        if np.ndim(pressure) == 0 and np.ndim(temperature) == 0:
+            return self._InterpolateScalar(values, float(pressure), float(temperature))
+        x = (np.log(pressure) - np.log(PRESSURE_RANGE[0])) / (
+            np.log(PRESSURE_RANGE[1] / PRESSURE_RANGE[0]) / (GRID_SIZE[0] - 1)
+        )
+        y = (temperature - TEMPERATURE_RANGE[0]) / ((TEMPERATURE_RANGE[1] - TEMPERATURE_RANGE[0]) / (GRID_SIZE[1] - 1))
+        x = np.clip(x, 0.0, GRID_SIZE[0] - 1)
+        y = np.clip(y, 0.0, GRID_SIZE[1] - 1)
+        # Points of diverged designs, NaN, interpolate to NaN from cell zero
+        i = np.minimum(np.nan_to_num(x).astype(np.intp), GRID_SIZE[0] - 2)
+        j = np.minimum(np.nan_to_num(y).astype(np.intp), GRID_SIZE[1] - 2)
+        x -= i
+        y -= j
+        return (values[i, j] * (1.0 - x) + values[i + 1, j] * x) * (1.0 - y) + (
+            values[i, j + 1] * (1.0 - x) + values[i + 1, j + 1] * x
+        ) * y
+
+    def _InterpolateScalar(self, values: np.ndarray, pressure: float, temperature: float) -> float:
+        # The scalar stage loops look up one point at a time, where the array
+        #   operations above cost several times the arithmetic itself
+        if not (pressure > 0.0 and temperature == temperature):
+            return math.nan
+        x = (math.log(pressure) - math.log(PRESSURE_RANGE[0])) / (
+            math.log(PRESSURE_RANGE[1] / PRESSURE_RANGE[0]) / (GRID_SIZE[0] - 1)
+        )
+        y = (temperature - TEMPERATURE_RANGE[0]) / ((TEMPERATURE_RANGE[1] - TEMPERATURE_RANGE[0]) / (GRID_SIZE[1] - 1))
+        x = min(max(x, 0.0), GRID_SIZE[0] - 1)
+        y = min(max(y, 0.0), GRID_SIZE[1] - 1)
+        i = min(int(x), GRID_SIZE[0] - 2)
+        j = min(int(y), GRID_SIZE[1] - 2)
+        x -= i
+        y -= j
+        (v00, v01), (v10, v11) = values[i : i + 2, j : j + 2].tolist()
+        return (v00 * (1.0 - x) + v10 * x) * (1.0 - y) + (v01 * (1.0 - x) + v11 * x) * y
+
+    def Compressibility(self, pressure, temperature):
+        return self._Interpolate(self.compressibility, pressure, temperature)
+
+    def SpeedOfSoundRatio(self, pressure, temperature):
+        return self._Interpolate(self.speed_of_sound_ratio, pressure, temperature)
+
+    def EnthalpyDeparture(self, pressure, temperature):
+        return self._Interpolate(self.enthalpy_departure, pressure, temperature)
+
+
+def _TablePath(fluid: WorkingFluid, directory: str) -> str:
+    # Only designs with a real gas equation of state need hashlib and
+    #   tempfile, the ideal gas ones never import them
+    import hashlib
+
+    key = (
+        TABLE_VERSION,
+        fluid.specific_heat,
+        fluid.specific_ratio,
+        fluid.specific_gas_constant,
+        fluid.critical_temperature,
+        fluid.critical_pressure,
+        fluid.acentric_factor,
+        PRESSURE_RANGE,
+        TEMPERATURE_RANGE,
+        GRID_SIZE,
+    )
+    return os.path.join(directory, f"peng_robinson_{hashlib.sha256(repr(key).encode()).hexdigest()[:16]}.npy")
+
+
+def _TableDirectory(directory: str = None) -> str:
+    """
+    Creates the table directory when missing, readable by the user only,
+    and checks that nobody else can write to it
+    """
+    if directory is None:
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(cache, "ccpd", "real_gas_tables")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    status = os.stat(directory)
+    # Windows has neither user ids nor these permission bits
+    if hasattr(os, "getuid"):
+        assert (
+            status.st_uid == os.getuid() and not status.st_mode & 0o022
+        ), f"[Error]: Real gas table directory {directory} must be owned by the user and not writable by others"
+    return directory
+
+
+def LoadRealGasTable(fluid: WorkingFluid, directory: str = None) -> RealGasTable:
+    """
+    Memory maps the table of the fluid, computing and writing it first when
+    the directory does not have it yet. The directory defaults to
+    TABLE_DIRECTORY as set when the table is loaded, see _TableDirectory
+    for the checks it must pass.
+    """
+    assert (
+        np.ndim(fluid.critical_temperature) == 0
+    ), "[Error]: The Peng-Robinson equation of state needs one composition per fluid"
+    assert (
+        fluid.critical_temperature and fluid.critical_pressure and fluid.acentric_factor is not None
+    ), "[Error]: The Peng-Robinson equation of state needs the critical point and acentric factor of the fluid"
+    import tempfile
+
+    directory = _TableDirectory(directory or TABLE_DIRECTORY)
+    path = _TablePath(fluid, directory)
+    if not os.path.exists(path):
+        logger.info(f"Computing real gas table {path}")
+        # Written under a temporary name and renamed, so processes that
+        #   compute the same table at once never read a partial file
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as table_file:
+                np.save(table_file, RealGasTable.Compute(fluid))
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+    return RealGasTable.FromFile(path)
+
+
+@functools.lru_cache(maxsize=REAL_GAS_CACHE_SIZE)
+def _RealGasFluid(key: FluidKey) -> WorkingFluid:
+    real_gas_fluid = copy.copy(key.fluid)
+    real_gas_fluid.real_gas = LoadRealGasTable(key.fluid)
+    return real_gas_fluid.Freeze()
+
+
+def WithEquationOfState(fluid: WorkingFluid, equation_of_state: str = DEFAULT_EQUATION_OF_STATE) -> WorkingFluid:
+    """
+    Working fluid following the given equation of state, see
+    WorkingFluid.Density and WorkingFluid.SpeedOfSound. The ideal equation
+    of state returns the fluid itself, the others a copy of it, the same
+    copy on every call with a fluid of the same properties.
+    """
+    assert (
+        equation_of_state in EQUATIONS_OF_STATE
+    ), f"[Error]: Unknown equation of state {equation_of_state}, use one of {EQUATIONS_OF_STATE}"
+    if equation_of_state == "ideal":
+        return fluid
+    return _RealGasFluid(fluid.cache_key)
@@ -0,0 +1,154 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Columnar Result Store
+Update: October 17, 2026
+
+On disk store of design results, one column per field of
+CentrifugalCompressor, see COMPRESSOR_FIELDS, plus the status of each
+design and any other columns of the writer, e.g. the inputs of a sweep. A
+store is a directory with
+
+    schema.json     number of rows, name and dtype of every column and the
+                    metadata of the writer
+    <column>.bin    the values of a column, raw and little endian
+
+Columns are read as read only memory maps: opening a store of any size
+copies nothing, slices of rows only read the pages they touch and
+processes that open the same store share those pages.
+
+A ResultWriter appends rows chunk by chunk. The rows are written to the
+column files before the row count of the schema is updated, and the schema
+is replaced atomically, so a store opened while it is being written holds
+the rows appended until then.
+"""
+
+from ccpd.data_types.compressor_batch import COMPRESSOR_FIELDS
+from ccpd.utilities.batch_centrifugal_calcs import BatchResults
+import json
+import logging
+import numpy as np
+import os
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_FILE = "schema.json"
+STORE_VERSION = 1
+
+# Columns of every store, besides the ones given to the writer
+RESULT_COLUMNS = {path: "<f8" for path in COMPRESSOR_FIELDS} | {"status": "|i1"}
+
+
+def _ColumnPath(directory: str, name: str) -> str:
+    return os.path.join(directory, f"{name}.bin")
+
+
+def _WriteSchema(directory: str, schema: dict) -> None:
+    temporary_path = os.path.join(directory, f"{SCHEMA_FILE}.tmp")
+    with open(temporary_path, "w") as schema_file:
+        json.dump(schema, schema_file, indent=2)
+    os.replace(temporary_path, os.path.join(directory, SCHEMA_FILE))
+
+
+class ResultWriter:
+    """
+    Writes a new store, see the module description. The extra columns are
+    given as {name: dtype} and the metadata must be JSON serializable.
+    """
+
+    def __init__(self, directory: str, columns: dict = None, metadata: dict = None) -> None:
+        assert not os.path.exists(
+            os.path.join(directory, SCHEMA_FILE)
+        ), f"[Error]: {directory} already holds a result store"
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.columns = RESULT_COLUMNS | {name: np.dtype(dtype).str for name, dtype in (columns or {}).items()}
+        self.rows = 0
+        self.metadata = metadata or {}
+        self._files = {name: open(_ColumnPath(directory, name), "wb") for name in self.columns}
+        self._WriteSchema()
+
+    def _WriteSchema(self) -> None:
+        _WriteSchema(
+            self.directory,
+            {
+                "version": STORE_VERSION,
+                "rows": self.rows,
+                "columns": [{"name": name, "dtype": dtype} for name, dtype in self.columns.items()],
+                "metadata": self.metadata,
+            },
+        )
+
+    def Append(self, result: BatchResults, columns: dict = None) -> None:
+        """
+        Appends the designs of a batch and the given values of the extra
+        columns, one per design
+        """
+        values = {"status": result.status} | result.columns | (columns or {})
+        assert (
+            values.keys() >= self.columns.keys()
+        ), f"[Error]: Missing result store columns {sorted(self.columns.keys() - values.keys())}"
+        for name, dtype in self.columns.items():
+            column = np.asarray(values[name], dtype=dtype)
+            assert column.shape == (len(result),), f"[Error]: Column {name} needs one value per design"
+            column.tofile(self._files[name])
+        for column_file in self._files.values():
+            column_file.flush()
+        self.rows += len(result)
+        self._WriteSchema()
+
+    def Close(self) -> None:
+        for column_file in self._files.values():
+            column_file.close()
+        logger.info(f"Wrote {self.rows} designs to {self.directory}")
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.Close()
+
+
+class ResultStore:
+    """
+    Reads a store, see the module description. Columns are memory maps of
+    the rows written when the store was opened.
+    """
+
+    def __init__(self, directory: str) -> None:
+        with open(os.path.join(directory, SCHEMA_FILE), "r") as schema_file:
+            schema = json.load(schema_file)
+        assert schema["version"] == STORE_VERSION, f"[Error]: Unknown result store version {schema['version']}"
+        self.directory = directory
+        self.rows = schema["rows"]
+        self.dtypes = {column["name"]: np.dtype(column["dtype"]) for column in schema["columns"]}
+        self.metadata = schema["metadata"]
+        self._columns = {}
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.dtypes)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            assert name in self.dtypes, f"[Error]: Unknown result store column {name}"
+            if self.rows == 0:
+                self._columns[name] = np.empty(0, dtype=self.dtypes[name])
+            else:
+                self._columns[name] = np.memmap(
+                    _ColumnPath(self.directory, name), dtype=self.dtypes[name], mode="r", shape=(self.rows,)
+                )
+        return self._columns[name]
+
+    def Rows(self, start: int = 0, stop: int = None) -> BatchResults:
+        """
+        Designs of a range of rows, their columns are views of the store
+        """
+        rows = slice(start, stop)
+        return BatchResults(
+            columns={path: self[path][rows] for path in COMPRESSOR_FIELDS},
+            status=self["status"][rows],
+        )
@@ -0,0 +1,94 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Stage Dependency Graph
+Update: October 17, 2026
+
+The preliminary design runs its stages in a fixed order, each stage using
+the design parameters and the outputs of the stages before it. When the
+efficiency loop of main reruns the stages only the efficiency guess
+changes, so every stage that does not depend on it recomputes the same
+outputs.
+
+A StageGraph runs the stages in order and keeps the outputs of the last run
+of each stage together with the key it was run with: the values of the
+parameters it reads and the versions of the outputs of the stages it
+depends on. A stage whose key did not change returns its cached outputs
+instead of running, and downstream stages see the same version of them.
+
+The cached outputs are shared with the stages that read them, so a stage
+must copy any output of another stage before modifying it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    A stage of the design. The function is called with the values of the
+    parameters followed by the outputs of the dependencies, in order.
+    """
+
+    name: str
+    function: Callable
+    parameters: tuple = ()
+    dependencies: tuple = ()
+
+
+@dataclass
+class _CacheEntry:
+    key: tuple
+    outputs: Any
+    version: int
+
+
+@dataclass
+class StageGraph:
+    stages: list
+    hits: dict = field(default_factory=dict)
+    misses: dict = field(default_factory=dict)
+    _cache: dict = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        names = set()
+        for stage in self.stages:
+            assert stage.name not in names, f"[Error]: Duplicated stage {stage.name}"
+            missing = [dependency for dependency in stage.dependencies if dependency not in names]
+            assert not missing, f"[Error]: Stage {stage.name} runs before its dependencies {missing}"
+            names.add(stage.name)
+            self.hits[stage.name] = 0
+            self.misses[stage.name] = 0
+
+    def Run(self, **parameters) -> dict:
+        """
+        Runs the stages on the given parameters and returns the outputs of
+        every stage by name
+        """
+        outputs = {}
+        for stage in self.stages:
+            key = tuple(parameters[name] for name in stage.parameters) + tuple(
+                self._cache[dependency].version for dependency in stage.dependencies
+            )
+            entry = self._cache.get(stage.name)
+            if entry is not None and entry.key == key:
+                self.hits[stage.name] += 1
+                logger.debug(f"Stage {stage.name}: reusing cached outputs")
+                outputs[stage.name] = entry.outputs
+                continue
+
+            self.misses[stage.name] += 1
+            outputs[stage.name] = stage.function(
+                *(parameters[name] for name in stage.parameters),
+                *(outputs[dependency] for dependency in stage.dependencies),
+            )
+            version = 0 if entry is None else entry.version + 1
+            self._cache[stage.name] = _CacheEntry(key, outputs[stage.name], version)
+        return outputs
+
+    def Clear(self) -> None:
+        self._cache.clear()
@@ -0,0 +1,138 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import attrs
+import numpy as np
+from ccpd.api import CreateInputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings, ToleranceSchedule
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import (
+    COMPRESSOR_FIELDS,
+    batch_centrifugal_calcs,
+    batch_preliminary_design,
+)
+from ccpd.utilities.centrifugal_calcs import centrifugal_calcs
+
+
+def GetField(design, path: str) -> float:
+    for name in path.split("."):
+        design = getattr(design, name)
+    return design
+
+
+class TestBatchCentrifugalCalcs(unittest.TestCase):
+    tolerance = 1e-5
+
+    def test_given_design_points_expect_same_results_as_scalar_calcs(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        specific_diameter = np.array([3.8, 3.5, 4.2])
+        specific_speed = np.array([0.6, 0.65, 0.55])
+        end_to_end_efficiency = np.array([0.85, 0.8, 0.9])
+
+        # Call
+        result = batch_centrifugal_calcs(
+            specific_diameter, specific_speed, end_to_end_efficiency, "hydrogen", "aluminum", inputs
+        )
+
+        # Expect
+        self.assertEqual(len(result), 3)
+        for index in range(len(result)):
+            design = centrifugal_calcs(
+                specific_diameter[index],
+                specific_speed[index],
+                end_to_end_efficiency[index],
+                "hydrogen",
+                "aluminum",
+                inputs,
+            )
+            for path in COMPRESSOR_FIELDS:
+                expected = GetField(design, path)
+                self.assertAlmostEqual(
+                    result[path][index],
+                    expected,
+                    delta=self.tolerance * max(abs(expected), 1.0),
+                    msg=path,
+                )
+
+    def test_given_array_inputs_expect_broadcast_against_design_parameters(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        mass_flow_rates = np.array([1.0, 1.5, 2.0])
+        array_inputs = attrs.evolve(inputs, mass_flow_rate=mass_flow_rates)
+
+        # Call
+        result = batch_centrifugal_calcs(3.8, 0.6, 0.85, "hydrogen", "aluminum", array_inputs)
+
+        # Expect
+        self.assertEqual(len(result), 3)
+        self.assertTrue(np.all(np.diff(result["geometry.outer_diameter"]) > 0.0))
+        self.assertTrue(np.all(result.status == SolverStatus.CONVERGED))
+
+    def test_given_too_few_iterations_expect_max_iterations_status(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+
+        # Call
+        result = batch_centrifugal_calcs(
+            [3.8, 3.8],
+            0.6,
+            0.85,
+            "hydrogen",
+            "aluminum",
+            inputs,
+            SolverSettings(vaneless_diffuser=LoopSettings(1, 1e-3)),
+        )
+
+        # Expect
+        self.assertTrue(np.all(result.status == SolverStatus.MAX_ITERATIONS))
+        self.assertTrue(np.all(result["inlet.convergence.status"] == SolverStatus.CONVERGED))
+        self.assertTrue(np.all(result["vaneless_diffuser.convergence.iterations"] == 1))
+        self.assertFalse(result.design(0).converged)
+
+
+class TestBatchPreliminaryDesign(unittest.TestCase):
+    def test_given_tolerance_schedule_expect_same_design_as_exact_inner_loops(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        scheduled = SolverSettings(tolerance_schedule=ToleranceSchedule(True, 1e-1, 1e-1))
+
+        # Call
+        exact_result = batch_preliminary_design([3.6, 3.8, 4.0], 0.6, 0.85, "hydrogen", "aluminum", inputs)
+        scheduled_result = batch_preliminary_design(
+            [3.6, 3.8, 4.0], 0.6, 0.85, "hydrogen", "aluminum", inputs, scheduled
+        )
+
+        # Expect
+        self.assertTrue(np.all(scheduled_result.status == SolverStatus.CONVERGED))
+        np.testing.assert_allclose(scheduled_result["total_efficiency"], exact_result["total_efficiency"], rtol=1e-4)
+
+    def test_given_neighbour_guesses_expect_fewer_stage_iterations_and_same_design(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        neighbour = batch_preliminary_design([3.6, 3.8, 4.0], 0.6, 0.85, "hydrogen", "aluminum", inputs)
+
+        # Call
+        cold = batch_preliminary_design([3.62, 3.82, 4.02], 0.6, 0.85, "hydrogen", "aluminum", inputs)
+        warm = batch_preliminary_design(
+            [3.62, 3.82, 4.02],
+            0.6,
+            neighbour["total_efficiency"],
+            "hydrogen",
+            "aluminum",
+            inputs,
+            guesses=neighbour.unknowns,
+        )
+
+        # Expect
+        self.assertTrue(np.all(warm.status == SolverStatus.CONVERGED))
+        self.assertLess(warm["outlet.convergence.iterations"].sum(), cold["outlet.convergence.iterations"].sum())
+        np.testing.assert_allclose(warm["total_efficiency"], cold["total_efficiency"], rtol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
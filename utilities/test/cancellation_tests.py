@@ -0,0 +1,52 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import threading
+import attrs
+from ccpd.api import CreateInputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.cancellation import CancellationToken, CheckCancelled, DesignCancelled
+from ccpd.utilities.centrifugal_calcs import centrifugal_calcs
+
+
+class TestCancellation(unittest.TestCase):
+    def test_given_no_token_expect_nothing_raised(self):
+        # Call
+        CheckCancelled()
+
+    def test_given_cancelled_token_expect_check_raises_inside_context_only(self):
+        # Given
+        token = CancellationToken(poll_interval=0.0)
+        token.Cancel()
+
+        # Expect
+        with self.assertRaises(DesignCancelled):
+            with token:
+                CheckCancelled()
+        CheckCancelled()
+
+    def test_given_runaway_inlet_loop_expect_stopped_by_cancellation(self):
+        # Given
+        # A zero tolerance, which the settings reject, keeps the inlet loop
+        #   iterating until the design is cancelled
+        with attrs.validators.disabled():
+            settings = SolverSettings(inlet=LoopSettings(10**9, 0.0))
+        token = CancellationToken()
+        timer = threading.Timer(0.2, token.Cancel)
+        timer.start()
+
+        # Expect
+        with self.assertRaises(DesignCancelled):
+            with token:
+                centrifugal_calcs(
+                    3.8, 0.6, 0.85, "hydrogen", "aluminum", CreateInputsII(CreateDesignInputs()), settings
+                )
+        timer.cancel()
+
+
+if __name__ == "__main__":
+    unittest.main()
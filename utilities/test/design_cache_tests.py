@@ -0,0 +1,116 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import tempfile
+from ccpd.api import CreateInputsII
+from ccpd.data_types.inputs import DesignParametersII, InputsII
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.design_cache import DesignCache
+
+
+class CountingDesign:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, design_parameters: DesignParametersII, inputs: InputsII) -> float:
+        self.calls += 1
+        return design_parameters.specific_diameter * inputs.mass_flow_rate
+
+
+class TestDesignCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.design_parameters = DesignParametersII(3.8, 0.6, 0.85, "hydrogen", "aluminum")
+
+    def test_given_repeated_inputs_expect_single_computation(self):
+        # Given
+        cache = DesignCache()
+        compute = CountingDesign()
+
+        # Call
+        first = cache.GetOrCompute((self.design_parameters, CreateInputsII(CreateDesignInputs())), compute)
+        second = cache.GetOrCompute((self.design_parameters, CreateInputsII(CreateDesignInputs())), compute)
+
+        # Expect
+        self.assertEqual(first, second)
+        self.assertEqual(compute.calls, 1)
+        self.assertEqual(cache.statistics.hits, 1)
+        self.assertEqual(cache.statistics.misses, 1)
+        self.assertAlmostEqual(cache.statistics.hit_rate, 0.5)
+
+    def test_given_rejected_design_expect_not_stored(self):
+        # Given
+        cache = DesignCache()
+        compute = CountingDesign()
+
+        # Call
+        for _ in range(0, 2):
+            cache.GetOrCompute(
+                (self.design_parameters, CreateInputsII(CreateDesignInputs())), compute, keep=lambda design: False
+            )
+
+        # Expect
+        self.assertEqual(compute.calls, 2)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.statistics.misses, 2)
+
+    def test_given_more_designs_than_entries_expect_least_recently_used_evicted(self):
+        # Given
+        cache = DesignCache(max_entries=2)
+        compute = CountingDesign()
+        keys = [
+            (self.design_parameters, CreateInputsII(CreateDesignInputs(mass_flow_rate=mass_flow_rate)))
+            for mass_flow_rate in (1.0, 2.0, 3.0)
+        ]
+
+        # Call
+        cache.GetOrCompute(keys[0], compute)
+        cache.GetOrCompute(keys[1], compute)
+        cache.GetOrCompute(keys[0], compute)
+        cache.GetOrCompute(keys[2], compute)
+        cache.GetOrCompute(keys[0], compute)
+        cache.GetOrCompute(keys[1], compute)
+
+        # Expect
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(compute.calls, 4)
+        self.assertEqual(cache.statistics.evictions, 2)
+
+    def test_given_near_identical_inputs_expect_quantized_hit(self):
+        # Given
+        cache = DesignCache(significant_digits=6)
+        compute = CountingDesign()
+
+        # Call
+        first = cache.GetOrCompute(
+            (self.design_parameters, CreateInputsII(CreateDesignInputs(mass_flow_rate=1.5))), compute
+        )
+        second = cache.GetOrCompute(
+            (self.design_parameters, CreateInputsII(CreateDesignInputs(mass_flow_rate=1.5 + 1e-9))), compute
+        )
+
+        # Expect
+        self.assertEqual(compute.calls, 1)
+        self.assertEqual(first, second)
+
+    def test_given_directory_expect_designs_shared_between_caches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Given
+            compute = CountingDesign()
+            key = (self.design_parameters, CreateInputsII(CreateDesignInputs()))
+            DesignCache(directory=directory).GetOrCompute(key, compute)
+            cache = DesignCache(directory=directory)
+
+            # Call
+            design = cache.GetOrCompute(key, compute)
+
+            # Expect
+            self.assertEqual(design, 3.8 * 1.5)
+            self.assertEqual(compute.calls, 1)
+            self.assertEqual(cache.statistics.disk_hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import numpy as np
+from ccpd.utilities.fixed_point import ACCELERATION_METHODS, CreateAccelerator
+
+
+def Iterate(method: str, guess, lanes=Ellipsis, max_iterations: int = 500, tolerance: float = 1e-10) -> int:
+    """
+    Solves x = cos(x) + 1 and returns the number of iterations taken
+    """
+    accelerator = CreateAccelerator(method, np.shape(guess))
+    for iteration in range(1, max_iterations + 1):
+        image = np.cos(guess) + 1.0
+        if np.all(np.abs(image - guess) < tolerance):
+            return iteration
+        guess = accelerator(guess, image, lanes)
+    return max_iterations
+
+
+class TestFixedPoint(unittest.TestCase):
+    solution = 1.2834287417
+
+    def test_given_each_method_expect_same_fixed_point(self):
+        for method in ACCELERATION_METHODS:
+            # Given
+            accelerator = CreateAccelerator(method)
+            guess = 1.0
+
+            # Call
+            for _ in range(0, 500):
+                guess = accelerator(guess, np.cos(guess) + 1.0)
+
+            # Expect
+            self.assertIsInstance(guess, float)
+            self.assertAlmostEqual(guess, self.solution, delta=1e-8, msg=method)
+
+    def test_given_accelerated_methods_expect_fewer_iterations(self):
+        # Given
+        substitution = Iterate("none", 1.0)
+
+        # Call & Expect
+        for method in ("aitken", "anderson", "secant"):
+            self.assertLess(Iterate(method, 1.0), substitution / 5, msg=method)
+
+    def test_given_lanes_expect_same_result_as_scalar_loops(self):
+        # Given
+        guesses = np.array([0.5, 1.0, 2.0])
+        accelerator = CreateAccelerator("anderson", len(guesses))
+        scalar_accelerators = [CreateAccelerator("anderson") for _ in guesses]
+
+        # Call
+        batch = guesses.copy()
+        scalar = list(guesses)
+        for _ in range(0, 4):
+            lanes = np.array([0, 2])
+            batch[lanes] = accelerator(batch[lanes], np.cos(batch[lanes]) + 1.0, lanes)
+            for lane in lanes:
+                scalar[lane] = scalar_accelerators[lane](scalar[lane], np.cos(scalar[lane]) + 1.0)
+
+        # Expect
+        np.testing.assert_allclose(batch, scalar, rtol=1e-14)
+        self.assertEqual(batch[1], 1.0)
+
+    def test_given_non_positive_step_expect_substitution_step(self):
+        # Given
+        accelerator = CreateAccelerator("secant")
+        accelerator(1.0, 1.5)
+
+        # Call
+        guess = accelerator(2.0, 3.0)
+
+        # Expect
+        self.assertEqual(guess, 3.0)
+
+    def test_given_unknown_method_expect_assertion(self):
+        with self.assertRaises(AssertionError):
+            CreateAccelerator("broyden")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import copy
+import math
+import pickle
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.data_types.working_fluid import WorkingFluid
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.fluid_registry import FluidRegistry, LoadFluidDatabase, RegisterFluid
+
+HYDROGEN = {
+    "specific_heat": 14310.0,
+    "specific_ratio": 1.41,
+    "specific_gas_constant": 4120.0,
+    "kinematic_viscosity": 0.88e-5,
+}
+
+
+class TestFluidRegistry(unittest.TestCase):
+    def test_given_database_expect_one_fluid_object_with_derived_constants(self):
+        # Given
+        registry = FluidRegistry({"hydrogen": HYDROGEN})
+
+        # Call
+        fluid = registry["hydrogen"]
+
+        # Expect
+        self.assertIs(registry["hydrogen"], fluid)
+        self.assertEqual(registry.names, ["hydrogen"])
+        self.assertAlmostEqual(fluid.isentropic_exponent, 0.41 / 1.41)
+        self.assertAlmostEqual(fluid.inverse_isentropic_exponent, 1.41 / 0.41)
+        self.assertAlmostEqual(fluid.speed_of_sound_factor, math.sqrt(1.41 * 4120.0))
+
+    def test_given_registered_fluid_expect_design_by_name(self):
+        # Given
+        expected = preliminary_design(
+            CreateDesignInputs(fluid="hydrogen"), CreateInputsII(CreateDesignInputs(fluid="hydrogen")), SolverSettings()
+        )
+
+        # Call
+        fluid = RegisterFluid("registered_hydrogen", HYDROGEN)
+        design_inputs = CreateDesignInputs(fluid="registered_hydrogen")
+        design = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+
+        # Expect
+        self.assertIs(LoadWorkingFluid("registered_hydrogen"), fluid)
+        self.assertEqual(design.total_efficiency, expected.total_efficiency)
+
+    def test_given_registered_name_expect_error_unless_replaced(self):
+        # Given
+        registry = FluidRegistry({"hydrogen": HYDROGEN})
+
+        # Call
+        with self.assertRaises(AssertionError):
+            registry.Register("hydrogen", HYDROGEN)
+        replaced = registry.Register("hydrogen", dict(HYDROGEN, specific_heat=14000.0), replace=True)
+
+        # Expect
+        self.assertIs(registry["hydrogen"], replaced)
+        self.assertEqual(replaced.specific_heat, 14000.0)
+
+    def test_given_invalid_fluid_expect_error(self):
+        # Given
+        registry = FluidRegistry()
+
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            registry.Register("broken", dict(HYDROGEN, specific_ratio=1.0))
+        with self.assertRaises(KeyError):
+            registry["broken"]
+
+    def test_given_registered_fluid_expect_frozen_record(self):
+        # Given
+        own_fluid = WorkingFluid(HYDROGEN)
+        registry = FluidRegistry({"air": LoadFluidDatabase()["air"]})
+
+        # Call
+        fluid = registry.Register("hydrogen", own_fluid)
+        own_fluid.specific_heat = 14000.0
+        changed = copy.copy(registry["air"])
+        changed.specific_ratio = 1.3
+
+        # Expect
+        with self.assertRaises(AttributeError):
+            fluid.specific_heat = 0.0
+        with self.assertRaises(TypeError):
+            registry["air"].nasa_polynomials["coefficients"] = []
+        self.assertEqual(fluid.specific_heat, 14310.0)
+        self.assertEqual(registry["air"].specific_ratio, 1.4)
+        self.assertAlmostEqual(changed.isentropic_exponent, 0.3 / 1.3)
+        unpickled = pickle.loads(pickle.dumps(registry["air"]))
+        self.assertEqual(unpickled.nasa_polynomials, registry["air"].nasa_polynomials)
+        with self.assertRaises(AttributeError):
+            unpickled.specific_heat = 0.0
+
+    def test_given_array_properties_expect_registered_and_read_only(self):
+        # Given
+        registry = FluidRegistry()
+        specific_heat = np.array([14310.0, 14000.0])
+
+        # Call
+        fluid = registry.Register("hydrogen", dict(HYDROGEN, specific_heat=specific_heat))
+
+        # Expect
+        np.testing.assert_array_equal(fluid.specific_heat, specific_heat)
+        self.assertFalse(fluid.specific_heat.flags.writeable)
+        self.assertTrue(specific_heat.flags.writeable)
+        with self.assertRaises(AssertionError):
+            registry.Register("broken", dict(HYDROGEN, specific_heat=np.array([14310.0, 0.0])))
+
+    def test_given_compiled_database_expect_same_fluids_as_json(self):
+        # Given
+        expected = FluidRegistry.FromFile()
+
+        # Call
+        registry = FluidRegistry(LoadFluidDatabase())
+
+        # Expect
+        self.assertEqual(registry.names, expected.names)
+        for name in expected.names:
+            self.assertEqual(registry[name].specific_heat, expected[name].specific_heat)
+            self.assertEqual(registry[name].nasa_polynomials, expected[name].nasa_polynomials)
+            self.assertEqual(registry[name].critical_pressure, expected[name].critical_pressure)
+
+
+if __name__ == "__main__":
+    unittest.main()
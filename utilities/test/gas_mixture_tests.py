@@ -0,0 +1,134 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.fluid_registry import FluidRegistry, MixtureFluid
+from ccpd.utilities.gas_mixture import MixFluids
+from ccpd.utilities.real_gas import WithEquationOfState
+
+
+class TestGasMixture(unittest.TestCase):
+    def test_given_single_component_expect_component_properties(self):
+        # Given
+        hydrogen = LoadWorkingFluid("hydrogen")
+
+        # Call
+        mixture = MixtureFluid({"hydrogen": 1.0, "methane": 0.0})
+
+        # Expect
+        self.assertAlmostEqual(mixture.specific_heat, hydrogen.specific_heat)
+        self.assertAlmostEqual(mixture.specific_ratio, hydrogen.specific_ratio)
+        self.assertAlmostEqual(mixture.specific_gas_constant, hydrogen.specific_gas_constant)
+        self.assertAlmostEqual(mixture.kinematic_viscosity, hydrogen.kinematic_viscosity)
+        self.assertAlmostEqual(mixture.critical_temperature, hydrogen.critical_temperature)
+
+    def test_given_database_mixture_expect_mixing_rules(self):
+        # Given
+        hydrogen = LoadWorkingFluid("hydrogen")
+        methane = LoadWorkingFluid("methane")
+        molar_mass = (
+            0.8 * 8314.462618 / hydrogen.specific_gas_constant + 0.2 * 8314.462618 / methane.specific_gas_constant
+        )
+        hydrogen_mass_fraction = 0.8 * 8314.462618 / hydrogen.specific_gas_constant / molar_mass
+
+        # Call
+        mixture = LoadWorkingFluid("hydrogen_methane_20")
+
+        # Expect
+        self.assertAlmostEqual(mixture.specific_gas_constant, 8314.462618 / molar_mass)
+        self.assertAlmostEqual(
+            mixture.specific_heat,
+            hydrogen_mass_fraction * hydrogen.specific_heat + (1.0 - hydrogen_mass_fraction) * methane.specific_heat,
+        )
+        self.assertGreater(mixture.specific_ratio, methane.specific_ratio)
+        self.assertLess(mixture.specific_ratio, hydrogen.specific_ratio)
+        self.assertIs(MixtureFluid({"hydrogen": 0.8, "methane": 0.2}), MixtureFluid({"hydrogen": 0.8, "methane": 0.2}))
+
+    def test_given_mass_fractions_expect_same_mixture_as_mole_fractions(self):
+        # Given
+        mole = LoadWorkingFluid("wet_air")
+        air, water = LoadWorkingFluid("air"), LoadWorkingFluid("water_vapor")
+        water_mass = 0.02 * air.specific_gas_constant / water.specific_gas_constant
+        water_mass = water_mass / (0.98 + water_mass)
+
+        # Call
+        mass = MixFluids([air, water], [1.0 - water_mass, water_mass], basis="mass")
+
+        # Expect
+        for name in ("specific_heat", "specific_ratio", "specific_gas_constant", "kinematic_viscosity"):
+            self.assertAlmostEqual(getattr(mass, name), getattr(mole, name), delta=1e-9 * getattr(mole, name))
+
+    def test_given_array_composition_expect_one_mixture_per_entry(self):
+        # Given
+        fraction = np.array([0.6, 0.8, 1.0])
+
+        # Call
+        mixtures = MixtureFluid({"hydrogen": fraction, "methane": 1.0 - fraction})
+
+        # Expect
+        for lane, hydrogen in enumerate(fraction):
+            mixture = MixtureFluid({"hydrogen": hydrogen, "methane": 1.0 - hydrogen})
+            self.assertAlmostEqual(mixtures.specific_heat[lane], mixture.specific_heat)
+            self.assertAlmostEqual(mixtures.specific_ratio[lane], mixture.specific_ratio)
+            self.assertAlmostEqual(mixtures.kinematic_viscosity[lane], mixture.kinematic_viscosity)
+            self.assertAlmostEqual(mixtures[lane].critical_pressure, mixture.critical_pressure)
+
+    def test_given_composition_sweep_expect_batch_matches_scalar(self):
+        # Given
+        design_inputs = CreateDesignInputs(fluid="hydrogen_methane_20")
+        inputs = CreateInputsII(design_inputs)
+        fraction = np.array([0.7, 0.8, 0.9])
+        expected = [
+            preliminary_design(
+                design_inputs, inputs, SolverSettings(), working_fluid=MixtureFluid({"hydrogen": x, "methane": 1.0 - x})
+            ).total_efficiency
+            for x in fraction
+        ]
+
+        # Call
+        result = batch_preliminary_design(
+            [[3.4], [3.8]],
+            0.6,
+            0.85,
+            None,
+            "aluminum",
+            inputs,
+            working_fluid=MixtureFluid({"hydrogen": fraction, "methane": 1.0 - fraction}),
+        )
+
+        # Expect
+        self.assertEqual(len(result), 6)
+        np.testing.assert_allclose(result["total_efficiency"][3:], expected, rtol=1e-12)
+
+    def test_given_database_mixture_expect_converged_design(self):
+        # Given
+        design_inputs = CreateDesignInputs(fluid="hydrogen_methane_20")
+
+        # Call
+        design = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings(gas_model="tabulated"))
+
+        # Expect
+        self.assertTrue(design.converged)
+
+    def test_given_invalid_mixture_expect_error(self):
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            MixtureFluid({"hydrogen": 0.8, "methane": 0.1})
+        with self.assertRaises(AssertionError):
+            MixtureFluid({"hydrogen": 0.8, "propane": 0.2})
+        with self.assertRaises(AssertionError):
+            FluidRegistry({"blend": {"mole_fractions": {"hydrogen": 1.0}}})
+        with self.assertRaises(AssertionError):
+            WithEquationOfState(MixtureFluid({"hydrogen": [0.8, 0.9], "methane": [0.2, 0.1]}), "peng_robinson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import copy
+from attrs import evolve
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities.gas_properties import FluidAt, GetPropertyTable, NasaSpecificHeat, SutherlandViscosity
+
+
+class TestGasProperties(unittest.TestCase):
+    def test_given_constant_model_expect_same_fluid(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+
+        # Call & Expect
+        self.assertIs(FluidAt(fluid, np.array([300.0, 400.0]), "constant"), fluid)
+
+    def test_given_table_expect_polynomial_properties(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+        temperature = np.linspace(250.0, 2500.0, 1001)
+
+        # Call
+        tabulated = GetPropertyTable(fluid)(temperature)
+
+        # Expect
+        specific_heat = NasaSpecificHeat(fluid, temperature)
+        np.testing.assert_allclose(tabulated.specific_heat, specific_heat, rtol=1e-5)
+        np.testing.assert_allclose(
+            tabulated.specific_ratio, specific_heat / (specific_heat - fluid.specific_gas_constant), rtol=1e-5
+        )
+        np.testing.assert_allclose(tabulated.kinematic_viscosity, SutherlandViscosity(fluid, temperature), rtol=1e-5)
+        self.assertIs(GetPropertyTable(fluid), GetPropertyTable(fluid))
+
+    def test_given_copies_of_fluid_expect_one_table(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+        other = copy.copy(fluid)
+        changed = copy.copy(fluid)
+        changed.specific_gas_constant = 4000.0
+
+        # Call
+        table = GetPropertyTable(fluid)
+
+        # Expect
+        self.assertIs(GetPropertyTable(other), table)
+        self.assertIsNot(GetPropertyTable(changed), table)
+
+    def test_given_database_temperature_expect_database_properties(self):
+        # Given
+        fluid = LoadWorkingFluid("air")
+
+        # Call
+        tabulated = FluidAt(fluid, 300.0, "tabulated")
+
+        # Expect
+        self.assertAlmostEqual(tabulated.specific_heat, fluid.specific_heat, delta=5.0)
+        self.assertAlmostEqual(tabulated.specific_ratio, fluid.specific_ratio, delta=1e-2)
+        self.assertAlmostEqual(
+            FluidAt(fluid, fluid.viscosity_reference_temperature, "tabulated").kinematic_viscosity,
+            fluid.kinematic_viscosity,
+        )
+
+    def test_given_array_fluid_expect_lanes(self):
+        # Given
+        fluid = FluidAt(LoadWorkingFluid("hydrogen"), np.array([300.0, 350.0, 400.0]), "tabulated")
+
+        # Call
+        lanes = fluid[np.array([2, 0])]
+
+        # Expect
+        np.testing.assert_array_equal(lanes.specific_heat, fluid.specific_heat[[2, 0]])
+        np.testing.assert_array_equal(lanes.speed_of_sound_factor, fluid.speed_of_sound_factor[[2, 0]])
+        self.assertIs(LoadWorkingFluid("hydrogen")[np.array([0])], LoadWorkingFluid("hydrogen"))
+
+    def test_given_tabulated_model_expect_converged_design_close_to_constant(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+        inputs = CreateInputsII(design_inputs)
+        constant = preliminary_design(design_inputs, inputs, SolverSettings())
+
+        # Call
+        tabulated = preliminary_design(design_inputs, inputs, SolverSettings(gas_model="tabulated"))
+
+        # Expect
+        self.assertTrue(tabulated.converged)
+        self.assertNotEqual(tabulated.total_efficiency, constant.total_efficiency)
+        self.assertAlmostEqual(tabulated.total_efficiency, constant.total_efficiency, delta=1e-2)
+
+    def test_given_tabulated_model_expect_batch_matches_scalar(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+        inputs = CreateInputsII(design_inputs)
+        settings = SolverSettings(gas_model="tabulated")
+        expected = [
+            preliminary_design(
+                evolve(design_inputs, specific_diameter=specific_diameter), inputs, settings
+            ).total_efficiency
+            for specific_diameter in (3.4, 3.8)
+        ]
+
+        # Call
+        result = batch_preliminary_design([3.4, 3.8], 0.6, 0.85, "hydrogen", "aluminum", inputs, settings)
+
+        # Expect
+        np.testing.assert_allclose(result["total_efficiency"], expected, rtol=1e-12)
+
+    def test_given_tabulated_model_expect_newton_converges(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+        inputs = CreateInputsII(design_inputs)
+        nested = preliminary_design(design_inputs, inputs, SolverSettings(gas_model="tabulated"))
+
+        # Call
+        newton = preliminary_design(design_inputs, inputs, SolverSettings(solver="newton", gas_model="tabulated"))
+
+        # Expect
+        self.assertTrue(newton.converged)
+        self.assertAlmostEqual(newton.total_efficiency, nested.total_efficiency, delta=1e-5)
+
+    def test_given_unknown_model_expect_error(self):
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            SolverSettings(gas_model="real")
+
+
+if __name__ == "__main__":
+    unittest.main()
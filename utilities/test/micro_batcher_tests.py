@@ -0,0 +1,71 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import attrs
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.main import CreateInputsII, preliminary_design
+from ccpd.utilities.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_given_concurrent_requests_expect_one_batch_with_same_designs_as_main(self):
+        # Given
+        requests = [CreateDesignInputs(value) for value in (3.6, 3.8, 4.0)]
+
+        # Call
+        with MicroBatcher(SolverSettings(), window=0.5) as batcher:
+            futures = [batcher.Submit(design_inputs) for design_inputs in requests]
+            designs = [future.result() for future in futures]
+
+        # Expect
+        self.assertEqual(batcher.statistics.batches, 1)
+        for design_inputs, design in zip(requests, designs):
+            expected = preliminary_design(design_inputs, CreateInputsII(design_inputs), SolverSettings())
+            self.assertEqual(design.status, SolverStatus.CONVERGED)
+            self.assertAlmostEqual(design.total_efficiency, expected.total_efficiency, delta=1e-4)
+
+    def test_given_identical_requests_expect_shared_computation(self):
+        # Given
+        design_inputs = CreateDesignInputs()
+
+        # Call
+        with MicroBatcher(SolverSettings(), window=0.5) as batcher:
+            first = batcher.Submit(design_inputs)
+            second = batcher.Submit(attrs.evolve(design_inputs))
+            third = batcher.Submit(CreateDesignInputs(4.0))
+
+        # Expect
+        self.assertIs(first, second)
+        self.assertIs(first.result(), second.result())
+        self.assertEqual(batcher.statistics.requests, 3)
+        self.assertEqual(batcher.statistics.coalesced, 1)
+        self.assertEqual(batcher.statistics.designs, 2)
+
+    def test_given_max_batch_size_expect_batches_split(self):
+        # Call
+        with MicroBatcher(SolverSettings(), window=0.5, max_batch_size=2) as batcher:
+            futures = [batcher.Submit(CreateDesignInputs(3.5 + 0.1 * index)) for index in range(5)]
+
+        # Expect
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(batcher.statistics.batches, 3)
+
+    def test_given_unknown_fluid_expect_error_in_future(self):
+        # Given
+        design_inputs = attrs.evolve(CreateDesignInputs(), fluid="unobtanium")
+
+        # Call
+        with MicroBatcher(SolverSettings(), window=0.0) as batcher:
+            future = batcher.Submit(design_inputs)
+
+        # Expect
+        self.assertIsInstance(future.exception(), KeyError)
+
+
+if __name__ == "__main__":
+    unittest.main()
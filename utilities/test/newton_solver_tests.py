@@ -0,0 +1,92 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import numpy as np
+from ccpd.api import CreateInputsII
+from ccpd.data_types.centrifugal_compressor import CentrifugalCompressor
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+from ccpd.utilities.newton_solver import batch_newton_design, newton_design
+
+
+class TestNewtonSolver(unittest.TestCase):
+    tolerance = 1e-6
+
+    def test_given_design_points_expect_same_results_as_nested_loops(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        specific_diameter = np.array([3.8, 3.5, 4.2])
+        specific_speed = np.array([0.6, 0.65, 0.55])
+        tight_loops = SolverSettings(
+            main=LoopSettings(200, 1e-12),
+            inlet=LoopSettings(1000, 1e-12),
+            outlet=LoopSettings(1000, 1e-12),
+            vaneless_diffuser=LoopSettings(1000, 1e-12),
+        )
+
+        # Call
+        nested = batch_preliminary_design(
+            specific_diameter, specific_speed, 0.85, "hydrogen", "aluminum", inputs, tight_loops
+        )
+        result = batch_newton_design(specific_diameter, specific_speed, 0.85, "hydrogen", "aluminum", inputs)
+
+        # Expect
+        self.assertTrue(np.all(result.status == SolverStatus.CONVERGED))
+        self.assertTrue(np.all(result["convergence.residual"] < 1e-8))
+        for path, column in nested.columns.items():
+            if "convergence" in path:
+                continue
+            np.testing.assert_allclose(result[path], column, rtol=self.tolerance, atol=self.tolerance, err_msg=path)
+
+    def test_given_too_few_iterations_expect_max_iterations_status(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+
+        # Call
+        result = batch_newton_design(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, max_iterations=1)
+
+        # Expect
+        self.assertEqual(result.status[0], SolverStatus.MAX_ITERATIONS)
+        self.assertEqual(result["convergence.iterations"][0], 1)
+
+    def test_given_scalar_design_expect_converged_compressor(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+
+        # Call
+        design = newton_design(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs)
+
+        # Expect
+        self.assertIsInstance(design, CentrifugalCompressor)
+        self.assertTrue(design.converged)
+        self.assertLess(design.convergence.residual, 1e-8)
+        self.assertEqual(design.inlet.convergence.status, SolverStatus.CONVERGED)
+
+    def test_given_friction_method_expect_same_result_as_nested_loops(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        tight_loops = SolverSettings(
+            main=LoopSettings(200, 1e-12),
+            inlet=LoopSettings(1000, 1e-12),
+            outlet=LoopSettings(1000, 1e-12),
+            vaneless_diffuser=LoopSettings(1000, 1e-12),
+            friction_method="haaland",
+        )
+
+        # Call
+        default = batch_newton_design(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs)
+        haaland = batch_newton_design(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, friction_method="haaland")
+        nested = batch_preliminary_design(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, tight_loops)
+
+        # Expect
+        self.assertNotAlmostEqual(haaland["total_efficiency"][0], default["total_efficiency"][0], places=6)
+        np.testing.assert_allclose(haaland["total_efficiency"], nested["total_efficiency"], rtol=self.tolerance)
+
+
+if __name__ == "__main__":
+    unittest.main()
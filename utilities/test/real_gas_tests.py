@@ -0,0 +1,202 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import copy
+import os
+import tempfile
+import unittest
+from unittest import mock
+from attrs import evolve
+import numpy as np
+from ccpd.api import CreateInputsII, preliminary_design
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.batch_centrifugal_calcs import batch_preliminary_design
+from ccpd.utilities.centrifugal_calcs import LoadWorkingFluid
+from ccpd.utilities import real_gas
+from ccpd.utilities.real_gas import LoadRealGasTable, PengRobinsonProperties, RealGasTable, WithEquationOfState
+
+
+class TestRealGas(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_given_ideal_equation_of_state_expect_same_fluid(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+
+        # Call & Expect
+        self.assertIs(WithEquationOfState(fluid, "ideal"), fluid)
+        self.assertIs(WithEquationOfState(fluid, "peng_robinson"), WithEquationOfState(fluid, "peng_robinson"))
+        self.assertIs(
+            WithEquationOfState(copy.copy(fluid), "peng_robinson"), WithEquationOfState(fluid, "peng_robinson")
+        )
+
+    def test_given_table_expect_peng_robinson_properties(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+        pressure = np.geomspace(1e5, 2e7, 101)
+        temperature = np.linspace(250.0, 600.0, 101)
+
+        # Call
+        table = LoadRealGasTable(fluid, self.directory.name)
+
+        # Expect
+        compressibility, speed_of_sound_ratio, enthalpy_departure = PengRobinsonProperties(fluid, pressure, temperature)
+        np.testing.assert_allclose(table.Compressibility(pressure, temperature), compressibility, rtol=1e-4)
+        np.testing.assert_allclose(table.SpeedOfSoundRatio(pressure, temperature), speed_of_sound_ratio, rtol=1e-4)
+        np.testing.assert_allclose(
+            table.EnthalpyDeparture(pressure, temperature), enthalpy_departure, rtol=1e-3, atol=10.0
+        )
+        self.assertAlmostEqual(table.Compressibility(pressure[50], temperature[50]), compressibility[50], delta=1e-4)
+
+    def test_given_low_pressure_expect_ideal_gas(self):
+        # Given
+        fluid = LoadWorkingFluid("air")
+
+        # Call
+        compressibility, speed_of_sound_ratio, enthalpy_departure = PengRobinsonProperties(fluid, 1e3, 300.0)
+
+        # Expect
+        self.assertAlmostEqual(float(compressibility), 1.0, delta=1e-4)
+        self.assertAlmostEqual(float(speed_of_sound_ratio), 1.0, delta=1e-4)
+        self.assertLess(abs(float(enthalpy_departure)), 1e-4 * fluid.specific_heat * 300.0)
+
+    def test_given_diverged_points_expect_nan(self):
+        # Given
+        table = LoadRealGasTable(LoadWorkingFluid("hydrogen"), self.directory.name)
+
+        # Call & Expect
+        self.assertTrue(np.isnan(table.Compressibility(np.nan, 300.0)))
+        self.assertTrue(np.all(np.isnan(table.Compressibility(np.array([np.nan, 1e6]), np.array([300.0, np.nan])))))
+
+    def test_given_second_load_expect_same_file(self):
+        # Given
+        fluid = LoadWorkingFluid("hydrogen")
+        first = LoadRealGasTable(fluid, self.directory.name)
+        (file_name,) = os.listdir(self.directory.name)
+        modified = os.path.getmtime(os.path.join(self.directory.name, file_name))
+
+        # Call
+        second = LoadRealGasTable(fluid, self.directory.name)
+
+        # Expect
+        self.assertEqual(os.listdir(self.directory.name), [file_name])
+        self.assertEqual(os.path.getmtime(os.path.join(self.directory.name, file_name)), modified)
+        np.testing.assert_array_equal(second.compressibility, first.compressibility)
+
+    def test_given_table_directory_expect_table_written_there(self):
+        # Given
+        fluid = LoadWorkingFluid("air")
+
+        # Call
+        with mock.patch.object(real_gas, "TABLE_DIRECTORY", self.directory.name):
+            table = LoadRealGasTable(fluid)
+
+        # Expect
+        (file_name,) = os.listdir(self.directory.name)
+        self.assertTrue(file_name.startswith("peng_robinson_"))
+        np.testing.assert_array_equal(
+            RealGasTable.FromFile(os.path.join(self.directory.name, file_name)).compressibility, table.compressibility
+        )
+
+    def test_given_no_table_directory_expect_user_cache_directory(self):
+        # Given
+        fluid = LoadWorkingFluid("air")
+
+        # Call
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory.name}):
+            LoadRealGasTable(fluid)
+
+        # Expect
+        directory = os.path.join(self.directory.name, "ccpd", "real_gas_tables")
+        self.assertEqual(len(os.listdir(directory)), 1)
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+
+    def test_given_directory_writable_by_others_expect_error(self):
+        # Given
+        os.chmod(self.directory.name, 0o777)
+
+        # Expect
+        with self.assertRaises(AssertionError):
+            LoadRealGasTable(LoadWorkingFluid("air"), self.directory.name)
+
+    def test_given_high_pressure_expect_real_gas_design(self):
+        # Given
+        design_inputs = CreateDesignInputs(mass_flow_rate=300.0, inlet_total_pressure=20000000.0)
+        inputs = CreateInputsII(design_inputs)
+        ideal = preliminary_design(design_inputs, inputs, SolverSettings())
+
+        # Call
+        real_gas = preliminary_design(design_inputs, inputs, SolverSettings(equation_of_state="peng_robinson"))
+
+        # Expect
+        self.assertTrue(real_gas.converged)
+        self.assertLess(real_gas.inlet.thermodynamic_point.density.total, ideal.inlet.thermodynamic_point.density.total)
+        self.assertNotEqual(real_gas.total_efficiency, ideal.total_efficiency)
+
+    def test_given_real_gas_expect_real_gas_outlet_mach_number(self):
+        # Given
+        design_inputs = CreateDesignInputs(mass_flow_rate=300.0, inlet_total_pressure=20000000.0)
+        fluid = WithEquationOfState(LoadWorkingFluid("hydrogen"), "peng_robinson")
+
+        # Call
+        result = preliminary_design(
+            design_inputs, CreateInputsII(design_inputs), SolverSettings(equation_of_state="peng_robinson")
+        )
+
+        # Expect
+        outlet = result.outlet
+        speed_of_sound = fluid.SpeedOfSound(
+            outlet.thermodynamic_point.temperature.static, outlet.thermodynamic_point.pressure.static
+        )
+        self.assertAlmostEqual(
+            outlet.blade.mid_mach_number.absolute, outlet.blade.mid.absolute.magnitude / speed_of_sound, delta=1e-12
+        )
+
+    def test_given_real_gas_expect_batch_matches_scalar(self):
+        # Given
+        design_inputs = CreateDesignInputs(mass_flow_rate=300.0, inlet_total_pressure=20000000.0)
+        inputs = CreateInputsII(design_inputs)
+        settings = SolverSettings(equation_of_state="peng_robinson")
+        expected = [
+            preliminary_design(
+                evolve(design_inputs, specific_diameter=specific_diameter), inputs, settings
+            ).total_efficiency
+            for specific_diameter in (3.4, 3.8)
+        ]
+
+        # Call
+        result = batch_preliminary_design([3.4, 3.8], 0.6, 0.85, "hydrogen", "aluminum", inputs, settings)
+
+        # Expect
+        np.testing.assert_allclose(result["total_efficiency"], expected, rtol=1e-12)
+
+    def test_given_real_gas_expect_newton_converges(self):
+        # Given
+        design_inputs = CreateDesignInputs(mass_flow_rate=300.0, inlet_total_pressure=20000000.0)
+        inputs = CreateInputsII(design_inputs)
+        nested = preliminary_design(design_inputs, inputs, SolverSettings(equation_of_state="peng_robinson"))
+
+        # Call
+        newton = preliminary_design(
+            design_inputs, inputs, SolverSettings(solver="newton", equation_of_state="peng_robinson")
+        )
+
+        # Expect
+        self.assertTrue(newton.converged)
+        self.assertAlmostEqual(newton.total_efficiency, nested.total_efficiency, delta=1e-5)
+
+    def test_given_unknown_equation_of_state_expect_error(self):
+        # Call & Expect
+        with self.assertRaises(AssertionError):
+            SolverSettings(equation_of_state="van_der_waals")
+
+
+if __name__ == "__main__":
+    unittest.main()
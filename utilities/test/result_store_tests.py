@@ -0,0 +1,110 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+import multiprocessing
+import os
+import tempfile
+import numpy as np
+from ccpd.data_types.compressor_batch import COMPRESSOR_FIELDS
+from ccpd.utilities.batch_centrifugal_calcs import BatchResults
+from ccpd.utilities.result_store import ResultStore, ResultWriter
+
+
+def CreateResults(start: int, stop: int) -> BatchResults:
+    rows = np.arange(start, stop, dtype=float)
+    return BatchResults(
+        columns={path: rows + index for index, path in enumerate(COMPRESSOR_FIELDS)},
+        status=(rows % 3).astype(np.int8),
+    )
+
+
+def SumColumn(directory: str, name: str) -> float:
+    return float(ResultStore(directory)[name].sum())
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = os.path.join(tempfile.mkdtemp(), "store")
+        return super().setUp()
+
+    def test_given_appended_chunks_expect_rows_in_order(self):
+        # Given
+        with ResultWriter(self.directory, columns={"point": np.int64}, metadata={"fluid": "air"}) as writer:
+            # Call
+            for start, stop in [(0, 4), (4, 9), (9, 10)]:
+                writer.Append(CreateResults(start, stop), {"point": np.arange(start, stop)})
+        store = ResultStore(self.directory)
+
+        # Expect
+        expected = CreateResults(0, 10)
+        self.assertEqual(len(store), 10)
+        self.assertEqual(store.metadata, {"fluid": "air"})
+        np.testing.assert_array_equal(store["point"], np.arange(10))
+        np.testing.assert_array_equal(store["status"], expected.status)
+        for path in COMPRESSOR_FIELDS:
+            np.testing.assert_array_equal(store[path], expected.columns[path], err_msg=path)
+
+    def test_given_row_range_expect_views_of_memory_map(self):
+        # Given
+        with ResultWriter(self.directory) as writer:
+            writer.Append(CreateResults(0, 100))
+        store = ResultStore(self.directory)
+
+        # Call
+        rows = store.Rows(20, 30)
+
+        # Expect
+        self.assertEqual(len(rows), 10)
+        self.assertIsInstance(store["total_efficiency"], np.memmap)
+        self.assertFalse(store["total_efficiency"].flags.writeable)
+        self.assertTrue(np.shares_memory(rows["total_efficiency"], store["total_efficiency"]))
+        np.testing.assert_array_equal(rows["total_efficiency"], CreateResults(20, 30)["total_efficiency"])
+
+    def test_given_store_being_written_expect_rows_appended_so_far(self):
+        # Given
+        writer = ResultWriter(self.directory)
+        writer.Append(CreateResults(0, 5))
+
+        # Call
+        partial = ResultStore(self.directory)
+        writer.Append(CreateResults(5, 8))
+        writer.Close()
+
+        # Expect
+        self.assertEqual(len(partial), 5)
+        self.assertEqual(len(ResultStore(self.directory)), 8)
+        np.testing.assert_array_equal(partial.Rows().status, CreateResults(0, 5).status)
+
+    def test_given_empty_store_expect_empty_columns(self):
+        # Call
+        ResultWriter(self.directory).Close()
+
+        # Expect
+        self.assertEqual(len(ResultStore(self.directory).Rows()), 0)
+
+    def test_given_other_process_expect_same_columns(self):
+        # Given
+        with ResultWriter(self.directory) as writer:
+            writer.Append(CreateResults(0, 50))
+
+        # Call
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            total = pool.apply(SumColumn, (self.directory, "total_efficiency"))
+
+        # Expect
+        self.assertEqual(total, float(ResultStore(self.directory)["total_efficiency"].sum()))
+
+    def test_given_existing_store_expect_error(self):
+        # Given
+        ResultWriter(self.directory).Close()
+
+        # Expect
+        with self.assertRaises(AssertionError):
+            ResultWriter(self.directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
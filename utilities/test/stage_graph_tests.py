@@ -0,0 +1,113 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from ccpd.api import CreateInputsII
+from ccpd.data_types.solver_settings import LoopSettings, SolverSettings
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.utilities.centrifugal_calcs import CreateStageGraph, centrifugal_calcs
+from ccpd.utilities.stage_graph import Stage, StageGraph
+
+
+def CreateCountingGraph(calls: list) -> StageGraph:
+    def Square(x):
+        calls.append("square")
+        return x**2
+
+    def Add(y, square):
+        calls.append("add")
+        return square + y
+
+    return StageGraph([Stage("square", Square, ("x",)), Stage("add", Add, ("y",), ("square",))])
+
+
+class TestStageGraph(unittest.TestCase):
+    def test_given_same_parameters_expect_cached_outputs(self):
+        # Given
+        calls = []
+        graph = CreateCountingGraph(calls)
+
+        # Call
+        first = graph.Run(x=3.0, y=1.0)
+        second = graph.Run(x=3.0, y=1.0)
+
+        # Expect
+        self.assertEqual(first, second)
+        self.assertEqual(calls, ["square", "add"])
+        self.assertEqual(graph.hits, {"square": 1, "add": 1})
+
+    def test_given_changed_downstream_parameter_expect_only_downstream_rerun(self):
+        # Given
+        calls = []
+        graph = CreateCountingGraph(calls)
+
+        # Call
+        graph.Run(x=3.0, y=1.0)
+        outputs = graph.Run(x=3.0, y=2.0)
+
+        # Expect
+        self.assertEqual(outputs["add"], 11.0)
+        self.assertEqual(calls, ["square", "add", "add"])
+
+    def test_given_changed_upstream_parameter_expect_dependents_rerun(self):
+        # Given
+        calls = []
+        graph = CreateCountingGraph(calls)
+
+        # Call
+        graph.Run(x=3.0, y=1.0)
+        outputs = graph.Run(x=4.0, y=1.0)
+
+        # Expect
+        self.assertEqual(outputs["add"], 17.0)
+        self.assertEqual(calls, ["square", "add", "square", "add"])
+
+    def test_given_stage_before_its_dependency_expect_error(self):
+        # Expect
+        with self.assertRaises(AssertionError):
+            StageGraph([Stage("add", lambda square: square, (), ("square",)), Stage("square", lambda: 0.0)])
+
+
+class TestCentrifugalCalcsStageGraph(unittest.TestCase):
+    def test_given_new_efficiency_guess_expect_inlet_reused_and_same_design(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        graph = CreateStageGraph()
+
+        # Call
+        centrifugal_calcs(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, stage_graph=graph)
+        reused = centrifugal_calcs(3.8, 0.6, 0.9, "hydrogen", "aluminum", inputs, stage_graph=graph)
+        fresh = centrifugal_calcs(3.8, 0.6, 0.9, "hydrogen", "aluminum", inputs)
+
+        # Expect
+        self.assertEqual(graph.misses["inlet"], 1)
+        self.assertEqual(graph.hits["inlet"], 1)
+        self.assertEqual(graph.misses["diffuser"], 2)
+        self.assertEqual(reused.total_efficiency, fresh.total_efficiency)
+        self.assertEqual(reused.geometry, fresh.geometry)
+
+    def test_given_rerun_after_upstream_cache_hit_expect_same_design_as_fresh_graph(self):
+        # Given
+        inputs = CreateInputsII(CreateDesignInputs())
+        graph = CreateStageGraph()
+        loose_outlet = SolverSettings(outlet=LoopSettings(50, 1e-1))
+        first = centrifugal_calcs(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, stage_graph=graph)
+        outlet_temperature = first.outlet.thermodynamic_point.temperature.total
+
+        # Call
+        reused = centrifugal_calcs(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, loose_outlet, stage_graph=graph)
+        fresh = centrifugal_calcs(3.8, 0.6, 0.85, "hydrogen", "aluminum", inputs, loose_outlet)
+
+        # Expect
+        self.assertEqual(graph.hits["outlet_setup"], 1)
+        self.assertEqual(graph.misses["outlet_loop"], 2)
+        self.assertEqual(first.outlet.thermodynamic_point.temperature.total, outlet_temperature)
+        self.assertEqual(reused.total_efficiency, fresh.total_efficiency)
+        self.assertEqual(reused.outlet.convergence, fresh.outlet.convergence)
+        self.assertEqual(reused.geometry, fresh.geometry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Author: Alejandro Valencia
+Update: October 17, 2026
+"""
+
+import unittest
+from ccpd.api import CreateInputsII
+from ccpd.data_types.inputs import DesignParametersII
+from ccpd.data_types.solver_settings import SolverSettings
+from ccpd.data_types.solver_status import SolverStatus
+from ccpd.data_types.test_utils import CreateDesignInputs
+from ccpd.main import preliminary_design
+from ccpd.utilities.time_budget import OutOfTime, RemainingTime, TimeBudget
+
+
+class TestTimeBudget(unittest.TestCase):
+    def test_given_no_budget_expect_infinite_time(self):
+        # Expect
+        self.assertEqual(RemainingTime(), float("inf"))
+        self.assertFalse(OutOfTime())
+
+    def test_given_nested_budget_expect_outer_deadline_kept(self):
+        # Call
+        with TimeBudget(0.0):
+            with TimeBudget(60.0):
+                # Expect
+                self.assertTrue(OutOfTime())
+            self.assertTrue(OutOfTime())
+        self.assertFalse(OutOfTime())
+
+
+class TestBudgetedPreliminaryDesign(unittest.TestCase):
+    def setUp(self) -> None:
+        self.design_parameters = DesignParametersII(3.8, 0.6, 0.85, "hydrogen", "aluminum")
+        return super().setUp()
+
+    def test_given_spent_budget_expect_approximate_design_with_residuals(self):
+        # Call
+        design = preliminary_design(
+            self.design_parameters, CreateInputsII(CreateDesignInputs()), SolverSettings(), budget=0.0
+        )
+
+        # Expect
+        self.assertTrue(design.approximate)
+        self.assertEqual(design.convergence.iterations, 1)
+        self.assertEqual(design.convergence.status, SolverStatus.MAX_ITERATIONS)
+        self.assertGreater(design.convergence.residual, SolverSettings().main.tolerance)
+
+    def test_given_ample_budget_expect_same_design_as_without_budget(self):
+        # Call
+        expected = preliminary_design(self.design_parameters, CreateInputsII(CreateDesignInputs()), SolverSettings())
+        design = preliminary_design(
+            self.design_parameters, CreateInputsII(CreateDesignInputs()), SolverSettings(), budget=60.0
+        )
+
+        # Expect
+        self.assertFalse(design.approximate)
+        self.assertTrue(design.converged)
+        self.assertEqual(design.total_efficiency, expected.total_efficiency)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Author: Alejandro Valencia
+Centrifugal Compressor Preliminary Design
+Time Budget
+Update: October 17, 2026
+
+Wall clock budget of a design. A budget is made current with
+
+    with TimeBudget(0.005):
+        design = preliminary_design(...)
+
+and the solver loops read it through OutOfTime and RemainingTime. Once the
+budget is spent every loop stops after its current iteration and reports
+itself as approximate, see ConvergenceReport, so the design that comes
+back is the best one reached so far. Nested budgets never extend the
+budget around them.
+
+Without a current budget the loops run as usual.
+"""
+
+import contextvars
+import time
+
+_current_deadline = contextvars.ContextVar("deadline", default=None)
+
+
+class TimeBudget:
+    def __init__(self, seconds: float) -> None:
+        assert seconds >= 0.0, f"[Error]: The time budget can not be negative"
+        self.seconds = seconds
+        self.deadline = None
+        self._reset_tokens = []
+
+    def __enter__(self) -> "TimeBudget":
+        deadline = time.perf_counter() + self.seconds
+        outer_deadline = _current_deadline.get()
+        self.deadline = deadline if outer_deadline is None else min(deadline, outer_deadline)
+        self._reset_tokens.append(_current_deadline.set(self.deadline))
+        return self
+
+    def __exit__(self, *exception) -> None:
+        _current_deadline.reset(self._reset_tokens.pop())
+
+
+def RemainingTime() -> float:
+    """
+    Seconds left in the current budget, infinite without a budget
+    """
+    deadline = _current_deadline.get()
+    return float("inf") if deadline is None else deadline - time.perf_counter()
+
+
+def OutOfTime() -> bool:
+    return RemainingTime() <= 0.0